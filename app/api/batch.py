@@ -0,0 +1,180 @@
+import json
+from typing import AsyncIterator, Dict, List, Tuple, Union
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+
+from app.api.schemas import BatchItem, analysis_response
+from app.core.config import settings
+from app.core.executor import AnalysisBusy, analysis_executor
+from app.core.metrics import time_stage
+from app.core.ruleset import rule_store
+from app.core.serialization import dumps
+from app.incident.models import Incident
+from app.incident.service import create_incidents
+from app.triage.triage_engine import encode_symptoms, triage_batch
+
+router = APIRouter()
+
+NDJSON_TYPES = ("application/x-ndjson", "application/jsonl")
+
+# Longest accepted NDJSON line; longer lines are skipped with an error
+MAX_LINE_BYTES = 1 << 20
+
+# An item's create_incident arguments, or why it was rejected
+Parsed = Tuple[int, Union[Dict, str]]
+
+
+class _NDJSONResponse(StreamingResponse):
+    # StreamingResponse normally also waits on receive() for a client
+    # disconnect, which would take body chunks the item parser is still
+    # reading. Results are written while the upload is read, so only stream.
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+
+
+def _item(value) -> Union[Dict, str]:
+    if isinstance(value, str):
+        value = {"text": value}
+    if not isinstance(value, dict):
+        return "expected a transcript string or an object with text, lat and lon"
+
+    try:
+        item = BatchItem.model_validate(value)
+    except ValidationError as e:
+        return "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+
+    text = item.text.strip()
+    if not text:
+        return "text cannot be empty"
+    if (item.lat is None) != (item.lon is None):
+        return "lat and lon must be given together"
+    return {"input_text": text, "lat": item.lat, "lon": item.lon}
+
+
+async def _ndjson_lines(request: Request) -> AsyncIterator[Union[bytes, None]]:
+    # Lines of the upload as they arrive; None for a line over MAX_LINE_BYTES
+    buffer = b""
+    overlong = False
+    async for chunk in request.stream():
+        lines = (buffer + chunk).split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            yield None if overlong or len(line) > MAX_LINE_BYTES else line
+            overlong = False
+        # Drop an unfinished line as soon as it is too long to keep
+        if len(buffer) > MAX_LINE_BYTES:
+            overlong, buffer = True, b""
+    if buffer or overlong:
+        yield None if overlong or len(buffer) > MAX_LINE_BYTES else buffer
+
+
+async def _ndjson_items(request: Request) -> AsyncIterator[Parsed]:
+    index = 0
+    async for line in _ndjson_lines(request):
+        if line is None:
+            yield index, f"line longer than {MAX_LINE_BYTES} bytes"
+        elif not line.strip():
+            continue
+        else:
+            try:
+                yield index, _item(json.loads(line))
+            except ValueError:
+                yield index, "invalid JSON"
+        index += 1
+
+
+async def _array_items(values: List) -> AsyncIterator[Parsed]:
+    for index, value in enumerate(values):
+        yield index, _item(value)
+
+
+def _error(index: int, message: str) -> bytes:
+    return dumps({"index": index, "error": message}) + b"\n"
+
+
+def analyze_records(records: List[Dict], hold: bool = False, channel: str = "batch") -> List[Incident]:
+    """
+    The batch path: analyzes, triages and creates an incident for each
+    record ({input_text, lat, lon}), in order. Raises AnalysisBusy.
+    """
+    ruleset = rule_store.current()
+    with time_stage("analysis_batch"):
+        symptoms = analysis_executor.symptoms_batch([record["input_text"] for record in records], ruleset)
+
+    with time_stage("triage_batch"):
+        results = triage_batch(encode_symptoms(symptoms, ruleset), ruleset)
+
+    return create_incidents(
+        [
+            dict(record, symptoms=item_symptoms, triage_result=result)
+            for record, item_symptoms, result in zip(records, symptoms, results)
+        ],
+        channel=channel,
+        hold_resources=hold
+    )
+
+
+def _process(batch: List[Tuple[int, Dict]], hold: bool) -> bytes:
+    try:
+        incidents = analyze_records([record for _, record in batch], hold)
+    except AnalysisBusy:
+        return b"".join(_error(index, "analysis capacity exhausted, retry later") for index, _ in batch)
+
+    return b"".join(
+        dumps({"index": index, **analysis_response(incident)}) + b"\n"
+        for (index, _), incident in zip(batch, incidents)
+    )
+
+
+async def _results(items: AsyncIterator[Parsed], hold: bool) -> AsyncIterator[bytes]:
+    batch = []
+    async for index, record in items:
+        if isinstance(record, str):
+            yield _error(index, record)
+            continue
+
+        batch.append((index, record))
+        if len(batch) >= settings.NLP_BATCH_SIZE:
+            yield await run_in_threadpool(_process, batch, hold)
+            batch = []
+
+    if batch:
+        yield await run_in_threadpool(_process, batch, hold)
+
+
+@router.post("/analyze/batch")
+async def analyze_batch(request: Request, hold: bool = False):
+    """
+    Bulk /analyze. The body is a JSON array, or NDJSON (Content-Type
+    application/x-ndjson) with one item per line; an item is a transcript
+    string or {"text", "lat", "lon"}.
+
+    Items are analyzed NLP_BATCH_SIZE at a time and results stream back as
+    NDJSON: {"index", ...AnalyzeResponse fields} or {"index", "error"} per
+    item. Lines come out per batch, so an item's error may precede results
+    of earlier items. NDJSON uploads are read as they arrive, so memory
+    stays flat however large the upload is.
+
+    Batches are usually backfill, so dispatch recommendations hold no live
+    beds or ambulances unless ?hold=true.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type in NDJSON_TYPES:
+        items = _ndjson_items(request)
+    else:
+        try:
+            values = json.loads(await request.body())
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+        if not isinstance(values, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+        items = _array_items(values)
+
+    return _NDJSONResponse(_results(items, hold), media_type="application/x-ndjson")
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException
+
+from app.dispatch.fleet import UnitStatus, fleet
+
+router = APIRouter()
+
+
+@router.get("/fleet")
+def fleet_stats():
+    """
+    Unit counts by type and status.
+    """
+    return fleet.stats()
+
+
+@router.get("/fleet/units")
+def fleet_units():
+    return fleet.units()
+
+
+@router.post("/fleet/units/{unit_id}/status")
+def update_unit_status(unit_id: str, status: UnitStatus):
+    """
+    Crew status updates: EN_ROUTE -> ON_SCENE -> TRANSPORTING. Units are
+    freed by completing, denying or overriding their incident.
+    """
+    try:
+        return fleet.update_status(unit_id, status).to_dict()
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Unit not found")
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
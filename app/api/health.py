@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Response
+
+from app.core.models import model_registry
+
+router = APIRouter()
+
+
+@router.get("/health")
+def health():
+    """
+    Liveness: the API process is up and answering.
+    """
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+def readiness(response: Response):
+    """
+    Readiness: reports which models are loaded.
+    Returns 503 while any registered model is still warming.
+    """
+    ready = model_registry.ready()
+    if not ready:
+        response.status_code = 503
+
+    return {
+        "ready": ready,
+        "models": model_registry.status()
+    }
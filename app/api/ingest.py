@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+from app.ingest.ingest_queue import ingest_queue
+
+router = APIRouter()
+
+
+@router.get("/ingest/stats")
+def ingest_stats():
+    """
+    Webhook ingest queue: depth, counters, queue wait and per-stage latency.
+    """
+    return ingest_queue.stats()
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app.core.cache import symptom_cache
+from app.core.events import event_bus
+from app.core.metrics import metrics
+from app.dispatch.fleet import fleet
+from app.ingest.ingest_queue import ingest_queue
+
+router = APIRouter()
+
+# Read from their owners when /metrics is scraped
+metrics.collect("talon_ingest_queue_depth", "Transcripts waiting for an ingest worker", ingest_queue.depth)
+metrics.collect("talon_stream_subscribers", "Open /incidents/stream connections", lambda: event_bus.subscriber_count)
+metrics.collect("talon_fleet_available_units", "Ambulance units free for assignment", lambda: len(fleet.available))
+metrics.collect("talon_symptom_cache_entries", "Transcripts in the symptom cache", lambda: symptom_cache.stats()["entries"])
+for _name in ("hits", "misses", "evictions"):
+    metrics.collect(
+        f"talon_symptom_cache_{_name}_total",
+        f"Symptom cache {_name}",
+        lambda name=_name: symptom_cache.counts[name],
+        kind="counter"
+    )
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """
+    Prometheus text format: per-stage latency histograms, incidents by
+    urgency and channel, queue and cache gauges.
+    """
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
@@ -1,19 +1,77 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
 
-from typing import List
-from app.api.schemas import AnalyzeRequest, AnalyzeResponse, IncidentResponse
-from app.medical_nlp.extractor import extract_medical_entities
-from app.medical_nlp.normalizer import normalize_entities
-from app.triage.triage_engine import triage
-from app.incident.service import create_incident, confirm_dispatch, request_manual_review, deny_dispatch
-from app.incident.repository import incident_repository
+from datetime import datetime, timezone
+from typing import List, Optional
+from app.api.batch import analyze_records
+from app.api.schemas import INCIDENT_FIELDS, AnalyzeRequest, analysis_response, AnalyzeResponse, BulkIngestRequest, IncidentResponse
+from app.core.cache import symptom_cache
+from app.core.executor import analysis_executor
+from app.core.metrics import time_stage
+from app.core.serialization import dumps_list
+from app.incident.service import create_incident, confirm_dispatch, request_manual_review, deny_dispatch, complete_incident
+from app.incident.repository import decode_cursor, encode_cursor, incident_repository
 
 router = APIRouter()
 
+MAX_PAGE_SIZE = 1000
 
-@router.get("/incidents", response_model=List[IncidentResponse])
-def get_incidents():
-    return incident_repository.all()
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Incident timestamps are naive UTC
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@router.get("/incidents", response_model=None, responses={200: {"model": List[IncidentResponse]}})
+def get_incidents(
+    urgency: Optional[str] = None,
+    status: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    since: Optional[datetime] = Query(None, description="Only incidents updated at or after this time"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. id,urgency,status")
+):
+    """
+    Incidents oldest first. With limit, the X-Next-Cursor response header
+    is set when there are more; pass it back as cursor for the next page.
+    """
+    selected = INCIDENT_FIELDS
+    if fields:
+        selected = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in selected if f not in INCIDENT_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    incidents = incident_repository.query(
+        urgency=urgency,
+        status=status,
+        created_after=_utc(created_after),
+        created_before=_utc(created_before),
+        since=_utc(since),
+        after=after,
+        limit=limit + 1 if limit else None,
+        audit_log="audit_log" in selected
+    )
+
+    headers = {}
+    if limit and len(incidents) > limit:
+        incidents = incidents[:limit]
+        headers["X-Next-Cursor"] = encode_cursor(incidents[-1])
+
+    # Pre-encoded per incident (cached for the full field list with the
+    # in-memory store), so this is mostly a join; skips response-model
+    # validation
+    cache = selected is INCIDENT_FIELDS
+    body = dumps_list(incident.to_json(selected, cache) for incident in incidents)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @router.post("/analyze", response_model=AnalyzeResponse)
 def analyze_incident(request: AnalyzeRequest):
@@ -22,23 +80,39 @@ def analyze_incident(request: AnalyzeRequest):
     if not text:
         raise HTTPException(status_code=400, detail="Text cannot be empty")
 
-    extracted = extract_medical_entities(text)
-    normalized = normalize_entities(extracted["entities"])
-    triage_result = triage(normalized["symptoms"])
+    with time_stage("analysis"):
+        analysis = analysis_executor.analyze(text)
 
     incident = create_incident(
         input_text=text,
-        symptoms=normalized["symptoms"],
-        triage_result=triage_result
+        symptoms=analysis["symptoms"],
+        triage_result=analysis["triage_result"]
     )
 
-    return {
-        "incident_id": incident.id,
-        "symptoms": incident.symptoms,
-        "urgency": incident.urgency,
-        "dispatch_required": incident.dispatch_required,
-        "reasoning": incident.reasoning
-    }
+    return analysis_response(incident)
+
+@router.get("/analyze/cache")
+def analysis_cache_stats():
+    """
+    Symptom cache size and hit / miss / eviction counters.
+    """
+    return symptom_cache.stats()
+
+@router.post("/incidents/bulk", response_model=List[AnalyzeResponse], deprecated=True)
+def bulk_ingest(request: BulkIngestRequest, hold: bool = False):
+    """
+    Deprecated: use POST /analyze/batch, which also takes locations and
+    streams results. Runs the same batch path and returns every result
+    at once.
+    """
+    texts = [text.strip() for text in request.texts]
+
+    for index, text in enumerate(texts):
+        if not text:
+            raise HTTPException(status_code=400, detail=f"Text at index {index} cannot be empty")
+
+    incidents = analyze_records([{"input_text": text, "lat": None, "lon": None} for text in texts], hold, channel="api")
+    return [analysis_response(incident) for incident in incidents]
 
 @router.get("/incident/{incident_id}")
 def get_incident(incident_id: str):
@@ -57,7 +131,7 @@ def get_incident(incident_id: str):
         "dispatch_required": incident.dispatch_required,
         "status": incident.status,
         "reasoning": incident.reasoning,
-        "audit_log": incident.audit_log
+        "audit_log": incident.audit_log.to_list()
     }
 
 @router.post("/incidents/{incident_id}/dispatch")
@@ -94,3 +168,11 @@ def deny_incident_dispatch(incident_id: str):
         return {"status": incident.status}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+
+@router.post("/incidents/{incident_id}/complete")
+def complete_incident_dispatch(incident_id: str):
+    try:
+        incident = complete_incident(incident_id)
+        return {"status": incident.status}
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException
+
+from app.core.ruleset import rule_store
+
+router = APIRouter()
+
+
+@router.get("/rules")
+def get_rules():
+    ruleset = rule_store.current()
+    return {
+        "version": ruleset.version,
+        "path": rule_store.path,
+        "canonical_symptoms": len(ruleset.canonical_symptoms),
+        "triage_rules": {tier.urgency: len(tier.masks) for tier in ruleset.triage.tiers}
+    }
+
+
+@router.post("/rules/reload")
+def reload_rules(force: bool = False):
+    """
+    Re-reads the rule set file now instead of waiting for the watcher.
+    """
+    try:
+        reloaded = rule_store.reload(force=force)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return {
+        "reloaded": reloaded,
+        "version": rule_store.current().version
+    }
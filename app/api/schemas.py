@@ -1,12 +1,24 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Any, Dict
 from datetime import datetime
 
+from app.incident.models import INCIDENT_FIELDS
+
 
 class AnalyzeRequest(BaseModel):
     text: str
 
 
+class BulkIngestRequest(BaseModel):
+    texts: List[str]
+
+
+class BatchItem(BaseModel):
+    text: str
+    lat: Optional[float] = Field(None, ge=-90, le=90)
+    lon: Optional[float] = Field(None, ge=-180, le=180)
+
+
 class AnalyzeResponse(BaseModel):
     incident_id: str
     symptoms: List[str]
@@ -30,3 +42,21 @@ class IncidentResponse(BaseModel):
     lon: Optional[float] = None
     reasoning: List[str]
     audit_log: List[Dict[str, Any]]
+
+
+# Defined next to Incident so the service layer needn't import the API
+if list(IncidentResponse.model_fields) != INCIDENT_FIELDS:
+    raise RuntimeError("IncidentResponse fields differ from app.incident.models.INCIDENT_FIELDS")
+
+
+def analysis_response(incident) -> Dict[str, Any]:
+    """
+    AnalyzeResponse fields for a newly created incident.
+    """
+    return {
+        "incident_id": incident.id,
+        "symptoms": incident.symptoms,
+        "urgency": incident.urgency,
+        "dispatch_required": incident.dispatch_required,
+        "reasoning": incident.reasoning
+    }
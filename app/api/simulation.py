@@ -0,0 +1,67 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from app.core.serialization import dumps
+from app.simulation.discrete import DiscreteEventSimulation
+from app.simulation.engine import SimulationEngine
+
+router = APIRouter()
+
+
+@router.post("/simulate/run")
+def run_simulation_engine(
+    cases: int = 1000,
+    seed: int = 0,
+    profile: str = "constant",
+    rate_per_hour: float = 600.0,
+    concurrency: int = 1,
+    report_every: int = None
+):
+    """
+    Seeded load simulation against a copy of the hospital state; creates
+    no incidents. Streams NDJSON: "progress" summaries every report_every
+    cases, then the final "summary" (throughput, per-stage latency, bed
+    exhaustion times, urgency distribution). If live traffic keeps the
+    analysis slots busy, an "error" line ends the run early, still followed
+    by the summary.
+    """
+    try:
+        engine = SimulationEngine(seed, cases, profile, rate_per_hour, concurrency, report_every)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        (dumps(summary) + b"\n" for summary in engine.run()),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.post("/simulate/timeline")
+def run_discrete_simulation(
+    hours: float = 24.0,
+    seed: int = 0,
+    rate_per_hour: float = 30.0,
+    profile: str = "constant",
+    units: int = 10,
+    speed_kmh: float = None,
+    queue_policy: str = "urgency",
+    report_hours: float = None
+):
+    """
+    Discrete-event simulation over `hours` simulated hours: Poisson call
+    arrivals, ambulance travel and bed turnover, against a copy of the
+    hospital state. Streams NDJSON "progress" summaries every report_hours,
+    then the final "summary" (response times by urgency, unit utilization,
+    bed occupancy).
+    """
+    try:
+        simulation = DiscreteEventSimulation(
+            seed, hours, rate_per_hour, profile, units, speed_kmh, queue_policy, report_hours
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        (dumps(summary) + b"\n" for summary in simulation.run()),
+        media_type="application/x-ndjson"
+    )
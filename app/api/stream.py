@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.events import event_bus
+
+router = APIRouter()
+
+
+async def _incident_events(request: Request):
+    subscription = event_bus.subscribe()
+    try:
+        # Client reconnect delay (ms)
+        yield "retry: 3000\n\n"
+
+        while not await request.is_disconnected():
+            events = await subscription.get(timeout=settings.EVENT_HEARTBEAT_SECONDS)
+            if not events:
+                # Keep-alive comment so proxies don't close an idle stream
+                yield ": ping\n\n"
+                continue
+
+            yield "".join(
+                f"id: {seq}\nevent: {event_type}\ndata: {data}\n\n"
+                for seq, event_type, data in events
+            )
+    finally:
+        event_bus.unsubscribe(subscription)
+
+
+@router.get("/incidents/stream")
+async def stream_incidents(request: Request):
+    """
+    Server-sent events: "incident.created" / "incident.updated" with the
+    incident as data (same fields as GET /incidents), and "resync" when
+    this client fell behind and should re-fetch GET /incidents?since=...
+    """
+    return StreamingResponse(
+        _incident_events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
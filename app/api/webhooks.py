@@ -1,13 +1,19 @@
+import queue
+
 from fastapi import APIRouter, Form, Request, HTTPException, Response
 from twilio.twiml.messaging_response import MessagingResponse
 from twilio.twiml.voice_response import VoiceResponse
-from app.medical_nlp.extractor import extract_medical_entities
-from app.medical_nlp.normalizer import normalize_entities
-from app.triage.triage_engine import triage
-from app.incident.service import create_incident
+from app.core.metrics import time_stage
+from app.ingest.ingest_queue import ingest_queue
 
 router = APIRouter()
 
+
+def _busy_response(content: str, media_type: str) -> Response:
+    # Queue is full: refuse rather than stall, so Twilio can retry/fall back
+    return Response(content=content, media_type=media_type, status_code=503, headers={"Retry-After": "5"})
+
+
 @router.post("/webhooks/sms")
 async def handle_sms(Body: str = Form(...), From: str = Form(...)):
     """
@@ -15,31 +21,18 @@ async def handle_sms(Body: str = Form(...), From: str = Form(...)):
     """
     transcript = Body.strip()
     
-    # Process the incident
-    extracted = extract_medical_entities(transcript)
-    normalized = normalize_entities(extracted["entities"])
-    triage_result = triage(normalized["symptoms"])
-    
-    incident = create_incident(
-        input_text=transcript,
-        symptoms=normalized["symptoms"],
-        triage_result=triage_result,
-        # In a real app, we might use 'From' to lookup location or user
-    )
-    
     # Create TwiML response
     resp = MessagingResponse()
-    
-    if incident.urgency == "CRITICAL":
-        msg = f"EMERGENCY ALERT RECEIVED. Dispatching units immediately. ID: {incident.id.split('-')[0]}"
-    elif incident.urgency == "URGENT":
-         msg = f"Help is on the way. Severity: High. ID: {incident.id.split('-')[0]}"
-    else:
-        # Check if triage_result has reasoning, otherwise provide default
-        reasoning = incident.reasoning[0] if incident.reasoning else "Monitor condition"
-        msg = f"Incident recorded. Advice: {reasoning}"
-        
-    resp.message(msg)
+
+    # Acknowledge right away; NLP and triage run on the ingest workers
+    try:
+        with time_stage("sms_ack"):
+            job = ingest_queue.submit(transcript, source=From, channel="sms")
+    except queue.Full:
+        resp.message("We are experiencing high volume. If this is an emergency, please call.")
+        return _busy_response(str(resp), "application/xml")
+
+    resp.message(f"Emergency message received. Help is being arranged. ID: {job.incident_id.split('-')[0]}")
     
     return Response(content=str(resp), media_type="application/xml")
 
@@ -87,32 +80,22 @@ async def handle_recording(RecordingUrl: str = Form(...), From: str = Form(...))
 async def handle_transcription(TranscriptionText: str = Form(...), From: str = Form(...)):
     """
     Handle incoming Transcription text from Twilio.
+    Acknowledges right away; the incident is processed by the ingest workers.
     """
     print(f"Received transcription for {From}: {TranscriptionText}")
     
+    transcript = TranscriptionText.strip()
+    if not transcript:
+        print("Empty transcription received.")
+        return {"status": "empty_transcription"}
+
     try:
-        transcript = TranscriptionText.strip()
-        if not transcript:
-            print("Empty transcription received.")
-            return {"status": "empty_transcription"}
-
-        # Process the incident
-        extracted = extract_medical_entities(transcript)
-        normalized = normalize_entities(extracted["entities"])
-        triage_result = triage(normalized["symptoms"])
-        
-        incident = create_incident(
-            input_text=transcript,
-            symptoms=normalized["symptoms"],
-            triage_result=triage_result
-        )
-        print(f"Incident created from transcription: {incident.id}")
-        
-    except Exception as e:
-        print(f"Error processing transcription: {e}")
-        return Response(status_code=500)
+        with time_stage("voice_ack"):
+            job = ingest_queue.submit(transcript, source=From, channel="voice")
+    except queue.Full:
+        return _busy_response('{"status": "busy"}', "application/json")
         
-    return {"status": "transcription_processed"}
+    return {"status": "transcription_received", "incident_id": job.incident_id}
 
 # Deprecated/Disabled OpenAI Logic
 # async def handle_recording_old(...): 
@@ -0,0 +1,113 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+
+def normalize_transcript(text: str) -> str:
+    """
+    Collapses runs of whitespace, so transcripts that differ only in
+    spacing share a cache entry (and get the same analysis).
+    """
+    return " ".join(text.split())
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache bounded by entry count, with an optional TTL.
+
+    Entries belong to one version (e.g. model + rule set): when the
+    version passed to get()/put() changes, everything cached is dropped.
+    Keys are fixed-size digests, and values for texts over max_text_chars
+    are never stored, so memory stays bounded however many unique inputs
+    arrive.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float = 0, max_text_chars: int = 1000):
+        self.max_entries = max_entries
+        self.ttl = ttl_seconds
+        self.max_text_chars = max_text_chars
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        self._version: Optional[Hashable] = None
+        self.counts = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "invalidations": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def key(self, text: str) -> Optional[bytes]:
+        """
+        Digest of already-normalized text, or None if it is too long to cache.
+        """
+        if not self.enabled or len(text) > self.max_text_chars:
+            return None
+        return hashlib.sha1(text.encode("utf-8")).digest()
+
+    def _check_version(self, version: Hashable):
+        # Caller holds self._lock
+        if version != self._version:
+            if self._entries:
+                self.counts["invalidations"] += 1
+                self._entries.clear()
+            self._version = version
+
+    def get(self, key: Optional[bytes], version: Hashable) -> Optional[Any]:
+        if key is None:
+            return None
+
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl > 0 and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self.counts["expired"] += 1
+                entry = None
+
+            if entry is None:
+                self.counts["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.counts["hits"] += 1
+            return entry[1]
+
+    def put(self, key: Optional[bytes], version: Hashable, value: Any):
+        if key is None:
+            return
+
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.counts["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.counts["hits"] + self.counts["misses"]
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "version": self._version,
+                **self.counts,
+                "hit_rate": round(self.counts["hits"] / lookups, 4) if lookups else None
+            }
+
+
+# Singleton instance: normalized symptoms per transcript
+symptom_cache = LRUCache(
+    settings.ANALYSIS_CACHE_SIZE,
+    settings.ANALYSIS_CACHE_TTL_SECONDS,
+    settings.ANALYSIS_CACHE_MAX_TEXT
+)
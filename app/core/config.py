@@ -11,6 +11,89 @@ class Settings(BaseSettings):
     TWILIO_PHONE_NUMBER: str = os.getenv("TWILIO_PHONE_NUMBER", "+1234567890")
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
 
+    # Load NLP models in a background thread at startup (otherwise on first use)
+    MODEL_WARMUP: bool = os.getenv("MODEL_WARMUP", "true").lower() == "true"
+
+    # Versioned triage/normalization rule set, re-read when the file changes
+    RULES_PATH: str = os.getenv("RULES_PATH", os.path.join(os.path.dirname(__file__), "rules.json"))
+    RULES_WATCH_SECONDS: float = float(os.getenv("RULES_WATCH_SECONDS", "5"))
+
+    # How long a recommended bed is held for the dispatcher to confirm
+    BED_RESERVATION_TIMEOUT_SECONDS: float = float(os.getenv("BED_RESERVATION_TIMEOUT_SECONDS", "600"))
+
+    # Optional JSON/CSV hospital registry to load instead of the built-in list
+    HOSPITALS_PATH: str = os.getenv("HOSPITALS_PATH", "")
+
+    # Incident store: empty for in-memory, or sqlite:///path/to/file.db
+    DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    # SQLite writes are committed in groups of up to this many saves or
+    # after this many ms, whichever comes first (0 ms: commit every save)
+    DB_COMMIT_BATCH: int = int(os.getenv("DB_COMMIT_BATCH", "64"))
+    DB_COMMIT_INTERVAL_MS: float = float(os.getenv("DB_COMMIT_INTERVAL_MS", "50"))
+
+    # Incident push stream: pending events per subscriber before it is told
+    # to resync, and idle seconds between keep-alive comments
+    EVENT_QUEUE_SIZE: int = int(os.getenv("EVENT_QUEUE_SIZE", "1000"))
+    EVENT_HEARTBEAT_SECONDS: float = float(os.getenv("EVENT_HEARTBEAT_SECONDS", "15"))
+
+    # Webhook transcripts wait in a bounded queue for this many NLP workers;
+    # webhooks answer 503 once the queue is full
+    INGEST_QUEUE_SIZE: int = int(os.getenv("INGEST_QUEUE_SIZE", "1000"))
+    INGEST_WORKERS: int = int(os.getenv("INGEST_WORKERS", "2"))
+    # Queued transcripts move up one priority level per this many seconds
+    # waited, so low-priority ones are never starved (0 disables aging)
+    INGEST_AGING_SECONDS: float = float(os.getenv("INGEST_AGING_SECONDS", "2"))
+
+    # Where /analyze, bulk ingest and /simulate run extract -> normalize ->
+    # triage: "thread" (in-process pool) or "process" (worker processes that
+    # share the preloaded models copy-on-write; startup waits for them).
+    # 0 workers means one per CPU. Requests beyond max in-flight wait up to
+    # ANALYSIS_WAIT_SECONDS for a slot, then get 503.
+    ANALYSIS_MODE: str = os.getenv("ANALYSIS_MODE", "thread")
+    ANALYSIS_WORKERS: int = int(os.getenv("ANALYSIS_WORKERS", "0"))
+    ANALYSIS_MAX_IN_FLIGHT: int = int(os.getenv("ANALYSIS_MAX_IN_FLIGHT", "32"))
+    ANALYSIS_WAIT_SECONDS: float = float(os.getenv("ANALYSIS_WAIT_SECONDS", "10"))
+
+    # Normalized symptoms cached per transcript (whitespace-normalized),
+    # invalidated when the models or rule set change. Size 0 disables;
+    # longer transcripts than ANALYSIS_CACHE_MAX_TEXT chars are not cached.
+    ANALYSIS_CACHE_SIZE: int = int(os.getenv("ANALYSIS_CACHE_SIZE", "10000"))
+    ANALYSIS_CACHE_TTL_SECONDS: float = float(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", "600"))
+    ANALYSIS_CACHE_MAX_TEXT: int = int(os.getenv("ANALYSIS_CACHE_MAX_TEXT", "1000"))
+
+    # Per-stage latency histograms and incident counters on /metrics.
+    # Off: nothing is recorded and /metrics returns 404.
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+    # Ambulance fleet: optional JSON/CSV of units (id, type ALS/BLS, lat,
+    # lon); without one, every hospital gets this many units, ALS and BLS
+    # alternating
+    FLEET_PATH: str = os.getenv("FLEET_PATH", "")
+    FLEET_UNITS_PER_HOSPITAL: int = int(os.getenv("FLEET_UNITS_PER_HOSPITAL", "2"))
+
+    # Average ambulance road speed, for dispatch ETAs and simulated travel
+    DISPATCH_SPEED_KMH: float = float(os.getenv("DISPATCH_SPEED_KMH", "40"))
+
+    # Simulation engine (/simulate/run): largest accepted run, and cases
+    # between the progress summaries streamed while it runs
+    SIMULATION_MAX_CASES: int = int(os.getenv("SIMULATION_MAX_CASES", "1000000"))
+    SIMULATION_REPORT_EVERY: int = int(os.getenv("SIMULATION_REPORT_EVERY", "10000"))
+    # Most batches one run analyzes at once; all runs together hold at most
+    # this many ANALYSIS_MAX_IN_FLIGHT slots, always leaving some for live calls
+    SIMULATION_MAX_CONCURRENCY: int = int(os.getenv("SIMULATION_MAX_CONCURRENCY", "4"))
+    # Discrete-event runs (/simulate/timeline): longest run in simulated
+    # hours, most ambulance units, most calls expected over the run (rate x
+    # hours x the profile's mean multiplier), and the shortest interval
+    # between progress summaries, in simulated hours
+    SIMULATION_MAX_HOURS: float = float(os.getenv("SIMULATION_MAX_HOURS", "8760"))
+    SIMULATION_MAX_UNITS: int = int(os.getenv("SIMULATION_MAX_UNITS", "10000"))
+    SIMULATION_MAX_CALLS: int = int(os.getenv("SIMULATION_MAX_CALLS", "1000000"))
+    SIMULATION_MIN_REPORT_HOURS: float = float(os.getenv("SIMULATION_MIN_REPORT_HOURS", "1"))
+
+    # NLP batching (used by simulation and bulk ingest)
+    NLP_BATCH_SIZE: int = int(os.getenv("NLP_BATCH_SIZE", "64"))
+    NLP_N_PROCESS: int = int(os.getenv("NLP_N_PROCESS", "1"))
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class StrEnum(str, Enum):
+    # Members compare, hash and format as their plain string values, so
+    # they can stand in for the strings used before
+    __str__ = str.__str__
+    __format__ = str.__format__
+
+
+class Urgency(StrEnum):
+    CRITICAL = "CRITICAL"
+    HIGH = "HIGH"
+    MEDIUM = "MEDIUM"
+    LOW = "LOW"
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+
+# Sent instead of the backlog when a subscriber falls too far behind;
+# the client should re-fetch (e.g. GET /incidents?since=...) and carry on
+RESYNC = "resync"
+
+
+class Subscription:
+    """
+    One consumer's pending events.
+
+    Pending events are keyed (e.g. by incident id), so a newer event for
+    the same key replaces the older one instead of queueing behind it: a
+    slow consumer gets the latest state, not every intermediate step. If
+    more than max_pending distinct keys pile up anyway, the backlog is
+    dropped and a single RESYNC event is delivered instead.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pending: int):
+        self._loop = loop
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: "OrderedDict[Hashable, Tuple[int, str, str]]" = OrderedDict()
+        self._overflowed = False
+        self._ready = asyncio.Event()
+        self.dropped = 0
+
+    def _push(self, key: Hashable, event: Tuple[int, str, str]):
+        with self._lock:
+            if self._overflowed:
+                self.dropped += 1
+                return
+
+            if key in self._pending:
+                del self._pending[key]
+            elif len(self._pending) >= self._max_pending:
+                self.dropped += len(self._pending) + 1
+                self._pending.clear()
+                self._overflowed = True
+            if not self._overflowed:
+                self._pending[key] = event
+
+            wake = not self._ready.is_set()
+
+        if wake:
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    async def get(self, timeout: float = None) -> List[Tuple[int, str, str]]:
+        """
+        Waits for events and returns everything pending as (seq, type, data).
+        Returns [] on timeout.
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+
+        with self._lock:
+            self._ready.clear()
+            events = list(self._pending.values())
+            self._pending.clear()
+            if self._overflowed:
+                self._overflowed = False
+                events = [(0, RESYNC, "{}")]
+        return events
+
+
+class EventBus:
+    """
+    In-process pub/sub from request/worker threads to async subscribers
+    (e.g. SSE connections). Each event is serialized once, however many
+    subscribers there are.
+    """
+
+    def __init__(self, max_pending: int = None):
+        self.max_pending = max_pending or settings.EVENT_QUEUE_SIZE
+        self._subscribers: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> Subscription:
+        """
+        Call from the event loop that will consume the subscription.
+        """
+        subscription = Subscription(loop or asyncio.get_running_loop(), self.max_pending)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self, event_type: str, key: Hashable, payload) -> int:
+        """
+        Publishes payload (JSON-serializable) under key. Safe to call from
+        any thread. Returns the event's sequence number.
+        """
+        data = json.dumps(payload, default=_json_default)
+        with self._lock:
+            self._seq += 1
+            event = (self._seq, event_type, data)
+            subscribers = list(self._subscribers)
+
+        for subscription in subscribers:
+            subscription._push(key, event)
+        return event[0]
+
+
+def _json_default(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+# Singleton instance
+event_bus = EventBus()
@@ -0,0 +1,249 @@
+import gc
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple
+
+from app.core.cache import LRUCache, normalize_transcript, symptom_cache
+from app.core.config import settings
+from app.core.metrics import observe_stage, time_stage
+from app.core.models import model_registry
+from app.core.ruleset import rule_store
+from app.medical_nlp.extractor import MODEL_VERSION, extract_medical_entities, extract_medical_entities_batch
+from app.medical_nlp.normalizer import normalize_entities
+from app.triage.triage_engine import triage
+
+MODES = ("thread", "process")
+
+
+class AnalysisBusy(Exception):
+    """
+    Raised when max_in_flight analyses are already running or queued.
+    """
+
+
+# Caller rule version this process last reloaded for
+_reloaded_for: Optional[str] = None
+
+
+def _ruleset(version: Optional[str]):
+    # A worker process has its own rule store; catch up with the caller's
+    # version by rereading the file. Forced, since the caller may have
+    # force-reloaded a file whose mtime did not change. Once per version,
+    # so a file already ahead of the caller is not reread on every task.
+    global _reloaded_for
+    ruleset = rule_store.current()
+    if version is not None and ruleset.version != version and version != _reloaded_for:
+        _reloaded_for = version
+        rule_store.reload(force=True)
+        ruleset = rule_store.current()
+    return ruleset
+
+
+def _symptoms(text: str, rule_version: Optional[str] = None) -> Tuple[List[str], float, float]:
+    # Returns the symptoms plus extract / normalize seconds, since stages
+    # timed in a worker process can't be recorded there
+    ruleset = _ruleset(rule_version)
+    start = time.perf_counter()
+    extracted = extract_medical_entities(text)
+    extracted_at = time.perf_counter()
+    symptoms = normalize_entities(extracted["entities"], ruleset)["symptoms"]
+    return symptoms, extracted_at - start, time.perf_counter() - extracted_at
+
+
+def _symptoms_batch(texts: List[str], rule_version: Optional[str] = None) -> Tuple[List[List[str]], float, float]:
+    ruleset = _ruleset(rule_version)
+    start = time.perf_counter()
+    extractions = extract_medical_entities_batch(texts)
+    extracted_at = time.perf_counter()
+    symptoms = [normalize_entities(extracted["entities"], ruleset)["symptoms"] for extracted in extractions]
+    return symptoms, extracted_at - start, time.perf_counter() - extracted_at
+
+
+def _init_worker():
+    # No-op when the models were inherited from the parent via fork
+    model_registry.get("medical_ner")
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class AnalysisExecutor:
+    """
+    Runs the extract -> normalize -> triage pipeline off the request thread.
+    Extraction and normalization run on the pool (unless the symptoms are
+    cached); triage is a cheap bitmask lookup and runs in the caller.
+
+    "thread" mode uses a thread pool in this process: cheap, but spaCy
+    inference is serialized by the GIL. "process" mode uses worker
+    processes, each holding the models. Where fork is available the models
+    are loaded (and gc-frozen) in the parent before the workers start, so
+    their memory is shared copy-on-write instead of loaded once per worker.
+
+    At most max_in_flight analyses run or wait at once; callers beyond that
+    wait up to wait_seconds for a slot and then get AnalysisBusy.
+
+    Transcripts are whitespace-normalized first. With a cache, symptoms
+    are looked up per (model version, rule version, text), and repeats
+    within a batch are analyzed once.
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        workers: int = 0,
+        max_in_flight: int = 32,
+        wait_seconds: float = 10,
+        start_method: str = "",
+        cache: Optional[LRUCache] = None
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown analysis mode: {mode}")
+
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max(1, max_in_flight)
+        self.wait_seconds = wait_seconds
+        self.start_method = start_method or (
+            "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+
+        self.cache = cache
+
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._pool: Optional[Executor] = None
+
+    def _create_pool(self) -> Executor:
+        if self.mode == "thread":
+            return ThreadPoolExecutor(self.workers, thread_name_prefix="analysis")
+
+        if self.start_method == "fork":
+            # Load once here; forked workers share the pages. Freezing keeps
+            # the collector from touching (and so copying) them in each worker.
+            model_registry.get("medical_ner")
+            gc.freeze()
+
+        pool = ProcessPoolExecutor(
+            self.workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_init_worker
+        )
+        # Start every worker (and load its models) now rather than on the
+        # first requests
+        for future in [pool.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+        return pool
+
+    def start(self):
+        """
+        Creates the pool. In process mode call this before starting other
+        threads, so workers are not forked while those threads hold locks.
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = self._create_pool()
+
+    def stop(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _run(self, fn, calls: List[tuple]) -> List:
+        # One in-flight slot per request, however many pieces it is split into
+        if not self._slots.acquire(timeout=self.wait_seconds):
+            raise AnalysisBusy("Too many analyses in flight")
+
+        try:
+            if self._pool is None:
+                self.start()
+            pool = self._pool
+            try:
+                futures = [pool.submit(fn, *args) for args in calls]
+                return [future.result() for future in futures]
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); replace the pool
+                # and let the caller retry
+                with self._lock:
+                    if self._pool is pool:
+                        self._pool = None
+                print("Analysis worker pool broke; restarting")
+                raise AnalysisBusy("Analysis workers restarting")
+        finally:
+            self._slots.release()
+
+    def analyze(self, text: str) -> Dict:
+        """
+        Returns {"symptoms", "triage_result"} for one transcript.
+        """
+        return self.analyze_batch([text])[0]
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Batched analyze(), in input order. In process mode the uncached
+        texts are split across the workers.
+        """
+        ruleset = rule_store.current()
+        results = []
+        for symptoms in self.symptoms_batch(texts, ruleset):
+            with time_stage("triage"):
+                results.append({"symptoms": symptoms, "triage_result": triage(symptoms, ruleset)})
+        return results
+
+    def symptoms_batch(self, texts: List[str], ruleset=None) -> List[List[str]]:
+        """
+        Extraction and normalization only: the normalized symptoms of each
+        text, in input order, for callers that triage themselves.
+        """
+        texts = [normalize_transcript(text) for text in texts]
+        ruleset = ruleset or rule_store.current()
+        version = (MODEL_VERSION, ruleset.version)
+
+        symptoms: Dict[str, List[str]] = {}
+        missing: List[str] = []
+        for text in texts:
+            if text in symptoms:
+                continue
+            cached = self.cache.get(self.cache.key(text), version) if self.cache else None
+            symptoms[text] = cached
+            if cached is None:
+                missing.append(text)
+
+        analyzed: List[List[str]] = []
+        if len(missing) == 1:
+            found, extract_seconds, normalize_seconds = self._run(_symptoms, [(missing[0], ruleset.version)])[0]
+            analyzed.append(found)
+            observe_stage("extract", extract_seconds)
+            observe_stage("normalize", normalize_seconds)
+        elif missing:
+            parts = self.workers if self.mode == "process" else 1
+            size = -(-len(missing) // parts)
+            chunks = self._run(_symptoms_batch, [
+                (missing[i:i + size], ruleset.version) for i in range(0, len(missing), size)
+            ])
+            for chunk, extract_seconds, normalize_seconds in chunks:
+                analyzed.extend(chunk)
+                observe_stage("extract_batch", extract_seconds)
+                observe_stage("normalize_batch", normalize_seconds)
+
+        for text, result in zip(missing, analyzed):
+            symptoms[text] = result
+            if self.cache:
+                self.cache.put(self.cache.key(text), version, tuple(result))
+
+        return [list(symptoms[text]) for text in texts]
+
+
+# Singleton instance
+analysis_executor = AnalysisExecutor(
+    settings.ANALYSIS_MODE,
+    settings.ANALYSIS_WORKERS,
+    settings.ANALYSIS_MAX_IN_FLIGHT,
+    settings.ANALYSIS_WAIT_SECONDS,
+    cache=symptom_cache
+)
@@ -0,0 +1,198 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from app.core.config import settings
+
+# Histogram bucket upper bounds in seconds, from dictionary lookups up to
+# a cold model load
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Returned by timers while metrics are off
+_NULL_TIMER = nullcontext()
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram: observe() is a bisect and three additions.
+    """
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # labels -> [per-bucket counts (last is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, seconds: float, *labels: str):
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += seconds
+            series[2] += 1
+
+    def time(self, *labels: str) -> "_Timer":
+        return _Timer(self, labels)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labels, ([*counts], total, count)) for labels, (counts, total, count) in self._series.items())
+
+        names = self.labelnames + ("le",)
+        for labels, (counts, total, count) in series:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                lines.append(f"{self.name}_bucket{_labels(names, labels + (_number(bound),))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_start")
+
+    def __init__(self, histogram: Histogram, labels: Tuple[str, ...]):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start, *self._labels)
+        return False
+
+
+class Collected:
+    """
+    A metric read from elsewhere (e.g. a queue depth or cache counter)
+    when /metrics is rendered, instead of being recorded as it happens.
+    """
+
+    def __init__(self, name: str, help: str, kind: str, read: Callable[[], float]):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.read = read
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.kind}",
+            f"{self.name} {_number(self.read())}"
+        ]
+
+
+class MetricsRegistry:
+    """
+    Counters and histograms in Prometheus text format. When disabled,
+    recording helpers return before touching any metric and timers are a
+    shared no-op context manager.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics = []
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, help, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def collect(self, name: str, help: str, read: Callable[[], float], kind: str = "gauge") -> Collected:
+        metric = Collected(name, help, kind, read)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Singleton instance
+metrics = MetricsRegistry(settings.METRICS_ENABLED)
+
+STAGE_SECONDS = metrics.histogram(
+    "talon_stage_seconds",
+    "Time spent in each analyze / triage / dispatch stage",
+    ("stage",)
+)
+INCIDENTS_TOTAL = metrics.counter(
+    "talon_incidents_total",
+    "Incidents created, by urgency and ingest channel",
+    ("urgency", "channel")
+)
+
+
+def time_stage(stage: str):
+    """
+    Context manager recording the block's duration under stage.
+    """
+    if not metrics.enabled:
+        return _NULL_TIMER
+    return STAGE_SECONDS.time(stage)
+
+
+def observe_stage(stage: str, seconds: float):
+    if metrics.enabled:
+        STAGE_SECONDS.observe(seconds, stage)
+
+
+def count_incident(urgency: str, channel: str):
+    if metrics.enabled:
+        INCIDENTS_TOTAL.inc(urgency, channel)
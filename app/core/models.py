@@ -0,0 +1,90 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class ModelRegistry:
+    """
+    Loads heavy models (spaCy, transformers) on first use instead of at
+    import time, and can warm them in a background thread after startup.
+    """
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._models: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._errors: Dict[str, str] = {}
+        self._load_seconds: Dict[str, float] = {}
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        self._loaders[name] = loader
+        self._locks.setdefault(name, threading.Lock())
+
+    def get(self, name: str) -> Any:
+        model = self._models.get(name)
+        if model is not None:
+            return model
+
+        if name not in self._loaders:
+            raise KeyError(f"Unknown model: {name}")
+
+        with self._locks[name]:
+            # Another thread may have finished loading while we waited
+            if name not in self._models:
+                start = time.perf_counter()
+                try:
+                    self._models[name] = self._loaders[name]()
+                except Exception as e:
+                    self._errors[name] = str(e)
+                    raise
+                self._errors.pop(name, None)
+                self._load_seconds[name] = round(time.perf_counter() - start, 3)
+            return self._models[name]
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._models
+
+    def ready(self, names: Optional[Iterable[str]] = None) -> bool:
+        names = self._loaders if names is None else names
+        return all(self.is_loaded(name) for name in names)
+
+    def status(self) -> Dict[str, Dict]:
+        report = {}
+        for name in self._loaders:
+            if name in self._models:
+                state = "loaded"
+            elif name in self._errors:
+                state = "failed"
+            elif self._locks[name].locked():
+                state = "loading"
+            else:
+                state = "not_loaded"
+
+            report[name] = {
+                "state": state,
+                "load_seconds": self._load_seconds.get(name),
+                "error": self._errors.get(name)
+            }
+        return report
+
+    def warm(self, names: Optional[Iterable[str]] = None) -> threading.Thread:
+        """
+        Loads the given (default: all registered) models in a daemon thread.
+        Failures are recorded in status() rather than raised.
+        """
+        names = list(self._loaders if names is None else names)
+
+        def _load_all():
+            for name in names:
+                try:
+                    self.get(name)
+                except Exception as e:
+                    print(f"Failed to load model {name}: {e}")
+
+        thread = threading.Thread(target=_load_all, name="model-warmup", daemon=True)
+        thread.start()
+        return thread
+
+
+# Singleton instance
+model_registry = ModelRegistry()
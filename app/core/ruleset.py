@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, List
+
+from app.core.config import settings
+from app.core.enums import Urgency
+from app.medical_nlp.patterns import SeverityScreen, SymptomMatcher
+from app.triage.compiled_rules import CompiledRules
+
+
+class RuleSet:
+    """
+    One version of every rule table, precompiled into its matching
+    structures. Never mutated after construction: a new version is a new
+    RuleSet, so a request that picked one up keeps a consistent view.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        canonical_symptoms: Dict[str, List[str]],
+        triage_tiers: List[Dict],
+        triage_fallback: Dict,
+        symptom_severity: Dict[str, List[str]]
+    ):
+        self.version = version
+        self.canonical_symptoms = canonical_symptoms
+        self.symptom_severity = symptom_severity
+
+        # (urgency, dispatch_required, rules) in priority order
+        self.triage_tables = [
+            (
+                tier["urgency"],
+                tier["dispatch_required"],
+                [
+                    {"pattern": set(rule["pattern"]), "reason": rule["reason"]}
+                    for rule in tier["rules"]
+                ]
+            )
+            for tier in triage_tiers
+        ]
+
+        self.symptom_matcher = SymptomMatcher(canonical_symptoms)
+        # symptom_severity levels, most severe first
+        self.severity_screen = SeverityScreen(symptom_severity)
+        self.triage = CompiledRules(self.triage_tables, fallback=triage_fallback)
+
+
+def load_ruleset(path: str) -> RuleSet:
+    """
+    Loads and compiles a rule set file. Raises ValueError if it is malformed.
+    """
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid rule set {path}: {e}")
+
+    try:
+        # Incidents store urgency as an Urgency; reject anything else here
+        # rather than when the first incident is created
+        for urgency in [t["urgency"] for t in data["triage"]["tiers"]] + [data["triage"]["fallback"]["urgency"]]:
+            if urgency not in Urgency.__members__:
+                raise ValueError(f"Invalid rule set {path}: unknown urgency {urgency!r}")
+
+        return RuleSet(
+            version=str(data["version"]),
+            canonical_symptoms=data["canonical_symptoms"],
+            triage_tiers=data["triage"]["tiers"],
+            triage_fallback=data["triage"]["fallback"],
+            symptom_severity=data["symptom_severity"]
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Invalid rule set {path}: missing or malformed {e}")
+
+
+class RuleSetStore:
+    """
+    Holds the active RuleSet and swaps in a new one when the file changes.
+
+    The swap is a single reference assignment, so requests that already
+    called current() finish on the old version and later ones get the new.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime = os.stat(path).st_mtime_ns
+        self._current = load_ruleset(path)
+
+    def current(self) -> RuleSet:
+        return self._current
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Reloads the file if it changed since the last load (or if forced).
+        Returns True if a new version was swapped in. A file that fails to
+        load raises ValueError and leaves the active version in place.
+        """
+        with self._lock:
+            mtime = os.stat(self.path).st_mtime_ns
+            if not force and mtime == self._mtime:
+                return False
+
+            ruleset = load_ruleset(self.path)
+            self._mtime = mtime
+            self._current = ruleset
+            return True
+
+    def watch(self, interval_seconds: float) -> threading.Thread:
+        """
+        Polls the file for changes in a daemon thread.
+        """
+        def _poll():
+            while True:
+                try:
+                    if self.reload():
+                        print(f"Loaded rule set version {self._current.version}")
+                except (OSError, ValueError) as e:
+                    print(f"Keeping rule set version {self._current.version}: {e}")
+                time.sleep(interval_seconds)
+
+        thread = threading.Thread(target=_poll, name="ruleset-watch", daemon=True)
+        thread.start()
+        return thread
+
+
+# Singleton instance
+rule_store = RuleSetStore(settings.RULES_PATH)
@@ -0,0 +1,30 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional; the standard library encoder is the fallback
+    orjson = None
+
+
+def _default(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Compact JSON as UTF-8 bytes. Datetimes become ISO strings and enums
+    their values, the same as FastAPI's own encoding.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps_list(fragments) -> bytes:
+    """
+    A JSON array from already-encoded elements.
+    """
+    return b"[" + b",".join(fragments) + b"]"
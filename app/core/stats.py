@@ -0,0 +1,45 @@
+import threading
+from collections import deque
+from typing import Dict
+
+
+def percentile(ordered, pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted sequence.
+    """
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+class LatencyWindow:
+    """
+    Durations (seconds) of the most recent `size` observations, with a
+    lifetime count, summarized in milliseconds.
+    """
+
+    def __init__(self, size: int = 2048):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+
+    def summary(self) -> Dict:
+        with self._lock:
+            ordered = sorted(self._samples)
+            count = self.count
+
+        ms = [s * 1000 for s in ordered]
+        return {
+            "count": count,
+            "mean_ms": round(sum(ms) / len(ms), 3) if ms else 0.0,
+            "p50_ms": round(percentile(ms, 50), 3),
+            "p95_ms": round(percentile(ms, 95), 3),
+            "p99_ms": round(percentile(ms, 99), 3),
+            "max_ms": round(ms[-1], 3) if ms else 0.0
+        }
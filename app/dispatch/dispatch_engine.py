@@ -1,8 +1,17 @@
-from app.dispatch.hospitals import find_nearest_hospital
+from app.core.config import settings
+from app.dispatch.fleet import fleet
+from app.dispatch.hospitals import find_nearest_hospital, reserve_nearest_hospital
+from app.utils.geo import travel_minutes
 
-def recommend_dispatch(incident):
+def recommend_dispatch(incident, hold: bool = True):
     """
     Analyzing incident to recommend dispatch resources.
+    Holds a bed at the recommended hospital until the dispatcher confirms
+    or denies (see CapacityManager), and assigns the nearest suitable
+    ambulance until the incident is completed, denied or overridden.
+
+    hold=False only recommends (nearest hospital, unit type, ETA) and
+    takes no live bed or unit, e.g. for backfilled or simulated calls.
     """
     if not incident.dispatch_required:
         return None
@@ -12,11 +21,31 @@ def recommend_dispatch(incident):
     lat = incident.lat or 23.25
     lon = incident.lon or 77.42
     
-    hospital = find_nearest_hospital(lat, lon)
+    hospital, reservation_id = reserve_nearest_hospital(lat, lon) if hold else (None, None)
+    if hospital is None:
+        # No free beds anywhere (or nothing to hold); still send the
+        # ambulance to the nearest one
+        hospital = find_nearest_hospital(lat, lon)
     
+    # Nearest free unit that can handle this urgency
+    assigned = None
+    if hold:
+        assigned = fleet.assign(incident.id, lat, lon, incident.urgency, destination=(hospital.lat, hospital.lon))
+    if assigned:
+        unit, distance_km = assigned
+        unit_id, unit_type = unit.id, f"{unit.type} Ambulance"
+        eta = distance_km / settings.DISPATCH_SPEED_KMH * 60
+    else:
+        # Every suitable unit is busy (or none was assigned); recommend the
+        # type and estimate from the hospital, where units are based
+        unit_id, unit_type = None, "ALS Ambulance" if incident.urgency == "CRITICAL" else "BLS Ambulance"
+        eta = travel_minutes(hospital.lat, hospital.lon, lat, lon, settings.DISPATCH_SPEED_KMH)
+
     return {
-        "unit_type": "ALS Ambulance" if incident.urgency == "CRITICAL" else "BLS Ambulance",
+        "unit_type": unit_type,
+        "unit_id": unit_id,
         "hospital": hospital.name,
         "hospital_id": hospital.id,
-        "eta_minutes": 12 # Simulated
+        "bed_reservation_id": reservation_id,
+        "eta_minutes": max(1, round(eta))
     }
@@ -0,0 +1,233 @@
+import csv
+import json
+import threading
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.routing.hospitals import HospitalRegistry, hospital_registry
+from app.routing.spatial_index import SpatialIndex
+from app.utils.geo import haversine
+
+
+class UnitStatus(str, Enum):
+    AVAILABLE = "AVAILABLE"
+    EN_ROUTE = "EN_ROUTE"
+    ON_SCENE = "ON_SCENE"
+    TRANSPORTING = "TRANSPORTING"
+
+
+# Unit type -> capability bit in the available-unit index
+UNIT_TYPE_BITS = {"ALS": 1, "BLS": 2}
+
+# Unit types that may answer an incident of each urgency; advanced life
+# support units can also take basic calls
+SUITABLE_UNITS = {
+    "CRITICAL": ("ALS",),
+    "HIGH": ("ALS", "BLS"),
+    "MEDIUM": ("ALS", "BLS"),
+    "LOW": ("ALS", "BLS")
+}
+
+# Forward-only status changes for a unit out on an incident
+_NEXT_STATUS = {
+    UnitStatus.EN_ROUTE: (UnitStatus.ON_SCENE,),
+    UnitStatus.ON_SCENE: (UnitStatus.TRANSPORTING,),
+    UnitStatus.TRANSPORTING: ()
+}
+
+
+class Unit:
+    __slots__ = ("id", "type", "lat", "lon", "status", "incident_id", "destination")
+
+    def __init__(self, unit_id: str, unit_type: str, lat: float, lon: float):
+        self.id = unit_id
+        self.type = unit_type
+        self.lat = lat
+        self.lon = lon
+        self.status = UnitStatus.AVAILABLE
+        self.incident_id = None
+        self.destination: Optional[Tuple[float, float]] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "lat": self.lat,
+            "lon": self.lon,
+            "status": self.status,
+            "incident_id": self.incident_id
+        }
+
+
+def units_mask(unit_types: Iterable[str]) -> int:
+    mask = 0
+    for unit_type in unit_types:
+        mask |= UNIT_TYPE_BITS[unit_type]
+    return mask
+
+
+class Fleet:
+    """
+    Ambulance units and what each is doing.
+
+    Only AVAILABLE units are in the spatial index, keyed by unit id with
+    the unit type as capability bit, so the nearest suitable free unit is
+    a single nearest-neighbour query. Assigning takes the unit out of the
+    index; releasing puts it back where it ended up (e.g. the hospital it
+    transported to).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._units: Dict[str, Unit] = {}
+        self._by_incident: Dict[str, str] = {}   # incident id -> unit id
+        self.available = SpatialIndex()
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def get(self, unit_id: str) -> Optional[Unit]:
+        return self._units.get(unit_id)
+
+    def unit_for(self, incident_id: str) -> Optional[Unit]:
+        unit_id = self._by_incident.get(incident_id)
+        return None if unit_id is None else self._units.get(unit_id)
+
+    def add(self, unit_id: str, unit_type: str, lat: float, lon: float) -> Unit:
+        if unit_type not in UNIT_TYPE_BITS:
+            raise ValueError(f"Unknown unit type: {unit_type} (expected one of {', '.join(UNIT_TYPE_BITS)})")
+
+        with self._lock:
+            if unit_id in self._units:
+                raise ValueError(f"Duplicate unit id: {unit_id}")
+            unit = self._units[unit_id] = Unit(unit_id, unit_type, float(lat), float(lon))
+            self.available.add(unit_id, unit.lat, unit.lon, UNIT_TYPE_BITS[unit_type])
+        return unit
+
+    def load_records(self, records: Iterable[Dict]) -> int:
+        """
+        Adds units from {id, type, lat, lon} records. Returns the number added.
+        """
+        added = 0
+        for record in records:
+            self.add(str(record["id"]), record["type"], record["lat"], record["lon"])
+            added += 1
+        return added
+
+    def load_file(self, path: str) -> int:
+        """
+        Loads a JSON list or a CSV (columns id, type, lat, lon) of units.
+        """
+        with open(path, newline="", encoding="utf-8") as f:
+            if path.lower().endswith(".csv"):
+                return self.load_records(csv.DictReader(f))
+            return self.load_records(json.load(f))
+
+    def station_at_hospitals(self, registry: HospitalRegistry, per_hospital: int) -> int:
+        """
+        Bases per_hospital units at every hospital, alternating ALS / BLS.
+        """
+        records = [
+            {
+                "id": f"{hospital.id}-U{n + 1}",
+                "type": "ALS" if n % 2 == 0 else "BLS",
+                "lat": hospital.lat,
+                "lon": hospital.lon
+            }
+            for hospital in registry
+            for n in range(per_hospital)
+        ]
+        return self.load_records(records)
+
+    def assign(
+        self,
+        incident_id: str,
+        lat: float,
+        lon: float,
+        urgency: str,
+        destination: Tuple[float, float] = None
+    ) -> Optional[Tuple[Unit, float]]:
+        """
+        Sends the nearest available unit suitable for the urgency to the
+        incident. Returns (unit, distance_km), or None if no suitable unit
+        is free. An incident that already has a unit keeps it.
+
+        destination: where the unit will end up (the receiving hospital),
+        and where release(..., completed=True) makes it available again.
+        """
+        mask = units_mask(SUITABLE_UNITS.get(urgency, tuple(UNIT_TYPE_BITS)))
+
+        with self._lock:
+            unit_id = self._by_incident.get(incident_id)
+            if unit_id is not None:
+                unit = self._units[unit_id]
+                return unit, haversine(unit.lat, unit.lon, lat, lon)
+
+            nearest = self.available.nearest(lat, lon, k=1, capabilities=mask)
+            if not nearest:
+                return None
+
+            distance, unit_id = nearest[0]
+            self.available.remove(unit_id)
+            unit = self._units[unit_id]
+            unit.status = UnitStatus.EN_ROUTE
+            unit.incident_id = incident_id
+            unit.destination = destination
+            self._by_incident[incident_id] = unit_id
+        return unit, distance
+
+    def update_status(self, unit_id: str, status: UnitStatus) -> Unit:
+        """
+        Moves a busy unit along EN_ROUTE -> ON_SCENE -> TRANSPORTING.
+        Raises KeyError for an unknown unit and ValueError for any other
+        change; units become AVAILABLE again through release().
+        """
+        with self._lock:
+            unit = self._units[unit_id]
+            if status not in _NEXT_STATUS.get(unit.status, ()):
+                raise ValueError(f"Unit {unit_id} cannot go from {unit.status.value} to {status.value}")
+            unit.status = status
+        return unit
+
+    def release(self, incident_id: str, completed: bool = False) -> Optional[Unit]:
+        """
+        Frees the incident's unit. After a completed transport the unit is
+        available at its destination; otherwise (denied, overridden) it is
+        available where it was. Returns the unit, or None if the incident
+        had none.
+        """
+        with self._lock:
+            unit_id = self._by_incident.pop(incident_id, None)
+            if unit_id is None:
+                return None
+
+            unit = self._units[unit_id]
+            if completed and unit.destination is not None:
+                unit.lat, unit.lon = unit.destination
+            unit.status = UnitStatus.AVAILABLE
+            unit.incident_id = None
+            unit.destination = None
+            self.available.add(unit_id, unit.lat, unit.lon, UNIT_TYPE_BITS[unit.type])
+        return unit
+
+    def stats(self) -> Dict:
+        counts: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            for unit in self._units.values():
+                by_status = counts.setdefault(unit.type, {status.value: 0 for status in UnitStatus})
+                by_status[unit.status.value] += 1
+        return {"units": len(self._units), "by_type": counts}
+
+    def units(self) -> List[Dict]:
+        with self._lock:
+            return [unit.to_dict() for unit in self._units.values()]
+
+
+# Singleton instance
+fleet = Fleet()
+
+if settings.FLEET_PATH:
+    fleet.load_file(settings.FLEET_PATH)
+else:
+    fleet.station_at_hospitals(hospital_registry, settings.FLEET_UNITS_PER_HOSPITAL)
@@ -1,51 +1,215 @@
-from typing import List, Dict
-from datetime import datetime
+import time
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
 from uuid import uuid4
 
+from app.core.enums import StrEnum, Urgency
+from app.core.serialization import dumps
+
+
+class IncidentStatus(StrEnum):
+    TRIAGED = "TRIAGED"
+    DISPATCH_CONFIRMED = "DISPATCH_CONFIRMED"
+    DISPATCH_OVERRIDDEN = "DISPATCH_OVERRIDDEN"
+    MANUAL_REVIEW_REQUESTED = "MANUAL_REVIEW_REQUESTED"
+    DISPATCH_DENIED = "DISPATCH_DENIED"
+    COMPLETED = "COMPLETED"
+
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def now_us() -> int:
+    return time.time_ns() // 1000
+
+
+def utc_datetime(timestamp_us: int) -> datetime:
+    """
+    Naive UTC datetime (the form incidents use) for epoch microseconds.
+    """
+    return EPOCH + timedelta(microseconds=timestamp_us)
+
+
+def epoch_us(value: datetime) -> int:
+    """
+    Epoch microseconds of a naive UTC datetime; exact inverse of utc_datetime.
+    """
+    return (value - EPOCH) // MICROSECOND
+
+
+# Events whose details always have the same keys; these may be logged
+# with a tuple of values in this order instead of a dict
+DETAIL_FIELDS = {
+    "INCIDENT_CREATED": ("urgency", "dispatch_required", "rule_version")
+}
+
+
+# Fields of an incident as listed by /incidents and pushed by
+# /incidents/stream (app.api.schemas.IncidentResponse mirrors these)
+INCIDENT_FIELDS = [
+    "id", "created_at", "updated_at", "input_text", "symptoms", "urgency",
+    "dispatch_required", "dispatch_confirmed", "dispatch_decision", "status",
+    "lat", "lon", "reasoning", "audit_log"
+]
+
+
+class AuditLog:
+    """
+    Append-only audit trail stored column-wise: raw epoch-microsecond
+    timestamps in an array, event names and details in parallel lists.
+
+    Reads as a sequence of {"timestamp", "event", "details"} dicts; the
+    dicts and ISO timestamps are only built when an entry is read.
+    """
+    __slots__ = ("_times", "_events", "_details")
+
+    def __init__(self, entries: Iterable[Tuple[int, str, Dict]] = ()):
+        self._times = array("q")
+        self._events: List[str] = []
+        self._details: List[Dict] = []
+        for timestamp, event, details in entries:
+            self.append(event, details, timestamp)
+
+    def append(self, event: str, details: Union[Dict, tuple], timestamp: int = None) -> int:
+        if timestamp is None:
+            timestamp = now_us()
+        self._times.append(timestamp)
+        self._events.append(event)
+        self._details.append(details)
+        return timestamp
+
+    def _entry(self, index: int) -> Dict:
+        event = self._events[index]
+        details = self._details[index]
+        if type(details) is tuple:
+            details = dict(zip(DETAIL_FIELDS[event], details))
+        return {
+            "timestamp": utc_datetime(self._times[index]).isoformat(),
+            "event": event,
+            "details": details
+        }
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self._events)))]
+        if index < 0:
+            index += len(self._events)
+        if not 0 <= index < len(self._events):
+            raise IndexError("audit log index out of range")
+        return self._entry(index)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return (self._entry(i) for i in range(len(self._events)))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AuditLog):
+            return self._times == other._times and self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def to_list(self) -> List[Dict]:
+        return self[:]
+
 
 class Incident:
+    __slots__ = (
+        "id", "lat", "lon", "created_at", "updated_at", "input_text", "symptoms",
+        "urgency", "dispatch_required", "reasoning", "rule_version", "_status",
+        "dispatch_decision", "dispatch_confirmed", "override_reason",
+        "bed_reservation_id", "audit_log", "_json", "_stored"
+    )
+
     def __init__(
         self,
         input_text: str,
         symptoms: List[str],
         triage_result: Dict,
         lat: float = None,
-        lon: float = None
+        lon: float = None,
+        incident_id: str = None
     ):
-        self.id = str(uuid4())
+        self._json = None
+        # (store, audit log entries of this object already written there)
+        self._stored = (None, 0)
+        self.id = incident_id or str(uuid4())
         self.lat = lat
         self.lon = lon
-        self.created_at = datetime.utcnow()
-        self.updated_at = self.created_at
 
         self.input_text = input_text
         self.symptoms = symptoms
 
-        self.urgency = triage_result["urgency"]
+        self.urgency = Urgency(triage_result["urgency"])
         self.dispatch_required = triage_result["dispatch_required"]
         self.reasoning = triage_result["reasoning"]
+        self.rule_version = triage_result.get("rule_version")
 
-        self.status = "TRIAGED"
+        self.status = IncidentStatus.TRIAGED
 
         self.dispatch_decision = None
         self.dispatch_confirmed = False
         self.override_reason = None
+        self.bed_reservation_id = None
 
-        self.audit_log = [
-            {
-                "timestamp": self.created_at.isoformat(),
-                "event": "INCIDENT_CREATED",
-                "details": {
-                    "urgency": self.urgency,
-                    "dispatch_required": self.dispatch_required
-                }
-            }
-        ]
+        self.audit_log = AuditLog()
+        created = self.audit_log.append(
+            "INCIDENT_CREATED",
+            (self.urgency.value, self.dispatch_required, self.rule_version)
+        )
+        self.created_at = utc_datetime(created)
+        self.updated_at = self.created_at
+
+    @property
+    def status(self) -> IncidentStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: IncidentStatus):
+        self._status = value
+        self._json = None
 
     def log_event(self, event: str, details: Dict):
-        self.audit_log.append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "event": event,
-            "details": details
-        })
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utc_datetime(self.audit_log.append(event, details))
+        self._json = None
+
+    def to_dict(self, fields: Sequence[str]) -> Dict:
+        """
+        The given fields as plain values, with the audit log rendered.
+        """
+        data = {f: getattr(self, f) for f in fields}
+        if "audit_log" in data:
+            data["audit_log"] = self.audit_log.to_list()
+        return data
+
+    def to_json(self, fields: Sequence[str], cache: bool = False) -> bytes:
+        """
+        to_dict(fields) encoded as JSON. With cache, the bytes are kept
+        on this object for the next call with the same fields, until
+        log_event() or a status change. Every change made through the
+        incident service goes through one of those; any other field
+        written without them is served stale until the next one.
+
+        Only stores that hand out the same objects benefit (the in-memory
+        IncidentRepository). The SQLite store builds new objects on every
+        read, so there every call encodes afresh.
+        """
+        if not cache:
+            return dumps(self.to_dict(fields))
+
+        # Taken before encoding: if another thread changes the incident
+        # meanwhile, the stamp no longer matches and the bytes are redone
+        stamp = (len(self.audit_log), self._status)
+        cached = self._json
+        if cached is not None and cached[0] == fields and cached[1] == stamp:
+            return cached[2]
+
+        encoded = dumps(self.to_dict(fields))
+        self._json = (fields, stamp, encoded)
+        return encoded
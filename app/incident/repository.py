@@ -1,25 +1,183 @@
-from typing import Dict
+import base64
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from app.core.config import settings
 from app.incident.models import Incident
 
+# (created_at, id): the order incidents are listed and paginated in
+IncidentKey = Tuple[datetime, str]
+
+
+def encode_cursor(incident: Incident) -> str:
+    """
+    Opaque pagination cursor pointing just past this incident.
+    """
+    raw = f"{incident.created_at.isoformat(timespec='microseconds')}|{incident.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> IncidentKey:
+    """
+    Raises ValueError for a cursor that encode_cursor did not produce.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, incident_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), incident_id
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+
+def _remove(keys: list, key):
+    i = bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        del keys[i]
+
 
 class IncidentRepository:
     """
     In-memory incident store.
-    Replace with DB later without changing business logic.
+    See SQLiteIncidentRepository for the persistent backend.
+
+    Keeps sorted (created_at, id) keys per urgency, status and
+    urgency+status, plus (updated_at, id) keys, so query() reads a range
+    of one index instead of scanning every incident.
     """
 
     def __init__(self):
         self._incidents: Dict[str, Incident] = {}
+        self._lock = threading.Lock()
+
+        self._by_created: List[IncidentKey] = []
+        self._by_filter: Dict[tuple, List[IncidentKey]] = {}
+        self._by_updated: List[Tuple[datetime, str]] = []
+        # id -> (filter keys, updated key) as last indexed; the stored
+        # object may already have been mutated by the time it is re-saved
+        self._indexed: Dict[str, tuple] = {}
 
     def save(self, incident: Incident):
+        with self._lock:
+            self._save(incident)
+
+    def save_many(self, incidents: List[Incident]):
+        """
+        Saves several incidents under one lock acquisition.
+        """
+        with self._lock:
+            for incident in incidents:
+                self._save(incident)
+
+    def _save(self, incident: Incident):
+        # Caller holds self._lock
+        key = (incident.created_at, incident.id)
+        filters = (
+            ("urgency", incident.urgency),
+            ("status", incident.status),
+            ("urgency_status", incident.urgency, incident.status)
+        )
+        updated = (incident.updated_at, incident.id)
+
+        old_filters, old_updated = self._indexed.get(incident.id, ((), None))
+        if incident.id not in self._incidents:
+            insort(self._by_created, key)
         self._incidents[incident.id] = incident
 
+        for f in old_filters:
+            if f not in filters:
+                _remove(self._by_filter[f], key)
+        for f in filters:
+            if f not in old_filters:
+                insort(self._by_filter.setdefault(f, []), key)
+
+        if updated != old_updated:
+            if old_updated:
+                _remove(self._by_updated, old_updated)
+            insort(self._by_updated, updated)
+
+        self._indexed[incident.id] = (filters, updated)
+
     def get(self, incident_id: str) -> Incident:
         return self._incidents.get(incident_id)
 
     def all(self):
         return list(self._incidents.values())
 
+    def query(
+        self,
+        urgency: str = None,
+        status: str = None,
+        created_after: datetime = None,
+        created_before: datetime = None,
+        since: datetime = None,
+        after: IncidentKey = None,
+        limit: int = None,
+        audit_log: bool = True
+    ) -> List[Incident]:
+        """
+        Incidents ordered by (created_at, id), oldest first.
+
+        created_after / created_before: created_at window [after, before).
+        since: only incidents updated at or after this time.
+        after: cursor key; only incidents listed after it.
+        audit_log: False lets stores skip loading audit logs.
+        """
+        with self._lock:
+            if since is not None:
+                start = bisect_left(self._by_updated, (since,))
+                keys = sorted((self._incidents[i].created_at, i) for _, i in self._by_updated[start:])
+            elif urgency and status:
+                keys = self._by_filter.get(("urgency_status", urgency, status), [])
+            elif urgency:
+                keys = self._by_filter.get(("urgency", urgency), [])
+            elif status:
+                keys = self._by_filter.get(("status", status), [])
+            else:
+                keys = self._by_created
+
+            start = bisect_right(keys, after) if after else 0
+            if created_after:
+                start = max(start, bisect_left(keys, (created_after,)))
+            end = bisect_left(keys, (created_before,)) if created_before else len(keys)
+
+            results = []
+            for i in range(start, end):
+                incident = self._incidents[keys[i][1]]
+                if (urgency and incident.urgency != urgency) or (status and incident.status != status):
+                    continue
+                results.append(incident)
+                if limit and len(results) == limit:
+                    break
+
+        return results
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def create_repository(database_url: str):
+    """
+    Repository for a DATABASE_URL: empty for in-memory, or
+    sqlite:///path/to/file.db.
+    """
+    if not database_url:
+        return IncidentRepository()
+
+    if database_url.startswith("sqlite:///"):
+        from app.incident.sqlite_repository import SQLiteIncidentRepository
+        return SQLiteIncidentRepository(
+            database_url[len("sqlite:///"):],
+            commit_batch=settings.DB_COMMIT_BATCH,
+            commit_interval_ms=settings.DB_COMMIT_INTERVAL_MS
+        )
+
+    raise ValueError(f"Unsupported DATABASE_URL: {database_url}")
+
 
-# Singleton instance (for now)
-incident_repository = IncidentRepository()
+# Singleton instance
+incident_repository = create_repository(settings.DATABASE_URL)
@@ -1,6 +1,29 @@
-from app.incident.models import Incident
+from typing import Dict, List
+
+from app.incident.models import INCIDENT_FIELDS, Incident, IncidentStatus
 from app.incident.repository import incident_repository
 from app.dispatch.dispatch_engine import recommend_dispatch
+from app.dispatch.fleet import fleet
+from app.routing.capacity import bed_capacity
+from app.core.events import event_bus
+from app.core.metrics import count_incident, time_stage
+
+
+def _save(incident: Incident, event_type: str = "incident.updated"):
+    with time_stage("repository_save"):
+        incident_repository.save(incident)
+
+    # Push the new state to /incidents/stream subscribers
+    if event_bus.subscriber_count:
+        with time_stage("publish"):
+            event_bus.publish(event_type, incident.id, incident.to_dict(INCIDENT_FIELDS))
+
+
+def update_incident(incident: Incident):
+    """
+    Saves changes made to an incident outside this module.
+    """
+    _save(incident)
 
 
 def create_incident(
@@ -8,29 +31,75 @@ def create_incident(
     symptoms: list,
     triage_result: dict,
     lat: float = None,
-    lon: float = None
+    lon: float = None,
+    incident_id: str = None,
+    channel: str = "api",
+    hold_resources: bool = True
 ) -> Incident:
+    """
+    hold_resources: hold a bed and assign a unit for the dispatch
+    recommendation (see recommend_dispatch). Off for calls that are not
+    live, so they never tie up real beds or ambulances.
+    """
     incident = Incident(
         input_text=input_text,
         symptoms=symptoms,
         triage_result=triage_result,
         lat=lat,
-        lon=lon
+        lon=lon,
+        incident_id=incident_id
     )
 
-    incident_repository.save(incident)
-    
     # Generate Dispatch Recommendation
-    rec = recommend_dispatch(incident)
+    with time_stage("dispatch"):
+        rec = recommend_dispatch(incident, hold=hold_resources)
     if rec:
+        incident.bed_reservation_id = rec["bed_reservation_id"]
         incident.log_event("DISPATCH_RECOMMENDED", rec)
-        # Update incident so recommendation persists in audit log immediately? 
-        # (It's in-memory object, repository save might be needed again if we were using a real DB, 
-        # but here it modifies the object reference which is stored in the list/mock DB).
-    
+
+    _save(incident, "incident.created")
+    count_incident(incident.urgency, channel)
+
     return incident
 
 
+def create_incidents(records: List[Dict], channel: str = "batch", hold_resources: bool = False) -> List[Incident]:
+    """
+    Bulk create_incident: each record holds create_incident's arguments
+    (input_text, symptoms, triage_result and optionally lat / lon). The
+    incidents are saved to the repository in one call.
+
+    Bulk input is usually backfill, so by default no beds or units are
+    held for it; pass hold_resources=True for live calls.
+    """
+    incidents = []
+    for record in records:
+        incident = Incident(**record)
+        with time_stage("dispatch"):
+            rec = recommend_dispatch(incident, hold=hold_resources)
+        if rec:
+            incident.bed_reservation_id = rec["bed_reservation_id"]
+            incident.log_event("DISPATCH_RECOMMENDED", rec)
+        incidents.append(incident)
+
+    try:
+        with time_stage("repository_save_many"):
+            incident_repository.save_many(incidents)
+    except Exception:
+        # None of the incidents exist; free what was held for them
+        for incident in incidents:
+            _release_bed(incident)
+            fleet.release(incident.id)
+        raise
+
+    for incident in incidents:
+        if event_bus.subscriber_count:
+            event_bus.publish("incident.created", incident.id, incident.to_dict(INCIDENT_FIELDS))
+        count_incident(incident.urgency, channel)
+
+    return incidents
+
+
 def confirm_dispatch(incident_id: str, dispatch_decision: dict):
     incident = incident_repository.get(incident_id)
     if not incident:
@@ -38,30 +107,55 @@ def confirm_dispatch(incident_id: str, dispatch_decision: dict):
 
     incident.dispatch_decision = dispatch_decision
     incident.dispatch_confirmed = True
-    incident.status = "DISPATCH_CONFIRMED"
+    incident.status = IncidentStatus.DISPATCH_CONFIRMED
 
     incident.log_event(
         "DISPATCH_CONFIRMED",
         dispatch_decision
     )
 
+    if incident.bed_reservation_id and not bed_capacity.commit(incident.bed_reservation_id):
+        incident.log_event(
+            "BED_RESERVATION_EXPIRED",
+            {"reservation_id": incident.bed_reservation_id}
+        )
+        incident.bed_reservation_id = None
+
+    _save(incident)
+
     return incident
 
 
+def _release_bed(incident):
+    if incident.bed_reservation_id:
+        bed_capacity.release(incident.bed_reservation_id)
+        incident.bed_reservation_id = None
+
+
+def _release_unit(incident, completed: bool = False):
+    unit = fleet.release(incident.id, completed=completed)
+    if unit:
+        incident.log_event("UNIT_RELEASED", {"unit_id": unit.id})
+
+
 def override_dispatch(incident_id: str, reason: str):
     incident = incident_repository.get(incident_id)
     if not incident:
         raise ValueError("Incident not found")
 
     incident.dispatch_confirmed = False
-    incident.status = "DISPATCH_OVERRIDDEN"
+    incident.status = IncidentStatus.DISPATCH_OVERRIDDEN
     incident.override_reason = reason
+    _release_bed(incident)
+    _release_unit(incident)
 
     incident.log_event(
         "DISPATCH_OVERRIDDEN",
         {"reason": reason}
     )
 
+    _save(incident)
+
     return incident
 
 
@@ -70,13 +164,15 @@ def request_manual_review(incident_id: str, reason: str = "User requested review
     if not incident:
         raise ValueError("Incident not found")
 
-    incident.status = "MANUAL_REVIEW_REQUESTED"
+    incident.status = IncidentStatus.MANUAL_REVIEW_REQUESTED
     
     incident.log_event(
         "MANUAL_REVIEW_REQUESTED",
         {"reason": reason}
     )
 
+    _save(incident)
+
     return incident
 
 
@@ -85,12 +181,35 @@ def deny_dispatch(incident_id: str, reason: str = "User denied dispatch"):
     if not incident:
         raise ValueError("Incident not found")
 
-    incident.status = "DISPATCH_DENIED"
+    incident.status = IncidentStatus.DISPATCH_DENIED
     incident.dispatch_confirmed = False
+    _release_bed(incident)
+    _release_unit(incident)
     
     incident.log_event(
         "DISPATCH_DENIED",
         {"reason": reason}
     )
 
+    _save(incident)
+
+    return incident
+
+
+def complete_incident(incident_id: str):
+    """
+    The patient has been handed over: the ambulance is free again, at the
+    receiving hospital. The bed stays occupied.
+    """
+    incident = incident_repository.get(incident_id)
+    if not incident:
+        raise ValueError("Incident not found")
+
+    incident.status = IncidentStatus.COMPLETED
+    _release_unit(incident, completed=True)
+
+    incident.log_event("INCIDENT_COMPLETED", {})
+
+    _save(incident)
+
     return incident
@@ -0,0 +1,350 @@
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.incident.models import AuditLog, Incident, IncidentStatus, Urgency, epoch_us
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS incidents (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    lat REAL,
+    lon REAL,
+    input_text TEXT NOT NULL,
+    symptoms TEXT NOT NULL,
+    urgency TEXT NOT NULL,
+    dispatch_required INTEGER NOT NULL,
+    reasoning TEXT NOT NULL,
+    rule_version TEXT,
+    status TEXT NOT NULL,
+    dispatch_decision TEXT,
+    dispatch_confirmed INTEGER NOT NULL,
+    override_reason TEXT,
+    bed_reservation_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_incidents_created ON incidents (created_at, id);
+CREATE INDEX IF NOT EXISTS idx_incidents_urgency ON incidents (urgency, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_incidents_status ON incidents (status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_incidents_urgency_status ON incidents (urgency, status, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_incidents_updated ON incidents (updated_at);
+
+CREATE TABLE IF NOT EXISTS incident_events (
+    incident_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    event TEXT NOT NULL,
+    details TEXT NOT NULL,
+    PRIMARY KEY (incident_id, seq)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS incident_events_no_update
+BEFORE UPDATE ON incident_events
+BEGIN SELECT RAISE(ABORT, 'incident_events is append-only'); END;
+
+CREATE TRIGGER IF NOT EXISTS incident_events_no_delete
+BEFORE DELETE ON incident_events
+BEGIN SELECT RAISE(ABORT, 'incident_events is append-only'); END;
+"""
+
+INCIDENT_COLUMNS = (
+    "id", "created_at", "updated_at", "lat", "lon", "input_text", "symptoms",
+    "urgency", "dispatch_required", "reasoning", "rule_version", "status",
+    "dispatch_decision", "dispatch_confirmed", "override_reason", "bed_reservation_id"
+)
+
+# Columns that can change after an incident is created
+MUTABLE_COLUMNS = (
+    "updated_at", "status", "dispatch_decision", "dispatch_confirmed",
+    "override_reason", "bed_reservation_id"
+)
+
+UPSERT_INCIDENT = (
+    f"INSERT INTO incidents ({', '.join(INCIDENT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in INCIDENT_COLUMNS)}) "
+    f"ON CONFLICT (id) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in MUTABLE_COLUMNS)}"
+)
+NEXT_EVENT_SEQ = "SELECT COALESCE(MAX(seq) + 1, 0) FROM incident_events WHERE incident_id = ?"
+INSERT_EVENT = "INSERT INTO incident_events (incident_id, seq, timestamp, event, details) VALUES (?, ?, ?, ?, ?)"
+SELECT_INCIDENT = f"SELECT {', '.join(INCIDENT_COLUMNS)} FROM incidents WHERE id = ?"
+SELECT_INCIDENTS = f"SELECT {', '.join(INCIDENT_COLUMNS)} FROM incidents ORDER BY created_at, rowid"
+QUERY_INCIDENTS = f"SELECT {', '.join(INCIDENT_COLUMNS)} FROM incidents"
+SELECT_EVENTS = "SELECT timestamp, event, details FROM incident_events WHERE incident_id = ? ORDER BY seq"
+SELECT_ALL_EVENTS = "SELECT incident_id, timestamp, event, details FROM incident_events ORDER BY incident_id, seq"
+
+# Events for one page of incidents, in chunks to stay under SQLite's
+# bound-parameter limit
+EVENTS_CHUNK = 500
+
+
+def _timestamp(value: datetime) -> str:
+    # Fixed width, so stored timestamps compare correctly as text
+    return value.isoformat(timespec="microseconds")
+
+
+def _dumps(value) -> Optional[str]:
+    return None if value is None else json.dumps(value, default=str)
+
+
+def _loads(value):
+    return None if value is None else json.loads(value)
+
+
+def _event(timestamp: str, event: str, details: str) -> Tuple[int, str, Dict]:
+    # (epoch microseconds, event, details), as AuditLog takes them
+    return epoch_us(datetime.fromisoformat(timestamp)), event, json.loads(details)
+
+
+class SQLiteIncidentRepository:
+    """
+    SQLite incident store with the same save / get / all interface as the
+    in-memory IncidentRepository.
+
+    Runs in WAL mode so several processes (e.g. uvicorn workers) can share
+    one database file. Writes are grouped: a transaction is committed after
+    commit_batch saves or commit_interval_ms, whichever comes first (0 ms
+    commits every save). Reads go through the same connection, so this
+    process always sees its own uncommitted writes.
+
+    Audit events live in their own append-only table; save() only inserts
+    the events this copy of the incident added since it was loaded or last
+    saved, after any stored meanwhile by other copies.
+    """
+
+    def __init__(self, path: str, commit_batch: int = 64, commit_interval_ms: float = 50):
+        self.path = path
+        self.commit_batch = max(1, commit_batch)
+        self.commit_interval = commit_interval_ms / 1000
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+
+        # isolation_level=None: transactions are opened explicitly below.
+        # SQL strings are constants, so sqlite3's statement cache keeps
+        # them prepared for the life of the connection.
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        # Commit whatever is still grouped when the interpreter exits
+        atexit.register(self.close)
+
+        if self.commit_interval > 0:
+            threading.Thread(target=self._flush_periodically, name="incident-db-flush", daemon=True).start()
+
+    def _flush_periodically(self):
+        while not self._closed:
+            time.sleep(self.commit_interval)
+            self.flush()
+
+    def _commit(self):
+        # Caller holds self._lock
+        if self._pending:
+            self._conn.execute("COMMIT")
+            self._pending = 0
+
+    def flush(self):
+        """
+        Commits any grouped writes now.
+        """
+        with self._lock:
+            if not self._closed:
+                self._commit()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._commit()
+            self._closed = True
+            self._conn.close()
+
+    def _row(self, incident: Incident) -> tuple:
+        return (
+            incident.id,
+            _timestamp(incident.created_at),
+            _timestamp(incident.updated_at),
+            incident.lat,
+            incident.lon,
+            incident.input_text,
+            _dumps(incident.symptoms),
+            incident.urgency,
+            int(incident.dispatch_required),
+            _dumps(incident.reasoning),
+            incident.rule_version,
+            incident.status,
+            _dumps(incident.dispatch_decision),
+            int(incident.dispatch_confirmed),
+            incident.override_reason,
+            incident.bed_reservation_id
+        )
+
+    def _write(self, incident: Incident, row: tuple) -> int:
+        # Caller holds self._lock and has begun a transaction. Returns how
+        # many of the incident's audit log entries are stored after this.
+        self._conn.execute(UPSERT_INCIDENT, row)
+
+        # Events this copy added since it was loaded from or last saved to
+        # this store go after whatever is stored, so an event added
+        # meanwhile through another copy is kept, not overwritten. A clash
+        # on (incident_id, seq) raises rather than dropping an event.
+        start = self._conn.execute(NEXT_EVENT_SEQ, (incident.id,)).fetchone()[0]
+        store, stored = incident._stored
+        if store != self.path:
+            # Not loaded from or saved to this store: treat what is stored as its own
+            stored = start
+        new_events = incident.audit_log[stored:]
+        self._conn.executemany(INSERT_EVENT, [
+            (incident.id, seq, entry["timestamp"], entry["event"], _dumps(entry["details"]))
+            for seq, entry in enumerate(new_events, start)
+        ])
+        self._pending += 1
+        return stored + len(new_events)
+
+    def save(self, incident: Incident):
+        self.save_many([incident])
+
+    def save_many(self, incidents: List[Incident]):
+        """
+        Saves several incidents, all or none: if one fails, none of the
+        group is written and the error is raised. The group is committed
+        together with any other pending saves.
+        """
+        rows = [self._row(incident) for incident in incidents]
+
+        with self._lock:
+            pending = self._pending
+            if not pending:
+                self._conn.execute("BEGIN")
+
+            # A savepoint for the group: a failure undoes it without
+            # dropping the other saves grouped into this transaction
+            self._conn.execute("SAVEPOINT save_group")
+            try:
+                stored = [self._write(incident, row) for incident, row in zip(incidents, rows)]
+            except Exception:
+                self._conn.execute("ROLLBACK TO save_group")
+                self._conn.execute("RELEASE save_group")
+                self._pending = pending
+                if not pending:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("RELEASE save_group")
+            for incident, count in zip(incidents, stored):
+                incident._stored = (self.path, count)
+
+            if not self._pending:
+                # Nothing was written; don't leave an empty transaction open
+                self._conn.execute("ROLLBACK")
+            elif self._pending >= self.commit_batch or self.commit_interval <= 0:
+                self._commit()
+
+    def _to_incident(self, row, audit_log: List[Tuple[int, str, Dict]]) -> Incident:
+        fields = dict(zip(INCIDENT_COLUMNS, row))
+
+        incident = Incident.__new__(Incident)
+        incident._json = None
+        incident.id = fields["id"]
+        incident.lat = fields["lat"]
+        incident.lon = fields["lon"]
+        incident.created_at = datetime.fromisoformat(fields["created_at"])
+        incident.updated_at = datetime.fromisoformat(fields["updated_at"])
+        incident.input_text = fields["input_text"]
+        incident.symptoms = _loads(fields["symptoms"])
+        incident.urgency = Urgency(fields["urgency"])
+        incident.dispatch_required = bool(fields["dispatch_required"])
+        incident.reasoning = _loads(fields["reasoning"])
+        incident.rule_version = fields["rule_version"]
+        incident.status = IncidentStatus(fields["status"])
+        incident.dispatch_decision = _loads(fields["dispatch_decision"])
+        incident.dispatch_confirmed = bool(fields["dispatch_confirmed"])
+        incident.override_reason = fields["override_reason"]
+        incident.bed_reservation_id = fields["bed_reservation_id"]
+        incident.audit_log = AuditLog(audit_log)
+        incident._stored = (self.path, len(incident.audit_log))
+        return incident
+
+    def get(self, incident_id: str) -> Optional[Incident]:
+        with self._lock:
+            row = self._conn.execute(SELECT_INCIDENT, (incident_id,)).fetchone()
+            if row is None:
+                return None
+            events = self._conn.execute(SELECT_EVENTS, (incident_id,)).fetchall()
+
+        return self._to_incident(row, [_event(*e) for e in events])
+
+    def all(self) -> List[Incident]:
+        with self._lock:
+            rows = self._conn.execute(SELECT_INCIDENTS).fetchall()
+            events = self._conn.execute(SELECT_ALL_EVENTS).fetchall()
+
+        audit_logs: Dict[str, List[Tuple[int, str, Dict]]] = {}
+        for incident_id, *event in events:
+            audit_logs.setdefault(incident_id, []).append(_event(*event))
+
+        return [self._to_incident(row, audit_logs.get(row[0], [])) for row in rows]
+
+    def query(
+        self,
+        urgency: str = None,
+        status: str = None,
+        created_after: datetime = None,
+        created_before: datetime = None,
+        since: datetime = None,
+        after: Tuple[datetime, str] = None,
+        limit: int = None,
+        audit_log: bool = True
+    ) -> List[Incident]:
+        """
+        Same as IncidentRepository.query; each filter maps onto an index.
+        """
+        clauses, params = [], []
+        if urgency:
+            clauses.append("urgency = ?")
+            params.append(urgency)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if created_after:
+            clauses.append("created_at >= ?")
+            params.append(_timestamp(created_after))
+        if created_before:
+            clauses.append("created_at < ?")
+            params.append(_timestamp(created_before))
+        if since:
+            clauses.append("updated_at >= ?")
+            params.append(_timestamp(since))
+        if after:
+            clauses.append("(created_at, id) > (?, ?)")
+            params.extend((_timestamp(after[0]), after[1]))
+
+        sql = QUERY_INCIDENTS
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at, id"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        audit_logs: Dict[str, List[Tuple[int, str, Dict]]] = {}
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+            if audit_log:
+                ids = [row[0] for row in rows]
+                for start in range(0, len(ids), EVENTS_CHUNK):
+                    chunk = ids[start:start + EVENTS_CHUNK]
+                    for incident_id, *event in self._conn.execute(
+                        "SELECT incident_id, timestamp, event, details FROM incident_events "
+                        f"WHERE incident_id IN ({', '.join('?' for _ in chunk)}) ORDER BY incident_id, seq",
+                        chunk
+                    ):
+                        audit_logs.setdefault(incident_id, []).append(_event(*event))
+
+        return [self._to_incident(row, audit_logs.get(row[0], [])) for row in rows]
@@ -0,0 +1,204 @@
+import queue
+import threading
+import time
+from typing import Dict, List
+from uuid import uuid4
+
+from app.core.cache import normalize_transcript, symptom_cache
+from app.core.config import settings
+from app.core.metrics import observe_stage
+from app.core.ruleset import rule_store
+from app.core.stats import LatencyWindow
+from app.ingest.priority_queue import PriorityWorkQueue
+from app.incident.service import create_incident
+from app.medical_nlp.extractor import MODEL_VERSION, extract_medical_entities
+from app.medical_nlp.normalizer import normalize_entities
+from app.triage.triage_engine import triage
+
+STAGES = ("extract", "normalize", "triage", "create")
+
+# Queue levels, most urgent first. Transcripts the keyword pre-screen
+# cannot place wait at MEDIUM, ahead of ones it recognizes as LOW.
+PRIORITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+UNSCREENED_PRIORITY = "MEDIUM"
+
+
+def provisional_priority(transcript: str, ruleset=None) -> str:
+    """
+    Priority from a keyword pre-screen against the rule set's
+    symptom_severity table, before any NLP runs.
+    """
+    screen = (ruleset or rule_store.current()).severity_screen
+    level = screen.level(transcript)
+    if level is None or screen.levels[level] not in PRIORITIES:
+        return UNSCREENED_PRIORITY
+    return screen.levels[level]
+
+
+class IngestJob:
+    __slots__ = ("incident_id", "transcript", "source", "channel", "priority", "enqueued_at")
+
+    def __init__(self, transcript: str, source: str = None, priority: str = UNSCREENED_PRIORITY, channel: str = "sms"):
+        # Assigned up front so the caller can quote it before processing
+        self.incident_id = str(uuid4())
+        self.transcript = transcript
+        self.source = source
+        self.channel = channel
+        self.priority = priority
+        self.enqueued_at = time.monotonic()
+
+
+class IngestQueue:
+    """
+    Bounded queue of transcripts drained by a pool of NLP worker threads,
+    so webhooks can acknowledge before extraction and triage run.
+
+    Transcripts are served by provisional priority (see
+    provisional_priority), with aging so LOW items are not starved; with
+    prioritize=False they are served FIFO.
+
+    Tracks queue depth, time spent waiting in the queue, latency of each
+    pipeline stage, and time-to-triage by final urgency (see stats()).
+    """
+
+    def __init__(self, maxsize: int, workers: int, aging_seconds: float = 0, prioritize: bool = True):
+        self.maxsize = maxsize
+        self.workers = workers
+        self.prioritize = prioritize
+        self._queue = PriorityWorkQueue(len(PRIORITIES), maxsize, aging_seconds)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+        self.counts = {"enqueued": 0, "processed": 0, "failed": 0, "rejected": 0}
+        self.wait = LatencyWindow()
+        self.stages = {stage: LatencyWindow() for stage in STAGES}
+        self.total = LatencyWindow()
+        self.time_to_triage: Dict[str, LatencyWindow] = {}
+
+    def _count(self, name: str):
+        with self._lock:
+            self.counts[name] += 1
+
+    def start(self):
+        """
+        Starts the workers (once).
+        """
+        with self._lock:
+            if self._threads:
+                return
+            self._queue.reopen()
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"ingest-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float = 5):
+        """
+        Lets the workers finish what is queued, then stops them.
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        self._queue.close()
+        for thread in threads:
+            thread.join(timeout)
+
+    def submit(self, transcript: str, source: str = None, channel: str = "sms") -> IngestJob:
+        """
+        Queues a transcript and returns its job (with the incident id it
+        will be created under). Raises queue.Full if the queue is full.
+        """
+        self.start()
+
+        priority = provisional_priority(transcript) if self.prioritize else UNSCREENED_PRIORITY
+        job = IngestJob(transcript, source, priority, channel)
+        try:
+            self._queue.put_nowait(job, PRIORITIES.index(priority) if self.prioritize else 0)
+        except queue.Full:
+            self._count("rejected")
+            raise
+
+        self._count("enqueued")
+        return job
+
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                # Closed and drained
+                return
+
+            self.wait.observe(time.monotonic() - job.enqueued_at)
+            try:
+                self.process(job)
+                self._count("processed")
+            except Exception as e:
+                self._count("failed")
+                print(f"Error processing transcript: {e}")
+
+    def process(self, job: IngestJob):
+        start = time.monotonic()
+        ruleset = rule_store.current()
+
+        text = normalize_transcript(job.transcript)
+        version = (MODEL_VERSION, ruleset.version)
+        key = symptom_cache.key(text)
+
+        # A cache hit skips both extract and normalize
+        symptoms = symptom_cache.get(key, version)
+        if symptoms is None:
+            extracted = extract_medical_entities(text)
+            t1 = time.monotonic()
+            symptoms = normalize_entities(extracted["entities"], ruleset)["symptoms"]
+            t2 = time.monotonic()
+            symptom_cache.put(key, version, tuple(symptoms))
+        else:
+            symptoms = list(symptoms)
+            t1 = t2 = time.monotonic()
+
+        triage_result = triage(symptoms, ruleset)
+        t3 = time.monotonic()
+        self._time_to_triage(triage_result["urgency"]).observe(t3 - job.enqueued_at)
+        incident = create_incident(
+            input_text=job.transcript,
+            symptoms=symptoms,
+            triage_result=triage_result,
+            incident_id=job.incident_id,
+            channel=job.channel
+        )
+        end = time.monotonic()
+
+        for stage, seconds in zip(STAGES, (t1 - start, t2 - t1, t3 - t2, end - t3)):
+            self.stages[stage].observe(seconds)
+            observe_stage(stage, seconds)
+        self.total.observe(end - job.enqueued_at)
+        return incident
+
+    def _time_to_triage(self, urgency: str) -> LatencyWindow:
+        window = self.time_to_triage.get(urgency)
+        if window is None:
+            with self._lock:
+                window = self.time_to_triage.setdefault(urgency, LatencyWindow())
+        return window
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counts = dict(self.counts)
+        depths = self._queue.depths()
+        return {
+            "depth": self.depth(),
+            "depth_by_priority": dict(zip(PRIORITIES, depths)) if self.prioritize else {},
+            "capacity": self.maxsize,
+            "workers": self.workers,
+            **counts,
+            "wait": self.wait.summary(),
+            "stages": {stage: window.summary() for stage, window in self.stages.items()},
+            "enqueue_to_incident": self.total.summary(),
+            "time_to_triage": {urgency: window.summary() for urgency, window in list(self.time_to_triage.items())}
+        }
+
+
+# Singleton instance
+ingest_queue = IngestQueue(settings.INGEST_QUEUE_SIZE, settings.INGEST_WORKERS, settings.INGEST_AGING_SECONDS)
@@ -0,0 +1,90 @@
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, List, Optional
+
+
+class PriorityWorkQueue:
+    """
+    Bounded multi-level FIFO queue: level 0 is served first.
+
+    Aging keeps low levels from starving: an item is treated as one level
+    more urgent for every aging_seconds it has waited, up to level 1. Aged
+    items never outrank level 0, so that level is always served first;
+    everything else is eventually served under sustained load. Within a
+    level, order is FIFO.
+    """
+
+    def __init__(self, levels: int, maxsize: int = 0, aging_seconds: float = 0):
+        self.maxsize = maxsize
+        self.aging_seconds = aging_seconds
+        self._levels: List[deque] = [deque() for _ in range(levels)]
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def qsize(self) -> int:
+        return self._size
+
+    def depths(self) -> List[int]:
+        return [len(level) for level in self._levels]
+
+    def put_nowait(self, item: Any, level: int):
+        """
+        Raises queue.Full if the queue is at maxsize.
+        """
+        level = min(max(level, 0), len(self._levels) - 1)
+        with self._cond:
+            if self.maxsize and self._size >= self.maxsize:
+                raise queue.Full
+            self._levels[level].append((time.monotonic(), item))
+            self._size += 1
+            self._cond.notify()
+
+    def _pop(self) -> Any:
+        # Caller holds self._cond and the queue is not empty. Each level's
+        # head is its oldest item, so only heads need comparing.
+        now = time.monotonic()
+        best, best_key = None, None
+        for level, items in enumerate(self._levels):
+            if not items:
+                continue
+            enqueued_at = items[0][0]
+            effective = level
+            if self.aging_seconds and level > 1:
+                effective = max(1, level - int((now - enqueued_at) / self.aging_seconds))
+            key = (effective, enqueued_at)
+            if best_key is None or key < best_key:
+                best, best_key = level, key
+
+        self._size -= 1
+        return self._levels[best].popleft()[1]
+
+    def get(self, timeout: float = None) -> Optional[Any]:
+        """
+        Next item, blocking until one is available. Returns None once the
+        queue is closed and empty, or on timeout.
+        """
+        with self._cond:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self._size:
+                if self._closed:
+                    return None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+            return self._pop()
+
+    def close(self):
+        """
+        Wakes every waiting get(); they return None once the queue drains.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def reopen(self):
+        with self._cond:
+            self._closed = False
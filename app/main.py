@@ -1,11 +1,47 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.batch import router as batch_router
+from app.api.fleet import router as fleet_router
+from app.api.health import router as health_router
+from app.api.ingest import router as ingest_router
+from app.api.metrics import router as metrics_router
 from app.api.routes import router as api_router
+from app.api.rules import router as rules_router
+from app.api.simulation import router as simulation_router
+from app.api.stream import router as stream_router
 from app.api.webhooks import router as webhook_router
+from app.core.config import settings
+from app.core.executor import AnalysisBusy, analysis_executor
+from app.core.models import model_registry
+from app.core.ruleset import rule_store
+from app.incident.repository import incident_repository
+from app.ingest.ingest_queue import ingest_queue
 from app.simulation import run_simulation
 
-app = FastAPI(title="T.A.L.O.N.")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Before any other threads start: process mode forks its workers here
+    analysis_executor.start()
+    # Start answering immediately; models load in the background
+    if settings.MODEL_WARMUP:
+        model_registry.warm()
+    if settings.RULES_WATCH_SECONDS > 0:
+        rule_store.watch(settings.RULES_WATCH_SECONDS)
+    ingest_queue.start()
+    yield
+    ingest_queue.stop()
+    analysis_executor.stop()
+    # Commit, but keep the connection: the app may be started again in this
+    # process (e.g. another TestClient); it is closed at interpreter exit
+    incident_repository.flush()
+
+
+app = FastAPI(title="T.A.L.O.N.", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -13,9 +49,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
+    expose_headers=["X-Next-Cursor"],
 )
 
+@app.exception_handler(AnalysisBusy)
+def analysis_busy(request: Request, exc: AnalysisBusy):
+    # Too many analyses in flight: shed load instead of queueing without bound
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "5"})
+
+
+app.include_router(health_router)
 app.include_router(api_router)
+app.include_router(batch_router)
+app.include_router(rules_router)
+app.include_router(fleet_router)
+app.include_router(simulation_router)
+app.include_router(ingest_router)
+app.include_router(metrics_router)
+app.include_router(stream_router)
 app.include_router(webhook_router)
 
 
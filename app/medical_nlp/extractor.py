@@ -1,23 +1,105 @@
-import spacy
-from typing import List, Dict
+from importlib import metadata
+from typing import TYPE_CHECKING, Dict, Iterable, List
 
-# Load models once (important for performance)
-BASE_NLP = spacy.load("en_core_sci_sm")
-DISEASE_NLP = spacy.load("en_ner_bc5cdr_md")
-CLINICAL_NLP = spacy.load("en_ner_jnlpba_md")
+from app.core.config import settings
+from app.core.models import model_registry
 
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
 
-def extract_medical_entities(text: str) -> Dict:
+# scispaCy models we run over every transcript. They all ship the same
+# rule-based tokenizer, so the first model's tokenization is shared.
+MODEL_NAMES = ("en_core_sci_sm", "en_ner_bc5cdr_md", "en_ner_jnlpba_md")
+
+# Pipes we never read from. Only NER (and the tok2vec it listens to) is
+# needed to populate doc.ents.
+UNUSED_PIPES = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+
+def _model_version(model_names: Iterable[str] = MODEL_NAMES) -> str:
+    versions = []
+    for name in model_names:
+        try:
+            versions.append(f"{name}=={metadata.version(name)}")
+        except metadata.PackageNotFoundError:
+            versions.append(name)
+    return ",".join(versions)
+
+
+# Installed model packages; part of every cached analysis's key
+MODEL_VERSION = _model_version()
+
+
+class ExtractionEngine:
     """
-    Extracts medical symptoms and clinical entities from free-text input.
-    This layer extracts FACTS only, not diagnoses.
+    Runs the NER component of every model over a single tokenization.
+
+    The text is tokenized once by the base model. Every other model receives
+    a Doc rebuilt from those tokens in its own vocab, because its NER layer
+    reads that vocab's word vectors.
     """
 
+    def __init__(self, model_names: Iterable[str] = MODEL_NAMES):
+        # spaCy itself is imported here so that importing this module stays cheap
+        import spacy
+        from spacy.tokens import Doc
+
+        self._doc_cls = Doc
+        self.models = [
+            spacy.load(name, exclude=UNUSED_PIPES) for name in model_names
+        ]
+        self.tokenizer = self.models[0].tokenizer
+
+    def _share(self, doc: "Doc", nlp) -> "Doc":
+        if nlp.vocab is doc.vocab:
+            return doc
+        return self._doc_cls(
+            nlp.vocab,
+            words=[token.text for token in doc],
+            spaces=[bool(token.whitespace_) for token in doc]
+        )
+
+    def _share_all(self, docs: Iterable["Doc"], nlp) -> Iterable["Doc"]:
+        for doc in docs:
+            yield self._share(doc, nlp)
+
+    def extract(self, text: str) -> Dict:
+        tokens = self.tokenizer(text)
+        docs = [nlp(self._share(tokens, nlp)) for nlp in self.models]
+        return {
+            "raw_text": text,
+            "entities": collect_entities(docs)
+        }
+
+    def extract_batch(self, texts: Iterable[str], batch_size: int, n_process: int) -> List[Dict]:
+        texts = list(texts)
+        tokens = list(self.tokenizer.pipe(texts, batch_size=batch_size))
+        per_model = [
+            nlp.pipe(
+                self._share_all(tokens, nlp),
+                batch_size=batch_size,
+                n_process=n_process
+            )
+            for nlp in self.models
+        ]
+        return [
+            {
+                "raw_text": text,
+                "entities": collect_entities(docs)
+            }
+            for text, docs in zip(texts, zip(*per_model))
+        ]
+
+
+def collect_entities(docs: Iterable["Doc"]) -> List[Dict]:
+    """
+    Merges entities from several docs, keeping the first occurrence of each
+    (lowercased text, label) pair.
+    """
     entities = []
     seen = set()
 
-    for nlp in (BASE_NLP, DISEASE_NLP, CLINICAL_NLP):
-        doc = nlp(text)
+    for doc in docs:
         for ent in doc.ents:
             key = (ent.text.lower(), ent.label_)
             if key not in seen:
@@ -27,7 +109,32 @@ def extract_medical_entities(text: str) -> Dict:
                     "label": ent.label_
                 })
 
-    return {
-        "raw_text": text,
-        "entities": entities
-    }
+    return entities
+
+
+# Models are loaded once, on first use or by the startup warmup
+model_registry.register("medical_ner", ExtractionEngine)
+
+
+def extract_medical_entities(text: str) -> Dict:
+    """
+    Extracts medical symptoms and clinical entities from free-text input.
+    This layer extracts FACTS only, not diagnoses.
+    """
+    return model_registry.get("medical_ner").extract(text)
+
+
+def extract_medical_entities_batch(
+    texts: Iterable[str],
+    batch_size: int = None,
+    n_process: int = None
+) -> List[Dict]:
+    """
+    Batched version of extract_medical_entities built on nlp.pipe.
+    Results are returned in input order and match the single-text path.
+    """
+    return model_registry.get("medical_ner").extract_batch(
+        texts,
+        batch_size=batch_size or settings.NLP_BATCH_SIZE,
+        n_process=n_process or settings.NLP_N_PROCESS
+    )
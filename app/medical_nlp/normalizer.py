@@ -1,46 +1,14 @@
 from typing import List, Dict
 
-# Canonical medical symptom dictionary
-# key = canonical symptom
-# values = phrases that map to it
-CANONICAL_SYMPTOMS = {
-    "chest pain": [
-        "chest pain",
-        "chest tightness",
-        "pressure in chest"
-    ],
-    "dyspnea": [
-        "shortness of breath",
-        "difficulty breathing",
-        "breathing difficulty",
-        "shortness"
-    ],
-    "diaphoresis": [
-        "sweating",
-        "excessive sweating",
-        "cold sweat"
-    ],
-    "dizziness": [
-        "dizziness",
-        "lightheaded",
-        "lightheadedness"
-    ],
-    "unconsciousness": [
-        "unconscious",
-        "passed out",
-        "not responding"
-    ],
-    "seizure": [
-        "seizure",
-        "convulsions",
-        "fits"
-    ]
-}
+from app.core.ruleset import RuleSet, rule_store
 
-def normalize_entities(entities: List[Dict]) -> Dict:
+
+def normalize_entities(entities: List[Dict], ruleset: RuleSet = None) -> Dict:
     """
     Converts raw extracted entities into canonical medical symptoms.
+    The canonical symptom dictionary comes from the active rule set.
     """
+    matcher = (ruleset or rule_store.current()).symptom_matcher
 
     normalized = set()
     matched_phrases = []
@@ -48,14 +16,12 @@ def normalize_entities(entities: List[Dict]) -> Dict:
     for entity in entities:
         text = entity["text"].lower()
 
-        for canonical, variants in CANONICAL_SYMPTOMS.items():
-            for phrase in variants:
-                if phrase in text:
-                    normalized.add(canonical)
-                    matched_phrases.append({
-                        "original": entity["text"],
-                        "normalized": canonical
-                    })
+        for canonical in matcher.match(text):
+            normalized.add(canonical)
+            matched_phrases.append({
+                "original": entity["text"],
+                "normalized": canonical
+            })
 
     return {
         "symptoms": sorted(list(normalized)),
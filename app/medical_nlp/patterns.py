@@ -0,0 +1,139 @@
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class PhraseAutomaton:
+    """
+    Aho-Corasick automaton over a fixed list of phrases.
+
+    Compiled once; find_all() then reports every phrase that occurs as a
+    substring of a text in a single pass over that text, independent of
+    how many phrases were compiled in.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases = list(phrases)
+
+        # Node 0 is the root. Per node: outgoing edges, failure link,
+        # ids of phrases ending exactly here, and the nearest node on the
+        # failure chain that has outputs of its own.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._dict_link: List[int] = [0]
+
+        # "" is a substring of every text
+        self._always: List[int] = []
+
+        for phrase_id, phrase in enumerate(self.phrases):
+            if not phrase:
+                self._always.append(phrase_id)
+                continue
+            self._out[self._insert(phrase)].append(phrase_id)
+
+        self._link()
+
+    def _insert(self, phrase: str) -> int:
+        node = 0
+        for ch in phrase:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._dict_link.append(0)
+            node = nxt
+        return node
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+
+                self._fail[child] = fail
+                self._dict_link[child] = fail if self._out[fail] else self._dict_link[fail]
+                queue.append(child)
+
+    def find_all(self, text: str) -> Set[int]:
+        """
+        Returns the ids (positions in the compiled phrase list) of every
+        phrase contained in text.
+        """
+        goto, fail, out, dict_link = self._goto, self._fail, self._out, self._dict_link
+        found = set(self._always)
+        node = 0
+
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            hit = node if out[node] else dict_link[node]
+            while hit:
+                found.update(out[hit])
+                hit = dict_link[hit]
+
+        return found
+
+
+class SymptomMatcher:
+    """
+    Canonical symptom dictionary compiled into a single phrase automaton.
+    """
+
+    def __init__(self, canonical_symptoms: Dict[str, List[str]]):
+        phrases = []
+        self._canonicals = []
+
+        # Phrase ids follow dictionary order (canonical, then variant)
+        for canonical, variants in canonical_symptoms.items():
+            for phrase in variants:
+                phrases.append(phrase)
+                self._canonicals.append(canonical)
+
+        self._automaton = PhraseAutomaton(phrases)
+
+    def match(self, text: str) -> List[str]:
+        """
+        Returns the canonical symptom of every variant phrase found in text,
+        one entry per matching variant, in dictionary order.
+        """
+        return [
+            self._canonicals[phrase_id]
+            for phrase_id in sorted(self._automaton.find_all(text))
+        ]
+
+
+class SeverityScreen:
+    """
+    Cheap keyword pre-screen over a severity table ({level: [phrases]},
+    most severe level first), compiled into a single phrase automaton.
+    """
+
+    def __init__(self, severity_phrases: Dict[str, List[str]]):
+        self.levels = list(severity_phrases)
+
+        phrases = []
+        self._level_of = []
+        for level, level_phrases in enumerate(severity_phrases.values()):
+            for phrase in level_phrases:
+                phrases.append(phrase.lower())
+                self._level_of.append(level)
+
+        self._automaton = PhraseAutomaton(phrases)
+
+    def level(self, text: str) -> Optional[int]:
+        """
+        Index in self.levels of the most severe level with a phrase in
+        text, or None if no phrase matches.
+        """
+        found = self._automaton.find_all(text.lower())
+        return min((self._level_of[phrase_id] for phrase_id in found), default=None)
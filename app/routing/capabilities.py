@@ -0,0 +1,27 @@
+import threading
+from typing import Dict, Iterable, List
+
+# capability name -> bit position, assigned the first time a name is seen
+CAPABILITY_BITS: Dict[str, int] = {}
+_lock = threading.Lock()
+
+
+def capability_mask(capabilities: Iterable[str]) -> int:
+    """
+    Bitset of the given capability names (e.g. ["trauma", "icu"]).
+    """
+    mask = 0
+    for name in capabilities:
+        bit = CAPABILITY_BITS.get(name)
+        if bit is None:
+            with _lock:
+                bit = CAPABILITY_BITS.setdefault(name, len(CAPABILITY_BITS))
+        mask |= 1 << bit
+    return mask
+
+
+def capability_names(mask: int) -> List[str]:
+    """
+    Capability names set in a bitset, in the order they were first seen.
+    """
+    return [name for name, bit in list(CAPABILITY_BITS.items()) if mask >> bit & 1]
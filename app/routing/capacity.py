@@ -0,0 +1,163 @@
+import threading
+import time
+from typing import Dict, Optional
+from uuid import uuid4
+
+from app.core.config import settings
+
+# Between the hospital id and the random part of a reservation id
+RESERVATION_SEPARATOR = "#"
+
+
+class _Beds:
+    __slots__ = ("lock", "capacity", "free", "held", "committed")
+
+    def __init__(self, capacity: int, free: int):
+        self.lock = threading.Lock()
+        self.capacity = capacity
+        self.free = free
+        self.held: Dict[str, float] = {}   # reservation id -> expiry (monotonic)
+        self.committed = set()   # reservation ids of occupied beds, until released
+
+    def expire(self, now: float):
+        expired = [rid for rid, expires_at in self.held.items() if expires_at <= now]
+        for rid in expired:
+            del self.held[rid]
+            self.free += 1
+
+
+class CapacityManager:
+    """
+    Bed accounting with per-hospital reserve / commit / release.
+
+    Each hospital has its own lock, so routing requests that land on
+    different hospitals never wait on each other. A reservation holds a
+    bed until it is committed or released, or until it times out and the
+    bed goes back to the pool.
+
+    Reservation ids start with the hospital id, so there is no shared
+    reservation index; a hospital only tracks its held reservations and
+    the committed ones whose beds are still occupied, never more than its
+    capacity.
+    """
+
+    def __init__(self, reservation_timeout: float = None):
+        self.reservation_timeout = reservation_timeout or settings.BED_RESERVATION_TIMEOUT_SECONDS
+        self._beds: Dict[str, _Beds] = {}
+        self._register_lock = threading.Lock()
+
+    def _expire(self, beds: _Beds):
+        # Caller holds beds.lock
+        beds.expire(time.monotonic())
+
+    def _beds_of(self, reservation_id: str) -> Optional[_Beds]:
+        hospital_id, separator, _ = (reservation_id or "").rpartition(RESERVATION_SEPARATOR)
+        return self._beds.get(hospital_id) if separator else None
+
+    def register(self, hospital_id: str, beds: int, free: int = None):
+        """
+        Starts tracking a hospital with `free` of its beds free (default:
+        all). Registering a known hospital is a no-op.
+        """
+        with self._register_lock:
+            if hospital_id not in self._beds:
+                self._beds[hospital_id] = _Beds(beds, beds if free is None else free)
+
+    def available(self, hospital_id: str) -> int:
+        beds = self._beds.get(hospital_id)
+        if beds is None:
+            return 0
+        if beds.held:
+            with beds.lock:
+                self._expire(beds)
+        return beds.free
+
+    def reserve(self, hospital_id: str, timeout: float = None) -> Optional[str]:
+        """
+        Holds one bed. Returns a reservation id, or None if the hospital has
+        no free bed (e.g. another request took the last one first).
+        """
+        beds = self._beds.get(hospital_id)
+        if beds is None:
+            return None
+
+        with beds.lock:
+            if beds.free <= 0:
+                self._expire(beds)
+            if beds.free <= 0:
+                return None
+
+            reservation_id = f"{hospital_id}{RESERVATION_SEPARATOR}{uuid4()}"
+            beds.free -= 1
+            beds.held[reservation_id] = time.monotonic() + (timeout or self.reservation_timeout)
+
+        return reservation_id
+
+    def commit(self, reservation_id: str) -> bool:
+        """
+        Turns a held reservation into an occupied bed. Returns False if the
+        reservation is unknown or has already expired.
+        """
+        beds = self._beds_of(reservation_id)
+        if beds is None:
+            return False
+
+        with beds.lock:
+            self._expire(beds)
+            if reservation_id in beds.committed:
+                return True
+            if reservation_id not in beds.held:
+                return False
+
+            del beds.held[reservation_id]
+            beds.committed.add(reservation_id)
+            return True
+
+    def release(self, reservation_id: str) -> bool:
+        """
+        Returns the bed of a held or committed reservation to the pool.
+        Returns False if there was nothing to release.
+        """
+        beds = self._beds_of(reservation_id)
+        if beds is None:
+            return False
+
+        with beds.lock:
+            if beds.held.pop(reservation_id, None) is not None:
+                beds.free += 1
+                return True
+            if reservation_id in beds.committed:
+                beds.committed.discard(reservation_id)
+                beds.free += 1
+                return True
+            return False
+
+    def hospital_of(self, reservation_id: str) -> Optional[str]:
+        """
+        Hospital of a held or committed reservation, else None.
+        """
+        beds = self._beds_of(reservation_id)
+        if beds is None:
+            return None
+        with beds.lock:
+            self._expire(beds)
+            if reservation_id in beds.held or reservation_id in beds.committed:
+                return reservation_id.rpartition(RESERVATION_SEPARATOR)[0]
+        return None
+
+    def snapshot(self) -> Dict[str, Dict]:
+        report = {}
+        for hospital_id, beds in list(self._beds.items()):
+            with beds.lock:
+                self._expire(beds)
+                report[hospital_id] = {
+                    "capacity": beds.capacity,
+                    "free": beds.free,
+                    "held": len(beds.held),
+                    "committed": len(beds.committed)
+                }
+        return report
+
+
+# Singleton instance shared by routing and dispatch
+bed_capacity = CapacityManager()
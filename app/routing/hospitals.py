@@ -1,4 +1,18 @@
-HOSPITALS = [
+import csv
+import json
+import threading
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.routing.capabilities import capability_mask, capability_names
+from app.routing.capacity import CapacityManager, bed_capacity
+from app.routing.scoring import HospitalScorer
+from app.routing.spatial_index import SpatialIndex
+
+DEFAULT_HOSPITALS = [
     {
         "id": "H1",
         "name": "City Trauma Center",
@@ -24,3 +38,268 @@ HOSPITALS = [
         "capabilities": ["general"]
     }
 ]
+
+
+class Hospital:
+    """
+    Lightweight view of one registry row. Holds no data of its own.
+    """
+    __slots__ = ("_registry", "position")
+
+    def __init__(self, registry: "HospitalRegistry", position: int):
+        self._registry = registry
+        self.position = position
+
+    @property
+    def id(self) -> str:
+        return self._registry._ids[self.position]
+
+    @property
+    def name(self) -> str:
+        return self._registry._names[self.position]
+
+    @property
+    def lat(self) -> float:
+        return self._registry._lats[self.position]
+
+    @property
+    def lon(self) -> float:
+        return self._registry._lons[self.position]
+
+    @property
+    def beds(self) -> int:
+        """
+        Bed capacity; see available_beds for what is free right now.
+        """
+        return self._registry._beds[self.position]
+
+    @property
+    def capability_mask(self) -> int:
+        return self._registry._caps[self.position]
+
+    @property
+    def capabilities(self) -> List[str]:
+        return capability_names(self.capability_mask)
+
+    @property
+    def available_beds(self) -> int:
+        return self._registry.capacity.available(self.id)
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "lat": self.lat,
+            "lon": self.lon,
+            "beds": self.beds,
+            "capabilities": self.capabilities
+        }
+
+
+class HospitalRegistry:
+    """
+    The single hospital registry read by both dispatch and routing.
+
+    Facilities are stored column-wise (ids, names, coordinate/bed arrays
+    and capability bitsets) with an O(1) id -> row index, a spatial index
+    for nearest/radius queries, and free beds tracked by a CapacityManager.
+    """
+
+    def __init__(self, capacity: CapacityManager):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._lats = array("d")
+        self._lons = array("d")
+        self._beds = array("l")
+        self._caps = array("q")
+        self._positions: Dict[str, int] = {}
+        self._max_beds = 0
+
+        self.spatial = SpatialIndex()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[Hospital]:
+        return (Hospital(self, position) for position in range(len(self._ids)))
+
+    def __getitem__(self, position: int) -> Hospital:
+        return Hospital(self, position)
+
+    def get(self, hospital_id: str) -> Optional[Hospital]:
+        position = self._positions.get(hospital_id)
+        return None if position is None else Hospital(self, position)
+
+    def max_beds(self) -> int:
+        """
+        Upper bound on any hospital's free beds.
+        """
+        return self._max_beds
+
+    @staticmethod
+    def _parse(record: Dict) -> Tuple[str, str, float, float, int, int]:
+        """
+        Converts and checks every field of a record, so a bad one raises
+        ValueError before anything is stored.
+        """
+        try:
+            hospital_id = str(record["id"])
+            name = str(record["name"])
+            lat = float(record["lat"])
+            lon = float(record["lon"])
+            beds = int(record["beds"])
+
+            capabilities = record["capabilities"]
+            if isinstance(capabilities, str):
+                capabilities = [c.strip() for c in capabilities.split(";") if c.strip()]
+            capabilities = list(capabilities)
+        except KeyError as e:
+            raise ValueError(f"Hospital record missing field {e}")
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid hospital record {record.get('id')!r}: {e}")
+
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            raise ValueError(f"Invalid hospital record {hospital_id!r}: lat / lon out of range")
+        if beds < 0:
+            raise ValueError(f"Invalid hospital record {hospital_id!r}: beds cannot be negative")
+        if not all(isinstance(c, str) and c for c in capabilities):
+            raise ValueError(f"Invalid hospital record {hospital_id!r}: capabilities must be names")
+
+        return hospital_id, name, lat, lon, beds, capability_mask(capabilities)
+
+    def _parse_new(self, records: Iterable[Dict]) -> List[Tuple[str, str, float, float, int, int]]:
+        # Caller holds self._lock
+        rows = []
+        seen = set()
+        for record in records:
+            row = self._parse(record)
+            if row[0] in self._positions or row[0] in seen:
+                raise ValueError(f"Duplicate hospital id: {row[0]}")
+            seen.add(row[0])
+            rows.append(row)
+        return rows
+
+    def _append(self, row: Tuple[str, str, float, float, int, int]) -> int:
+        # Caller holds self._lock; row comes from _parse and cannot fail here
+        hospital_id, name, lat, lon, beds, caps = row
+        position = len(self._ids)
+
+        self._ids.append(hospital_id)
+        self._names.append(name)
+        self._lats.append(lat)
+        self._lons.append(lon)
+        self._beds.append(beds)
+        self._caps.append(caps)
+        self._positions[hospital_id] = position
+        self._max_beds = max(self._max_beds, beds)
+
+        self.capacity.register(hospital_id, beds)
+        return position
+
+    def add(self, record: Dict) -> Hospital:
+        """
+        Adds one facility; it is inserted into the spatial index in place.
+        Raises ValueError for an invalid record, leaving the registry as it was.
+        """
+        with self._lock:
+            position = self._append(self._parse_new([record])[0])
+            self.spatial.add(position, self._lats[position], self._lons[position], self._caps[position])
+        return Hospital(self, position)
+
+    def load_records(self, records: Iterable[Dict]) -> int:
+        """
+        Bulk-adds facilities, all or none: every record is checked before
+        any is stored. Large loads rebuild the spatial index once instead
+        of inserting row by row. Returns the number added.
+        """
+        with self._lock:
+            rows = self._parse_new(records)
+            start = len(self._ids)
+            for row in rows:
+                self._append(row)
+            added = len(rows)
+
+            if added > start // 4:
+                self.spatial = SpatialIndex(
+                    (p, self._lats[p], self._lons[p], self._caps[p])
+                    for p in range(len(self._ids))
+                )
+            else:
+                for p in range(start, len(self._ids)):
+                    self.spatial.add(p, self._lats[p], self._lons[p], self._caps[p])
+        return added
+
+    def load_json(self, path: str) -> int:
+        """
+        Loads a JSON list of {id, name, lat, lon, beds, capabilities}.
+        """
+        with open(path, encoding="utf-8") as f:
+            return self.load_records(json.load(f))
+
+    def load_csv(self, path: str) -> int:
+        """
+        Loads a CSV with columns id, name, lat, lon, beds, capabilities
+        (capabilities separated by ";").
+        """
+        with open(path, newline="", encoding="utf-8") as f:
+            return self.load_records(csv.DictReader(f))
+
+    def load_file(self, path: str) -> int:
+        if path.lower().endswith(".csv"):
+            return self.load_csv(path)
+        return self.load_json(path)
+
+    def copy(self) -> "HospitalRegistry":
+        """
+        Independent registry with the same facilities and its own
+        CapacityManager, starting from the beds free right now. Beds taken
+        from the copy (e.g. by a simulation) never touch this registry.
+        """
+        capacity = CapacityManager(self.capacity.reservation_timeout)
+        clone = HospitalRegistry(capacity)
+        with self._lock:
+            clone._ids = list(self._ids)
+            clone._names = list(self._names)
+            clone._lats = array("d", self._lats)
+            clone._lons = array("d", self._lons)
+            clone._beds = array("l", self._beds)
+            clone._caps = array("q", self._caps)
+            clone._positions = dict(self._positions)
+            clone._max_beds = self._max_beds
+
+        for hospital_id, beds in zip(clone._ids, clone._beds):
+            capacity.register(hospital_id, beds, self.capacity.available(hospital_id))
+        clone.spatial = SpatialIndex(
+            (p, clone._lats[p], clone._lons[p], clone._caps[p])
+            for p in range(len(clone._ids))
+        )
+        return clone
+
+    def available_beds(self) -> np.ndarray:
+        return np.fromiter((self.capacity.available(h) for h in self._ids), dtype=np.float64, count=len(self._ids))
+
+    def scorer(self) -> HospitalScorer:
+        """
+        Vectorized scorer over the current rows and free beds.
+        """
+        # Copies, not views: an array exporting its buffer cannot grow, so
+        # a live scorer would make add() fail halfway through a row
+        with self._lock:
+            lats = np.array(self._lats, dtype=np.float64)
+            lons = np.array(self._lons, dtype=np.float64)
+            caps = np.array(self._caps, dtype=np.int64)
+            ids = list(self._ids)
+        beds = np.fromiter((self.capacity.available(h) for h in ids), dtype=np.float64, count=len(ids))
+        return HospitalScorer(lats, lons, beds, caps)
+
+
+# Singleton instance
+hospital_registry = HospitalRegistry(bed_capacity)
+
+if settings.HOSPITALS_PATH:
+    hospital_registry.load_file(settings.HOSPITALS_PATH)
+else:
+    hospital_registry.load_records(DEFAULT_HOSPITALS)
@@ -1,45 +1,119 @@
-from app.routing.hospitals import HOSPITALS
+from app.routing.capabilities import capability_mask
+from app.routing.hospitals import HospitalRegistry, hospital_registry
 from app.routing.severity_rules import SEVERITY_CAPABILITY_MAP
-from app.utils.geo import haversine
 
 
-def recommend_hospitals(location, severity):
-    required_caps = SEVERITY_CAPABILITY_MAP.get(severity, [])
-    recommendations = []
+def score_hospital(distance: float, beds: int) -> float:
+    return (
+        (1 / (distance + 1)) * 0.6 +
+        (beds / 10) * 0.4
+    )
 
-    for h in HOSPITALS:
-        if h["beds"] <= 0:
-            continue
 
-        if not any(cap in h["capabilities"] for cap in required_caps):
+def _best_hospital(location, required_caps: int, excluded: set, registry: HospitalRegistry):
+    """
+    Highest-scoring hospital with free beds, as (score, position, beds).
+    """
+    best = None
+    bed_term_bound = (registry.max_beds() / 10) * 0.4
+
+    # Candidates arrive nearest first; stop once even a hospital with the
+    # most beds anywhere could not beat the best score at this distance.
+    for distance, position in registry.spatial.iter_nearest(
+        location.lat, location.lon,
+        capabilities=required_caps,
+        predicate=lambda p: p not in excluded
+    ):
+        if best and (1 / (distance + 1)) * 0.6 + bed_term_bound < best[0]:
+            break
+
+        beds = registry[position].available_beds
+        if beds <= 0:
             continue
 
-        distance = haversine(
-            location.lat, location.lon,
-            h["lat"], h["lon"]
-        )
+        score = score_hospital(distance, beds)
+
+        # Ties go to the hospital listed first, as with a stable sort
+        if best is None or score > best[0] or (score == best[0] and position < best[1]):
+            best = (score, position, beds)
+
+    return best
+
+
+def recommend_hospitals(location, severity, commit: bool = True, registry: HospitalRegistry = None):
+    """
+    Picks the best hospital for an incident and reserves a bed there.
 
-        score = (
-            (1 / (distance + 1)) * 0.6 +
-            (h["beds"] / 10) * 0.4
-        )
+    If another request takes the last bed between scoring and reserving,
+    the next-best hospital is tried. With commit=False the bed is only
+    held (see CapacityManager) and the reservation id is returned so the
+    caller can commit or release it later.
 
-        recommendations.append({
-            "hospital": h,
-            "score": score
-        })
+    Routes against the shared registry unless another one (e.g. a
+    simulation's copy) is given.
+    """
+    if registry is None:
+        registry = hospital_registry
 
-    recommendations.sort(key=lambda x: x["score"], reverse=True)
+    required_caps = capability_mask(SEVERITY_CAPABILITY_MAP.get(severity, []))
+    if not required_caps:
+        return []
 
-    if recommendations:
-        chosen = recommendations[0]["hospital"]
-        chosen["beds"] -= 1   # 🔥 CONSUME BED
+    excluded = set()
+    while True:
+        best = _best_hospital(location, required_caps, excluded, registry)
+        if best is None:
+            return []
+
+        score, position, _ = best
+        chosen = registry[position]
+
+        reservation_id = registry.capacity.reserve(chosen.id)
+        if reservation_id is None:
+            # Lost the race for the last bed
+            excluded.add(position)
+            continue
+
+        if commit:
+            registry.capacity.commit(reservation_id)   # 🔥 CONSUME BED
 
         return [{
-            "name": chosen["name"],
-            "score": round(recommendations[0]["score"], 2),
-            "reason": f"Assigned ({severity}); remaining beds: {chosen['beds']}"
+            "name": chosen.name,
+            "hospital_id": chosen.id,
+            "score": round(score, 2),
+            "reason": f"Assigned ({severity}); remaining beds: {chosen.available_beds}",
+            "reservation_id": reservation_id
         }]
 
-    return []
 
+def rank_hospitals_batch(locations, severities, k: int = 3):
+    """
+    Scores every (incident, hospital) pair in one vectorized pass and
+    returns the top k candidates per incident, best first.
+    Read-only: no beds are consumed.
+    """
+    scorer = hospital_registry.scorer()
+    required_caps = [
+        capability_mask(SEVERITY_CAPABILITY_MAP.get(severity, []))
+        for severity in severities
+    ]
+
+    positions, scores = scorer.top_k(
+        [location.lat for location in locations],
+        [location.lon for location in locations],
+        required_caps,
+        k
+    )
+
+    return [
+        [
+            {
+                "name": hospital_registry[position].name,
+                "hospital_id": hospital_registry[position].id,
+                "score": float(score)
+            }
+            for position, score in zip(row_positions, row_scores)
+            if position >= 0
+        ]
+        for row_positions, row_scores in zip(positions.tolist(), scores.tolist())
+    ]
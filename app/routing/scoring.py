@@ -0,0 +1,103 @@
+from typing import Iterable, Tuple
+
+import numpy as np
+
+from app.routing.capabilities import capability_mask
+from app.utils.geo import EARTH_RADIUS_KM
+
+# Incidents are scored in row chunks so the (incidents x hospitals)
+# intermediates stay around this many elements.
+MAX_CHUNK_ELEMENTS = 4_000_000
+
+
+class HospitalScorer:
+    """
+    Columnar (NumPy) snapshot of hospitals for scoring many incidents at once.
+
+    Uses the same haversine distance and 0.6 / 0.4 distance/beds score as
+    recommend_hospitals. Hospitals without free beds, or without any of
+    the required capabilities, score -inf.
+    """
+
+    def __init__(self, lats: Iterable[float], lons: Iterable[float], beds: Iterable[int], capabilities: Iterable[int]):
+        self.lat = np.radians(np.asarray(lats, dtype=np.float64))
+        self.lon = np.radians(np.asarray(lons, dtype=np.float64))
+        self.cos_lat = np.cos(self.lat)
+        self.beds = np.asarray(beds, dtype=np.float64)
+        self.capabilities = np.asarray(capabilities, dtype=np.int64)
+
+    @classmethod
+    def from_hospitals(cls, hospitals, beds: Iterable[int] = None) -> "HospitalScorer":
+        """
+        beds: free beds per hospital; defaults to each hospital's "beds".
+        """
+        return cls(
+            [h["lat"] for h in hospitals],
+            [h["lon"] for h in hospitals],
+            [h["beds"] for h in hospitals] if beds is None else beds,
+            [capability_mask(h["capabilities"]) for h in hospitals]
+        )
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def distances(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        (incidents x hospitals) haversine distances in km.
+        """
+        lat = np.radians(np.asarray(lats, dtype=np.float64))[:, None]
+        lon = np.radians(np.asarray(lons, dtype=np.float64))[:, None]
+
+        a = (
+            np.sin((self.lat - lat) / 2) ** 2
+            + np.cos(lat) * self.cos_lat * np.sin((self.lon - lon) / 2) ** 2
+        )
+        return EARTH_RADIUS_KM * (2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)))
+
+    def scores(self, lats: np.ndarray, lons: np.ndarray, required_caps: np.ndarray) -> np.ndarray:
+        """
+        (incidents x hospitals) scores; required_caps is one capability
+        bitmask per incident.
+        """
+        scores = (1 / (self.distances(lats, lons) + 1)) * 0.6 + (self.beds / 10) * 0.4
+
+        required = np.asarray(required_caps, dtype=np.int64)[:, None]
+        eligible = ((self.capabilities & required) != 0) & (self.beds > 0)
+        scores[~eligible] = -np.inf
+        return scores
+
+    def top_k(self, lats: np.ndarray, lons: np.ndarray, required_caps: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Best k hospitals per incident as (positions, scores), each
+        (incidents x k) and ordered best first. Slots with no eligible
+        hospital have position -1 and score -inf.
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        required_caps = np.asarray(required_caps, dtype=np.int64)
+
+        m, n = len(lats), len(self)
+        k = min(k, n)
+        positions = np.full((m, k), -1, dtype=np.int64)
+        best = np.full((m, k), -np.inf)
+        if not k:
+            return positions, best
+
+        chunk = max(1, MAX_CHUNK_ELEMENTS // max(n, 1))
+        for start in range(0, m, chunk):
+            rows = slice(start, start + chunk)
+            scores = self.scores(lats[rows], lons[rows], required_caps[rows])
+
+            # Unordered top k, then order just those k
+            part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            part_scores = np.take_along_axis(scores, part, axis=1)
+            order = np.argsort(-part_scores, axis=1, kind="stable")
+
+            top = np.take_along_axis(part, order, axis=1)
+            top_scores = np.take_along_axis(part_scores, order, axis=1)
+            top[np.isneginf(top_scores)] = -1
+
+            positions[rows] = top
+            best[rows] = top_scores
+
+        return positions, best
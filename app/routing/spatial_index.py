@@ -0,0 +1,311 @@
+import heapq
+import math
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from app.utils.geo import EARTH_RADIUS_KM
+
+# Points per leaf after a build; a leaf that grows past twice this through
+# add() is split in place.
+LEAF_SIZE = 16
+
+_NODE, _POINT = 0, 1
+
+
+def to_unit_vector(lat: float, lon: float) -> Tuple[float, float, float]:
+    lat, lon = math.radians(lat), math.radians(lon)
+    cos_lat = math.cos(lat)
+    return (cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat))
+
+
+def chord_sq_to_km(chord_sq: float) -> float:
+    # Straight-line chord between unit vectors -> great-circle distance.
+    # Same value as haversine(): the haversine term a equals (chord / 2) ** 2.
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(chord_sq) / 2))
+
+
+def km_to_chord_sq(km: float) -> float:
+    chord = 2 * math.sin(min(km / EARTH_RADIUS_KM, math.pi) / 2)
+    return chord * chord
+
+
+def _dist_sq(a, b) -> float:
+    dx, dy, dz = a[0] - b[0], a[1] - b[1], a[2] - b[2]
+    return dx * dx + dy * dy + dz * dz
+
+
+class _Node:
+    __slots__ = ("lo", "hi", "caps", "items", "axis", "split", "left", "right")
+
+
+class SpatialIndex:
+    """
+    KD-tree over locations on the earth's surface.
+
+    Points are stored as 3D unit vectors, where straight-line (chord)
+    distance orders points exactly like haversine distance, so ordinary
+    KD-tree bounding-box pruning applies. Every node also keeps the union
+    of its points' capability bitmasks, so capability-filtered queries skip
+    whole subtrees that cannot match.
+
+    add() inserts into the existing tree (splitting a leaf when it grows
+    too large) instead of rebuilding it. remove() takes a point out of its
+    leaf and reuses its slot for the next add(); the tree is rebuilt once
+    removals since the last build outnumber the points left.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Hashable, float, float, int]] = ()):
+        self._keys: List[Hashable] = []
+        self._points: List[Tuple[float, float, float]] = []
+        self._caps: List[int] = []
+        self._slots: Dict[Hashable, int] = {}   # key -> slot, for remove()
+        self._free: List[int] = []              # slots of removed points
+        self._removed = 0                       # removals since the last build
+
+        for key, lat, lon, capabilities in entries:
+            self._append(key, lat, lon, capabilities)
+
+        self._root: Optional[_Node] = self._build(list(range(len(self._keys)))) if self._keys else None
+
+    def __len__(self) -> int:
+        return len(self._keys) - len(self._free)
+
+    def _append(self, key, lat, lon, capabilities) -> int:
+        point = to_unit_vector(lat, lon)
+        if self._free:
+            i = self._free.pop()
+            self._keys[i] = key
+            self._points[i] = point
+            self._caps[i] = capabilities
+        else:
+            i = len(self._keys)
+            self._keys.append(key)
+            self._points.append(point)
+            self._caps.append(capabilities)
+        self._slots[key] = i
+        return i
+
+    def _build(self, ids: List[int], node: _Node = None) -> _Node:
+        node = node or _Node()
+        points = self._points
+
+        node.lo = [min(points[i][a] for i in ids) for a in range(3)]
+        node.hi = [max(points[i][a] for i in ids) for a in range(3)]
+        node.caps = 0
+        for i in ids:
+            node.caps |= self._caps[i]
+
+        if len(ids) <= LEAF_SIZE:
+            node.items = ids
+            node.left = node.right = None
+            return node
+
+        axis = max(range(3), key=lambda a: node.hi[a] - node.lo[a])
+        ids.sort(key=lambda i: points[i][axis])
+        mid = len(ids) // 2
+
+        node.items = None
+        node.axis = axis
+        node.split = points[ids[mid]][axis]
+        node.left = self._build(ids[:mid])
+        node.right = self._build(ids[mid:])
+        return node
+
+    def add(self, key: Hashable, lat: float, lon: float, capabilities: int = 0):
+        i = self._append(key, lat, lon, capabilities)
+        point = self._points[i]
+
+        if self._root is None:
+            self._root = self._build([i])
+            return
+
+        # Widen bounds and capability unions along the insertion path
+        node = self._root
+        while True:
+            for a in range(3):
+                if point[a] < node.lo[a]:
+                    node.lo[a] = point[a]
+                if point[a] > node.hi[a]:
+                    node.hi[a] = point[a]
+            node.caps |= capabilities
+
+            if node.items is not None:
+                break
+            node = node.left if point[node.axis] < node.split else node.right
+
+        node.items.append(i)
+        if len(node.items) > 2 * LEAF_SIZE:
+            self._build(node.items, node)
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Removes the point last added under key. Returns False if there is
+        none. Bounding boxes are left as they are (only looser, still
+        correct); capability unions on the way up are recomputed.
+        """
+        i = self._slots.pop(key, None)
+        if i is None:
+            return False
+
+        path = self._path_to(self._root, i, self._points[i])
+        leaf = path[-1]
+        leaf.items.remove(i)
+        leaf.caps = 0
+        for j in leaf.items:
+            leaf.caps |= self._caps[j]
+        for node in reversed(path[:-1]):
+            node.caps = node.left.caps | node.right.caps
+
+        self._keys[i] = None
+        self._free.append(i)
+        self._removed += 1
+        if self._removed > max(LEAF_SIZE, len(self)):
+            self._rebuild()
+        return True
+
+    def _path_to(self, node: _Node, i: int, point) -> Optional[List[_Node]]:
+        # Nodes from here down to the leaf holding slot i. A point equal to
+        # a split value may be on either side of it.
+        if node.items is not None:
+            return [node] if i in node.items else None
+        if point[node.axis] <= node.split:
+            path = self._path_to(node.left, i, point)
+            if path:
+                return [node] + path
+        if point[node.axis] >= node.split:
+            path = self._path_to(node.right, i, point)
+            if path:
+                return [node] + path
+        return None
+
+    def _rebuild(self):
+        # Compacts the slots and rebuilds a balanced tree
+        free = set(self._free)
+        live = [i for i in range(len(self._keys)) if i not in free]
+        self._keys = [self._keys[i] for i in live]
+        self._points = [self._points[i] for i in live]
+        self._caps = [self._caps[i] for i in live]
+        self._slots = {key: i for i, key in enumerate(self._keys)}
+        self._free = []
+        self._removed = 0
+        self._root = self._build(list(range(len(self._keys)))) if self._keys else None
+
+    @staticmethod
+    def _box_dist_sq(node: _Node, point) -> float:
+        d = 0.0
+        for a in range(3):
+            v = point[a]
+            if v < node.lo[a]:
+                t = node.lo[a] - v
+                d += t * t
+            elif v > node.hi[a]:
+                t = v - node.hi[a]
+                d += t * t
+        return d
+
+    def iter_nearest(
+        self,
+        lat: float,
+        lon: float,
+        capabilities: int = 0,
+        predicate: Callable[[Hashable], bool] = None
+    ) -> Iterator[Tuple[float, Hashable]]:
+        """
+        Yields (distance_km, key) in increasing distance order, lazily.
+
+        capabilities: if non-zero, only points sharing at least one of these
+        capability bits are considered.
+        predicate: optional per-key filter (e.g. "has free beds").
+        Ties are broken by insertion order (by slot, once points have been
+        removed).
+        """
+        if self._root is None:
+            return
+
+        point = to_unit_vector(lat, lon)
+        points, caps, keys = self._points, self._caps, self._keys
+        heap = [(0.0, _NODE, 0, self._root)]
+        seq = 1
+
+        while heap:
+            d, kind, i, node = heapq.heappop(heap)
+
+            if kind == _POINT:
+                key = keys[i]
+                if predicate is None or predicate(key):
+                    yield chord_sq_to_km(d), key
+                continue
+
+            if node.items is not None:
+                for i in node.items:
+                    if capabilities and not caps[i] & capabilities:
+                        continue
+                    heapq.heappush(heap, (_dist_sq(point, points[i]), _POINT, i, None))
+                continue
+
+            for child in (node.left, node.right):
+                if capabilities and not child.caps & capabilities:
+                    continue
+                heapq.heappush(heap, (self._box_dist_sq(child, point), _NODE, seq, child))
+                seq += 1
+
+    def nearest(
+        self,
+        lat: float,
+        lon: float,
+        k: int = 1,
+        capabilities: int = 0,
+        predicate: Callable[[Hashable], bool] = None
+    ) -> List[Tuple[float, Hashable]]:
+        """
+        The k nearest matching points as (distance_km, key), nearest first.
+        """
+        results = []
+        if k <= 0:
+            return results
+        for hit in self.iter_nearest(lat, lon, capabilities, predicate):
+            results.append(hit)
+            if len(results) == k:
+                break
+        return results
+
+    def within(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: float,
+        capabilities: int = 0,
+        predicate: Callable[[Hashable], bool] = None
+    ) -> List[Tuple[float, Hashable]]:
+        """
+        Every matching point within radius_km as (distance_km, key), nearest first.
+        """
+        if self._root is None:
+            return []
+
+        point = to_unit_vector(lat, lon)
+        limit = km_to_chord_sq(radius_km)
+        points, caps, keys = self._points, self._caps, self._keys
+        hits = []
+        stack = [self._root]
+
+        while stack:
+            node = stack.pop()
+            if capabilities and not node.caps & capabilities:
+                continue
+            if self._box_dist_sq(node, point) > limit:
+                continue
+
+            if node.items is None:
+                stack.append(node.left)
+                stack.append(node.right)
+                continue
+
+            for i in node.items:
+                if capabilities and not caps[i] & capabilities:
+                    continue
+                d = _dist_sq(point, points[i])
+                if d <= limit and (predicate is None or predicate(keys[i])):
+                    hits.append((d, i))
+
+        hits.sort()
+        return [(chord_sq_to_km(d), keys[i]) for d, i in hits]
@@ -1,10 +1,8 @@
 import random
 
-from app.medical_nlp.extractor import extract_medical_entities
-from app.medical_nlp.normalizer import normalize_entities
-from app.triage.triage_engine import triage
+from app.core.executor import analysis_executor
 from app.routing.router import recommend_hospitals
-from app.routing.hospitals import HOSPITALS
+from app.routing.hospitals import hospital_registry
 from app.api.schemas import AnalyzeRequest  # Assuming Location isn't used or import fix needed
 
 
@@ -17,7 +15,7 @@ SIMULATED_CALLS = [
 ]
 
 
-from app.incident.service import create_incident
+from app.incident.service import create_incident, update_incident
 from app.incident.repository import incident_repository
 
 # Simple Mock Location
@@ -29,15 +27,15 @@ class MockLocation:
 def run_simulation(num_cases: int):
     results = []
 
-    for i in range(num_cases):
-        transcript = random.choice(SIMULATED_CALLS)
+    transcripts = [random.choice(SIMULATED_CALLS) for _ in range(num_cases)]
 
-        # 1. NLP Extraction
-        extracted = extract_medical_entities(transcript)
-        normalized = normalize_entities(extracted["entities"])
-        
-        # 2. Triage
-        triage_result = triage(normalized["symptoms"])
+    # 1-2. NLP Extraction and Triage (batched through nlp.pipe, on the
+    # analysis workers)
+    analyses = analysis_executor.analyze_batch(transcripts)
+
+    for transcript, analysis in zip(transcripts, analyses):
+        symptoms = analysis["symptoms"]
+        triage_result = analysis["triage_result"]
         
         # 3. Routing (Mock Location for now)
         location = MockLocation(lat=23.2599 + random.uniform(-0.05, 0.05), lon=77.4126 + random.uniform(-0.05, 0.05))
@@ -45,10 +43,14 @@ def run_simulation(num_cases: int):
         # 4. Create Incident (Persist to Repo)
         incident = create_incident(
             input_text=transcript,
-            symptoms=normalized["symptoms"],
+            symptoms=symptoms,
             triage_result=triage_result,
             lat=location.lat,
-            lon=location.lon
+            lon=location.lon,
+            channel="simulation",
+            # Routing below admits the patient; simulated calls take no
+            # dispatch bed hold or live ambulance
+            hold_resources=False
         )
         
         # Map urgency to severity for router if needed (CRITICAL -> CRITICAL)
@@ -59,6 +61,8 @@ def run_simulation(num_cases: int):
         if hospitals:
              incident.log_event("DISPATCH_RECOMMENDED", {"hospital": hospitals[0]["name"]})
 
+        update_incident(incident)
+
         results.append({
             "case_id": incident.id,
             "transcript": transcript,
@@ -69,8 +73,8 @@ def run_simulation(num_cases: int):
     return {
         "cases": results,
         "final_hospital_state": [
-            {"name": h["name"], "beds_left": h["beds"]}
-            for h in HOSPITALS
+            {"name": h.name, "beds_left": h.available_beds}
+            for h in hospital_registry
         ]
     }
 
@@ -0,0 +1,349 @@
+import heapq
+import random
+import time
+from array import array
+from math import inf
+from typing import Dict, Iterator, List, Optional
+
+from app.core.config import settings
+from app.core.executor import analysis_executor
+from app.core.stats import percentile
+from app.routing.hospitals import hospital_registry
+from app.routing.router import recommend_hospitals
+from app.simulation import SIMULATED_CALLS, MockLocation
+from app.simulation.engine import ARRIVAL_PROFILES, CENTER, SPREAD
+from app.utils.geo import travel_minutes
+
+# Event kinds
+ARRIVAL, ON_SCENE, AT_HOSPITAL, UNIT_FREE, BED_RELEASE = range(5)
+
+# Mean length of stay by urgency, in hours (exponentially distributed)
+LENGTH_OF_STAY_HOURS = {"CRITICAL": 72.0, "HIGH": 36.0, "MEDIUM": 12.0, "LOW": 4.0}
+# Mean minutes on scene (exponentially distributed), and fixed minutes to
+# hand a patient over before the unit is free again
+SCENE_MINUTES = 15.0
+HANDOVER_MINUTES = 10.0
+
+URGENCY_RANK = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+QUEUE_POLICIES = ("urgency", "fifo")
+
+
+def expected_calls(hours: float, rate_per_hour: float, profile: str) -> float:
+    """
+    Mean number of calls over a run: rate x hours x the profile's mean
+    multiplier, sampled per simulated minute over one day (the profiles
+    repeat daily).
+    """
+    multiplier = ARRIVAL_PROFILES[profile]
+    mean = sum(multiplier(minute / 60) for minute in range(24 * 60)) / (24 * 60)
+    return rate_per_hour * hours * mean
+
+
+class EventScheduler:
+    """
+    Simulation clock plus a min-heap of pending events. Events due at the
+    same time run in the order they were scheduled.
+    """
+    __slots__ = ("now", "_heap", "_sequence")
+
+    def __init__(self):
+        self.now = 0.0
+        self._heap = []
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, delay: float, kind: int, payload=None):
+        self._sequence += 1
+        heapq.heappush(self._heap, (self.now + delay, self._sequence, kind, payload))
+
+    def next_time(self) -> float:
+        return self._heap[0][0] if self._heap else inf
+
+    def pop(self):
+        """
+        Advances the clock to the next event and returns (kind, payload).
+        """
+        self.now, _, kind, payload = heapq.heappop(self._heap)
+        return kind, payload
+
+
+class _Call:
+    __slots__ = ("number", "arrival", "urgency", "lat", "lon", "hospital", "reservation_id")
+
+    def __init__(self, number: int, arrival: float, urgency: str, lat: float, lon: float):
+        self.number = number
+        self.arrival = arrival
+        self.urgency = urgency
+        self.lat = lat
+        self.lon = lon
+        self.hospital = None
+        self.reservation_id = None
+
+
+class DiscreteEventSimulation:
+    """
+    Call arrivals, ambulance travel and bed turnover over simulated time,
+    against a copy of the hospital registry.
+
+    Calls arrive as a Poisson process (rate_per_hour scaled by the arrival
+    profile) and get a bed through the normal routing. The nearest free
+    unit drives to the scene, spends time there, transports to the
+    hospital and is free again after handover; calls that find no free
+    unit wait, most urgent first or in arrival order. The bed is released
+    after the patient's length of stay. Times are in minutes; travel is
+    haversine distance at speed_kmh. A seed always gives the same run.
+
+    run() yields a progress summary every report_hours simulated hours (if
+    set) and a final one when the `hours` horizon is reached.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        hours: float = 24.0,
+        rate_per_hour: float = 30.0,
+        profile: str = "constant",
+        units: int = 10,
+        speed_kmh: float = None,
+        queue_policy: str = "urgency",
+        report_hours: float = None
+    ):
+        if profile not in ARRIVAL_PROFILES:
+            raise ValueError(f"Unknown arrival profile: {profile} (expected one of {', '.join(ARRIVAL_PROFILES)})")
+        if queue_policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown queue policy: {queue_policy} (expected one of {', '.join(QUEUE_POLICIES)})")
+        if not 0 < hours <= settings.SIMULATION_MAX_HOURS:
+            raise ValueError(f"hours must be between 0 and {settings.SIMULATION_MAX_HOURS}")
+        if rate_per_hour <= 0:
+            raise ValueError("rate_per_hour must be positive")
+        if expected_calls(hours, rate_per_hour, profile) > settings.SIMULATION_MAX_CALLS:
+            raise ValueError(f"rate_per_hour x hours must stay under {settings.SIMULATION_MAX_CALLS} expected calls")
+        if not 1 <= units <= settings.SIMULATION_MAX_UNITS:
+            raise ValueError(f"units must be between 1 and {settings.SIMULATION_MAX_UNITS}")
+        if speed_kmh is not None and speed_kmh <= 0:
+            raise ValueError("speed_kmh must be positive")
+        if report_hours is not None and report_hours < settings.SIMULATION_MIN_REPORT_HOURS:
+            raise ValueError(f"report_hours must be at least {settings.SIMULATION_MIN_REPORT_HOURS}")
+
+        self.seed = seed
+        self.hours = hours
+        self.rate_per_hour = rate_per_hour
+        self.profile = profile
+        self.units = units
+        self.speed_kmh = speed_kmh or settings.DISPATCH_SPEED_KMH
+        self.queue_policy = queue_policy
+        self.report_hours = report_hours
+
+        self._urgencies: Dict[str, str] = {}
+
+    def _setup(self):
+        self.rng = random.Random(self.seed)
+        self.scheduler = EventScheduler()
+        self.registry = hospital_registry.copy()
+        self.multiplier = ARRIVAL_PROFILES[self.profile]
+
+        # Transcripts only repeat, so each is analyzed once per engine
+        if not self._urgencies:
+            analyses = analysis_executor.analyze_batch(SIMULATED_CALLS)
+            self._urgencies = {
+                text: analysis["triage_result"]["urgency"]
+                for text, analysis in zip(SIMULATED_CALLS, analyses)
+            }
+
+        # Units start spread across the hospitals and only ever wait at one,
+        # so free units are found hospital by hospital, nearest first.
+        # hospital position -> heap of free unit numbers
+        self.unit_at = array("l", (i % len(self.registry) for i in range(self.units)))
+        self.idle_at: Dict[int, List[int]] = {}
+        for unit, position in enumerate(self.unit_at):
+            heapq.heappush(self.idle_at.setdefault(position, []), unit)
+        self.idle = self.units
+        self.busy_since = array("d", [0.0] * self.units)
+        self.busy_minutes = 0.0
+        self.waiting = []
+
+        self.calls = 0
+        self.events = 0
+        self.no_bed = 0
+        self.response = {urgency: array("d") for urgency in URGENCY_RANK}
+        self.unit_wait = array("d")
+
+        self.beds_free = sum(h.available_beds for h in self.registry)
+        self.beds_min_free = self.beds_free
+        self.beds_released = 0
+        self.full_minutes = 0.0
+        self.full_since = 0.0 if self.beds_free <= 0 else None
+
+        self.scheduler.schedule(self._interarrival(), ARRIVAL)
+
+    def _interarrival(self) -> float:
+        rate = self.rate_per_hour * self.multiplier(self.scheduler.now / 60)
+        return self.rng.expovariate(rate / 60)
+
+    def _travel(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+        return travel_minutes(lat1, lon1, lat2, lon2, self.speed_kmh)
+
+    def _take_nearest_unit(self, lat: float, lon: float) -> Optional[int]:
+        if not self.idle:
+            return None
+        idle_at = self.idle_at
+        for _, position in self.registry.spatial.iter_nearest(lat, lon, predicate=lambda p: bool(idle_at.get(p))):
+            self.idle -= 1
+            return heapq.heappop(idle_at[position])
+        return None
+
+    def _free_unit(self, unit: int):
+        heapq.heappush(self.idle_at.setdefault(self.unit_at[unit], []), unit)
+        self.idle += 1
+
+    def _send(self, unit: int, call: _Call):
+        now = self.scheduler.now
+        self.busy_since[unit] = now
+        self.unit_wait.append(now - call.arrival)
+        base = self.registry[self.unit_at[unit]]
+        minutes = self._travel(base.lat, base.lon, call.lat, call.lon)
+        self.scheduler.schedule(minutes, ON_SCENE, (unit, call))
+
+    def _bed_taken(self):
+        self.beds_free -= 1
+        self.beds_min_free = min(self.beds_min_free, self.beds_free)
+        if self.beds_free == 0:
+            self.full_since = self.scheduler.now
+
+    def _bed_released(self):
+        if self.beds_free == 0 and self.full_since is not None:
+            self.full_minutes += self.scheduler.now - self.full_since
+            self.full_since = None
+        self.beds_free += 1
+        self.beds_released += 1
+
+    def _on_arrival(self):
+        scheduler = self.scheduler
+        if scheduler.now < self.hours * 60:
+            scheduler.schedule(self._interarrival(), ARRIVAL)
+
+        rng = self.rng
+        call = _Call(
+            self.calls,
+            scheduler.now,
+            self._urgencies[rng.choice(SIMULATED_CALLS)],
+            CENTER[0] + rng.uniform(-SPREAD, SPREAD),
+            CENTER[1] + rng.uniform(-SPREAD, SPREAD)
+        )
+        self.calls += 1
+
+        hospitals = recommend_hospitals(MockLocation(call.lat, call.lon), call.urgency, registry=self.registry)
+        if hospitals:
+            call.hospital = self.registry.get(hospitals[0]["hospital_id"])
+            call.reservation_id = hospitals[0]["reservation_id"]
+            self._bed_taken()
+        else:
+            # No bed anywhere: still transported, to the nearest hospital
+            self.no_bed += 1
+            call.hospital = self.registry[self.registry.spatial.nearest(call.lat, call.lon, k=1)[0][1]]
+
+        unit = self._take_nearest_unit(call.lat, call.lon)
+        if unit is None:
+            key = (URGENCY_RANK[call.urgency], call.arrival) if self.queue_policy == "urgency" else (call.arrival,)
+            heapq.heappush(self.waiting, (*key, call.number, call))
+        else:
+            self._send(unit, call)
+
+    def _on_scene(self, unit: int, call: _Call):
+        self.response[call.urgency].append(self.scheduler.now - call.arrival)
+        hospital = call.hospital
+        minutes = self.rng.expovariate(1 / SCENE_MINUTES) + self._travel(call.lat, call.lon, hospital.lat, hospital.lon)
+        self.scheduler.schedule(minutes, AT_HOSPITAL, (unit, call))
+
+    def _at_hospital(self, unit: int, call: _Call):
+        self.unit_at[unit] = call.hospital.position
+        if call.reservation_id is not None:
+            stay = self.rng.expovariate(1 / (LENGTH_OF_STAY_HOURS[call.urgency] * 60))
+            self.scheduler.schedule(stay, BED_RELEASE, call.reservation_id)
+        self.scheduler.schedule(HANDOVER_MINUTES, UNIT_FREE, unit)
+
+    def _unit_free(self, unit: int):
+        now = self.scheduler.now
+        self.busy_minutes += now - self.busy_since[unit]
+        if self.waiting:
+            self._send(unit, heapq.heappop(self.waiting)[-1])
+        else:
+            self._free_unit(unit)
+
+    def _bed_release(self, reservation_id: str):
+        self.registry.capacity.release(reservation_id)
+        self._bed_released()
+
+    def _advance(self, until: float):
+        # Runs every event due up to `until` minutes, then moves the clock there
+        scheduler = self.scheduler
+        handlers = {
+            ARRIVAL: lambda payload: self._on_arrival(),
+            ON_SCENE: lambda payload: self._on_scene(*payload),
+            AT_HOSPITAL: lambda payload: self._at_hospital(*payload),
+            UNIT_FREE: self._unit_free,
+            BED_RELEASE: self._bed_release
+        }
+        while scheduler.next_time() <= until:
+            kind, payload = scheduler.pop()
+            handlers[kind](payload)
+            self.events += 1
+        scheduler.now = until
+
+    def summary(self, final: bool) -> Dict:
+        now = self.scheduler.now
+        seconds = time.perf_counter() - self.started
+        idle = {unit for units in self.idle_at.values() for unit in units}
+        busy = self.busy_minutes + sum(now - self.busy_since[u] for u in range(self.units) if u not in idle)
+        full = self.full_minutes + (now - self.full_since if self.full_since is not None else 0.0)
+
+        return {
+            "type": "summary" if final else "progress",
+            "simulated_hours": round(now / 60, 3),
+            "wall_seconds": round(seconds, 3),
+            "events": self.events,
+            "events_per_second": round(self.events / seconds, 1) if seconds else 0.0,
+            "calls": self.calls,
+            "waiting_for_unit": len(self.waiting),
+            "no_bed": self.no_bed,
+            "response_minutes": {
+                urgency: _minutes(samples)
+                for urgency, samples in self.response.items() if samples
+            },
+            "unit_wait_minutes": _minutes(self.unit_wait),
+            "unit_utilization": round(busy / (now * self.units), 3) if now else 0.0,
+            "beds": {
+                "free": self.beds_free,
+                "min_free": self.beds_min_free,
+                "released": self.beds_released,
+                "hours_full": round(full / 60, 3)
+            }
+        }
+
+    def run(self) -> Iterator[Dict]:
+        self.started = time.perf_counter()
+        self._setup()
+
+        horizon = self.hours * 60
+        step = self.report_hours * 60 if self.report_hours else horizon
+        until = min(step, horizon)
+        while until < horizon:
+            self._advance(until)
+            yield self.summary(final=False)
+            until += step
+
+        self._advance(horizon)
+        yield self.summary(final=True)
+
+
+def _minutes(samples: List[float]) -> Dict:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 2) if ordered else 0.0,
+        "p50": round(percentile(ordered, 50), 2),
+        "p95": round(percentile(ordered, 95), 2),
+        "p99": round(percentile(ordered, 99), 2)
+    }
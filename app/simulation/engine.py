@@ -0,0 +1,240 @@
+import math
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from app.core.config import settings
+from app.core.executor import AnalysisBusy, analysis_executor
+from app.core.ruleset import rule_store
+from app.core.stats import LatencyWindow
+from app.routing.hospitals import HospitalRegistry, hospital_registry
+from app.routing.router import recommend_hospitals
+from app.simulation import SIMULATED_CALLS, MockLocation
+from app.triage.triage_engine import encode_symptoms, triage_batch
+
+# Call-rate multiplier by simulated hour since the start of the run
+ARRIVAL_PROFILES: Dict[str, Callable[[float], float]] = {
+    "constant": lambda hours: 1.0,
+    # Normal load with a 4x surge in hours 1-3 of every 6
+    "surge": lambda hours: 4.0 if 1 <= hours % 6 < 3 else 1.0,
+    # Day / night cycle between 0.2x (03:00) and 1.8x (15:00), starting at midnight
+    "diurnal": lambda hours: 1 + 0.8 * math.sin((hours % 24 - 9) / 24 * 2 * math.pi)
+}
+
+# Synthetic callers are spread around this point
+CENTER = (23.2599, 77.4126)
+SPREAD = 0.05
+
+STAGES = ("analysis", "triage", "routing")
+
+# Retries of a batch while live traffic holds every analysis slot, waiting
+# 1, 2, 4 ... seconds in between (on top of ANALYSIS_WAIT_SECONDS per try)
+BUSY_RETRIES = 3
+BUSY_BACKOFF_SECONDS = 1.0
+
+# Analysis slots all simulations together may hold: live traffic keeps
+# at least one of ANALYSIS_MAX_IN_FLIGHT (unless that is 1)
+SIMULATION_SLOTS = max(1, min(settings.SIMULATION_MAX_CONCURRENCY, settings.ANALYSIS_MAX_IN_FLIGHT - 1))
+_simulation_slots = threading.BoundedSemaphore(SIMULATION_SLOTS)
+
+# (case number, arrival second, transcript, lat, lon)
+Case = Tuple[int, float, str, float, float]
+
+
+def generate_cases(seed: int, cases: int, profile: str, rate_per_hour: float) -> Iterator[Case]:
+    """
+    Synthetic calls with Poisson arrivals at rate_per_hour, scaled by the
+    profile. The same seed always gives the same calls.
+    """
+    rng = random.Random(seed)
+    multiplier = ARRIVAL_PROFILES[profile]
+    arrival = 0.0
+    for number in range(cases):
+        arrival += rng.expovariate(rate_per_hour * multiplier(arrival / 3600) / 3600)
+        yield (
+            number,
+            arrival,
+            rng.choice(SIMULATED_CALLS),
+            CENTER[0] + rng.uniform(-SPREAD, SPREAD),
+            CENTER[1] + rng.uniform(-SPREAD, SPREAD)
+        )
+
+
+class _Run:
+    """
+    Running totals for one simulation; nothing per case is kept.
+    """
+
+    def __init__(self, registry: HospitalRegistry):
+        self.registry = registry
+        self.started = time.perf_counter()
+        self.cases = 0
+        self.last_arrival = 0.0
+        self.urgency: Dict[str, int] = {}
+        self.assigned = 0
+        self.unassigned = 0
+        self.first_unassigned_at = None
+        self.beds_free = sum(h.available_beds for h in registry)
+        self.beds_exhausted_at = 0.0 if self.beds_free <= 0 else None
+        self.hospital_exhausted_at: Dict[str, float] = {}
+        self.stages = {stage: LatencyWindow() for stage in STAGES}
+
+    def summary(self, final: bool) -> Dict:
+        seconds = time.perf_counter() - self.started
+        return {
+            "type": "summary" if final else "progress",
+            "cases": self.cases,
+            "wall_seconds": round(seconds, 3),
+            "cases_per_second": round(self.cases / seconds, 1) if seconds else 0.0,
+            "simulated_hours": round(self.last_arrival / 3600, 3),
+            "urgency": dict(sorted(self.urgency.items())),
+            "assigned": self.assigned,
+            "unassigned": self.unassigned,
+            "first_unassigned_at_hours": _hours(self.first_unassigned_at),
+            "beds_exhausted_at_hours": _hours(self.beds_exhausted_at),
+            "hospitals": [
+                {
+                    "name": h.name,
+                    "beds_left": h.available_beds,
+                    "exhausted_at_hours": _hours(self.hospital_exhausted_at.get(h.id))
+                }
+                for h in self.registry
+            ],
+            # Per-case latency: each batch's stage time over its size
+            "stage_latency": {stage: window.summary() for stage, window in self.stages.items()}
+        }
+
+
+def _hours(seconds):
+    return None if seconds is None else round(seconds / 3600, 3)
+
+
+class SimulationEngine:
+    """
+    High-volume, reproducible load simulation against a copy of the
+    hospital registry: the live registry's beds, the incident store and
+    the event stream are never touched.
+
+    Cases are analyzed in NLP_BATCH_SIZE batches, up to `concurrency`
+    batches at a time, and routed in arrival order as batches complete,
+    so results for a seed do not depend on concurrency or timing. All
+    runs share SIMULATION_SLOTS analysis slots, so however many are
+    started they cannot crowd out live calls.
+
+    run() yields a progress summary every report_every cases and a final
+    one; if analysis stays busy through BUSY_RETRIES, an "error" line
+    comes before the final summary and the run stops there.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        cases: int = 1000,
+        profile: str = "constant",
+        rate_per_hour: float = 600.0,
+        concurrency: int = 1,
+        report_every: int = None
+    ):
+        if profile not in ARRIVAL_PROFILES:
+            raise ValueError(f"Unknown arrival profile: {profile} (expected one of {', '.join(ARRIVAL_PROFILES)})")
+        if not 0 < cases <= settings.SIMULATION_MAX_CASES:
+            raise ValueError(f"cases must be between 1 and {settings.SIMULATION_MAX_CASES}")
+        if rate_per_hour <= 0:
+            raise ValueError("rate_per_hour must be positive")
+        if not 1 <= concurrency <= settings.SIMULATION_MAX_CONCURRENCY:
+            raise ValueError(f"concurrency must be between 1 and {settings.SIMULATION_MAX_CONCURRENCY}")
+
+        self.seed = seed
+        self.cases = cases
+        self.profile = profile
+        self.rate_per_hour = rate_per_hour
+        self.concurrency = concurrency
+        self.report_every = report_every or settings.SIMULATION_REPORT_EVERY
+
+    def _analyze(self, batch: List[Case], ruleset) -> Tuple[List[Case], List[Dict], Dict[str, float]]:
+        start = time.perf_counter()
+        texts = [case[2] for case in batch]
+        # Simulations share the analysis slots with live traffic; back off
+        # and retry rather than fail the run when those are all taken
+        for attempt in range(BUSY_RETRIES + 1):
+            try:
+                with _simulation_slots:
+                    symptoms = analysis_executor.symptoms_batch(texts, ruleset)
+                break
+            except AnalysisBusy:
+                if attempt == BUSY_RETRIES:
+                    raise
+                time.sleep(BUSY_BACKOFF_SECONDS * 2 ** attempt)
+        analyzed = time.perf_counter()
+        results = triage_batch(encode_symptoms(symptoms, ruleset), ruleset)
+        timings = {"analysis": analyzed - start, "triage": time.perf_counter() - analyzed}
+        return batch, results, timings
+
+    def _route(self, run: _Run, batch: List[Case], results: List[Dict], timings: Dict[str, float]):
+        start = time.perf_counter()
+        for (_, arrival, _, lat, lon), result in zip(batch, results):
+            urgency = result["urgency"]
+            run.urgency[urgency] = run.urgency.get(urgency, 0) + 1
+            run.last_arrival = arrival
+
+            hospitals = recommend_hospitals(MockLocation(lat, lon), urgency, registry=run.registry)
+            if not hospitals:
+                run.unassigned += 1
+                if run.first_unassigned_at is None:
+                    run.first_unassigned_at = arrival
+                continue
+
+            run.assigned += 1
+            run.beds_free -= 1
+            if run.beds_free == 0:
+                run.beds_exhausted_at = arrival
+            hospital_id = hospitals[0]["hospital_id"]
+            if run.registry.capacity.available(hospital_id) == 0:
+                run.hospital_exhausted_at.setdefault(hospital_id, arrival)
+        timings["routing"] = time.perf_counter() - start
+
+        for stage, seconds in timings.items():
+            run.stages[stage].observe(seconds / len(batch))
+        run.cases += len(batch)
+
+    def run(self) -> Iterator[Dict]:
+        run = _Run(hospital_registry.copy())
+        # One rule set for the whole run, even if it is reloaded meanwhile
+        ruleset = rule_store.current()
+        cases = generate_cases(self.seed, self.cases, self.profile, self.rate_per_hour)
+        next_report = self.report_every
+
+        with ThreadPoolExecutor(self.concurrency, thread_name_prefix="simulation") as pool:
+            pending = deque()
+            while True:
+                # Keep `concurrency` batches analyzing; routing takes them in order
+                while len(pending) < self.concurrency:
+                    batch = list(islice(cases, settings.NLP_BATCH_SIZE))
+                    if not batch:
+                        break
+                    pending.append(pool.submit(self._analyze, batch, ruleset))
+                if not pending:
+                    break
+
+                try:
+                    analyzed = pending.popleft().result()
+                except AnalysisBusy:
+                    for future in pending:
+                        future.cancel()
+                    # Stop here, but still end the stream with what was simulated
+                    yield {
+                        "type": "error",
+                        "error": "analysis capacity exhausted by live traffic, simulation stopped early",
+                        "cases": run.cases
+                    }
+                    break
+                self._route(run, *analyzed)
+                if run.cases >= next_report and run.cases < self.cases:
+                    next_report += self.report_every
+                    yield run.summary(final=False)
+
+        yield run.summary(final=True)
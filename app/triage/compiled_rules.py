@@ -0,0 +1,160 @@
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+WORD_BITS = 64
+
+# Rows are matched against the rule masks in chunks to bound the size of
+# the (rows x rules x words) intermediate.
+BATCH_CHUNK = 4096
+
+# Distinct symptom masks whose triage outcome is memoized by triage()
+MEMO_SIZE = 65536
+
+
+class CompiledTier:
+    def __init__(self, urgency: str, dispatch_required: bool, masks: List[int], reasons: List[str]):
+        self.urgency = urgency
+        self.dispatch_required = dispatch_required
+        self.masks = masks
+        self.reasons = reasons
+
+
+class CompiledRules:
+    """
+    Triage rule tables compiled into integer bitmasks over a symptom index.
+
+    A rule matches when (symptom_mask & rule_mask) == rule_mask, which is
+    the same test as rule["pattern"].issubset(symptoms). Tiers are checked
+    in the order given; the first tier with any matching rule wins.
+    """
+
+    def __init__(self, tiers: Iterable[Tuple[str, bool, List[Dict]]], fallback: Dict):
+        tiers = list(tiers)
+        self.fallback = fallback
+
+        self.symptom_index: Dict[str, int] = {}
+        for _, _, rules in tiers:
+            for rule in rules:
+                for symptom in sorted(rule["pattern"]):
+                    self.symptom_index.setdefault(symptom, len(self.symptom_index))
+
+        self.words = max(1, -(-len(self.symptom_index) // WORD_BITS))
+
+        self.tiers: List[CompiledTier] = [
+            CompiledTier(
+                urgency,
+                dispatch_required,
+                [self.mask(rule["pattern"]) for rule in rules],
+                [rule["reason"] for rule in rules]
+            )
+            for urgency, dispatch_required, rules in tiers
+        ]
+
+        # Same masks split into uint64 words for triage_batch
+        self._tier_words = [self._split(tier.masks) for tier in self.tiers]
+
+        # mask -> (tier, reasons); tier is None for the fallback
+        self._memo: Dict[int, Tuple] = {}
+
+    def mask(self, symptoms: Iterable[str]) -> int:
+        """
+        Bitmask of the given symptoms. Symptoms no rule refers to are ignored,
+        since they cannot affect any match.
+        """
+        index = self.symptom_index
+        mask = 0
+        for symptom in symptoms:
+            bit = index.get(symptom)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def _split(self, masks: List[int]) -> np.ndarray:
+        words = np.zeros((len(masks), self.words), dtype=np.uint64)
+        for row, mask in enumerate(masks):
+            for word in range(self.words):
+                words[row, word] = (mask >> (word * WORD_BITS)) & 0xFFFFFFFFFFFFFFFF
+        return words
+
+    def encode(self, symptom_lists: Iterable[Iterable[str]]) -> np.ndarray:
+        """
+        Encodes one symptom list per row into a (rows x words) uint64 matrix
+        of symptom masks, the input format of triage_batch.
+        """
+        return self._split([self.mask(symptoms) for symptoms in symptom_lists])
+
+    def _result(self, tier: CompiledTier, reasons: List[str]) -> Dict:
+        if tier is None:
+            return {
+                "urgency": self.fallback["urgency"],
+                "dispatch_required": self.fallback["dispatch_required"],
+                "reasoning": list(self.fallback["reasoning"])
+            }
+        return {
+            "urgency": tier.urgency,
+            "dispatch_required": tier.dispatch_required,
+            "reasoning": list(reasons)
+        }
+
+    def _evaluate(self, mask: int) -> Tuple:
+        for tier in self.tiers:
+            reasons = [
+                reason
+                for rule_mask, reason in zip(tier.masks, tier.reasons)
+                if mask & rule_mask == rule_mask
+            ]
+            if reasons:
+                return tier, reasons
+        return None, None
+
+    def triage(self, symptoms: Iterable[str]) -> Dict:
+        mask = self.mask(symptoms)
+
+        outcome = self._memo.get(mask)
+        if outcome is None:
+            outcome = self._evaluate(mask)
+            if len(self._memo) >= MEMO_SIZE:
+                self._memo.clear()
+            self._memo[mask] = outcome
+
+        return self._result(*outcome)
+
+    def triage_batch(self, symptom_masks: np.ndarray) -> List[Dict]:
+        """
+        Vectorized triage over a (rows x words) uint64 matrix of symptom masks
+        (see encode). Returns one result per row, identical to triage().
+        """
+        symptom_masks = np.asarray(symptom_masks, dtype=np.uint64).reshape(-1, self.words)
+        if not len(symptom_masks):
+            return []
+
+        # Each distinct mask is matched once and fanned back out
+        unique, inverse = np.unique(symptom_masks, axis=0, return_inverse=True)
+        outcomes = self._match_rows(unique)
+
+        return [self._result(*outcomes[i]) for i in inverse.reshape(-1)]
+
+    def _match_rows(self, symptom_masks: np.ndarray) -> List[Tuple]:
+        outcomes: List[Tuple] = [(None, None)] * len(symptom_masks)
+
+        for start in range(0, len(symptom_masks), BATCH_CHUNK):
+            chunk = symptom_masks[start:start + BATCH_CHUNK]
+            pending = np.ones(len(chunk), dtype=bool)
+
+            for tier, rule_words in zip(self.tiers, self._tier_words):
+                if not pending.any() or not len(rule_words):
+                    continue
+
+                rows = np.flatnonzero(pending)
+                hits = (
+                    (chunk[rows, None, :] & rule_words[None, :, :]) == rule_words[None, :, :]
+                ).all(axis=2)
+
+                matched_rows = hits.any(axis=1)
+
+                for row, matched in zip(rows[matched_rows], hits[matched_rows]):
+                    outcomes[start + row] = (tier, [tier.reasons[i] for i in np.flatnonzero(matched)])
+                    pending[row] = False
+
+        return outcomes
@@ -1,32 +0,0 @@
-SYMPTOM_SEVERITY = {
-    "CRITICAL": [
-        "not breathing",
-        "unconscious",
-        "cardiac arrest",
-        "severe bleeding",
-        "heart attack",
-        "stroke",
-        "seizure"
-    ],
-    "HIGH": [
-        "chest pain",
-        "difficulty breathing",
-        "shortness of breath",
-        "high fever",
-        "head injury",
-        "severe pain"
-    ],
-    "MEDIUM": [
-        "vomiting",
-        "fracture",
-        "burn",
-        "moderate bleeding",
-        "abdominal pain"
-    ],
-    "LOW": [
-        "headache",
-        "mild fever",
-        "cold",
-        "cough"
-    ]
-}
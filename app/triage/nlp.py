@@ -1,13 +1,21 @@
-from transformers import pipeline
+from app.core.models import model_registry
 
-classifier = pipeline(
-    task="text-classification",
-    model="distilbert-base-uncased-finetuned-sst-2-english",
-    framework="pt"   # 🔥 FORCE PYTORCH, NOT TENSORFLOW
-)
+
+def _load_classifier():
+    # Imported lazily: importing transformers alone takes seconds
+    from transformers import pipeline
+
+    return pipeline(
+        task="text-classification",
+        model="distilbert-base-uncased-finetuned-sst-2-english",
+        framework="pt"   # 🔥 FORCE PYTORCH, NOT TENSORFLOW
+    )
+
+
+model_registry.register("severity_classifier", _load_classifier)
 
 def classify_text(text: str):
-    result = classifier(text)[0]
+    result = model_registry.get("severity_classifier")(text)[0]
     score = result["score"]
 
     if score > 0.85:
@@ -1,57 +1,39 @@
-from typing import List, Dict
-from app.triage.rules import CRITICAL_RULES, HIGH_RULES, MEDIUM_RULES
+from typing import Iterable, List, Dict
 
+import numpy as np
 
-def evaluate_rules(symptoms: set, rules: List[Dict]) -> List[str]:
+from app.core.ruleset import RuleSet, rule_store
+
+
+def triage(symptoms: List[str], ruleset: RuleSet = None) -> Dict:
     """
-    Checks which rules match the given symptoms.
-    Returns reasoning strings for matched rules.
+    Determines urgency and dispatch requirement based on symptoms.
+    Uses the active rule set unless one is given; the result records
+    which rule set version produced it.
     """
-    reasons = []
-    for rule in rules:
-        if rule["pattern"].issubset(symptoms):
-            reasons.append(rule["reason"])
-    return reasons
+    ruleset = ruleset or rule_store.current()
 
+    result = ruleset.triage.triage(symptoms)
+    result["rule_version"] = ruleset.version
+    return result
 
-def triage(symptoms: List[str]) -> Dict:
+
+def encode_symptoms(symptom_lists: Iterable[List[str]], ruleset: RuleSet = None) -> np.ndarray:
     """
-    Determines urgency and dispatch requirement based on symptoms.
+    Encodes symptom lists into the symptom-mask matrix used by triage_batch.
+    Masks are only valid for the rule set that encoded them.
+    """
+    return (ruleset or rule_store.current()).triage.encode(symptom_lists)
+
+
+def triage_batch(symptom_masks: np.ndarray, ruleset: RuleSet = None) -> List[Dict]:
+    """
+    Vectorized triage over a matrix of symptom masks (see encode_symptoms).
+    Returns one triage result per row, in order.
     """
+    ruleset = ruleset or rule_store.current()
 
-    symptom_set = set(symptoms)
-    reasoning = []
-
-    # CRITICAL has highest priority
-    critical_reasons = evaluate_rules(symptom_set, CRITICAL_RULES)
-    if critical_reasons:
-        return {
-            "urgency": "CRITICAL",
-            "dispatch_required": True,
-            "reasoning": critical_reasons
-        }
-
-    # HIGH priority
-    high_reasons = evaluate_rules(symptom_set, HIGH_RULES)
-    if high_reasons:
-        return {
-            "urgency": "HIGH",
-            "dispatch_required": True,
-            "reasoning": high_reasons
-        }
-
-    # MEDIUM priority
-    medium_reasons = evaluate_rules(symptom_set, MEDIUM_RULES)
-    if medium_reasons:
-        return {
-            "urgency": "MEDIUM",
-            "dispatch_required": False,
-            "reasoning": medium_reasons
-        }
-
-    # Default: LOW
-    return {
-        "urgency": "LOW",
-        "dispatch_required": False,
-        "reasoning": ["No emergency symptom patterns detected"]
-    }
+    results = ruleset.triage.triage_batch(symptom_masks)
+    for result in results:
+        result["rule_version"] = ruleset.version
+    return results
@@ -1,7 +1,9 @@
 import math
 
+EARTH_RADIUS_KM = 6371
+
 def haversine(lat1, lon1, lat2, lon2):
-    R = 6371
+    R = EARTH_RADIUS_KM
     dlat = math.radians(lat2 - lat1)
     dlon = math.radians(lon2 - lon1)
     a = (
@@ -11,3 +13,7 @@ def haversine(lat1, lon1, lat2, lon2):
         * math.sin(dlon / 2) ** 2
     )
     return R * (2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)))
+
+def travel_minutes(lat1, lon1, lat2, lon2, speed_kmh):
+    # Straight-line distance at an average road speed
+    return haversine(lat1, lon1, lat2, lon2) / speed_kmh * 60
@@ -0,0 +1,82 @@
+"""
+Backfill throughput: one POST /analyze per transcript vs POST /analyze/batch
+with a JSON array and with a streamed NDJSON upload.
+
+Transcripts are made unique so the symptom cache never hits. transient_mb
+is tracemalloc's peak minus what is still allocated after the response
+(mostly the new incidents): the request's own working memory, which for
+NDJSON should stay flat as the upload grows.
+
+    python -m benchmarks.bench_batch [transcripts]
+"""
+import json
+import sys
+import time
+import tracemalloc
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from app.incident import service
+from app.incident.repository import IncidentRepository
+from app.main import app
+from app.simulation import SIMULATED_CALLS
+from benchmarks.common import print_report
+
+DEFAULT_TRANSCRIPTS = 2000
+
+
+def transcripts(n: int, tag: str):
+    return [f"{SIMULATED_CALLS[i % len(SIMULATED_CALLS)]} ({tag} call {i})" for i in range(n)]
+
+
+def measure(fn, n: int) -> dict:
+    # A fresh in-memory repository per run
+    with mock.patch.object(service, "incident_repository", IncidentRepository()):
+        tracemalloc.start()
+        start = time.perf_counter()
+        fn()
+        seconds = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "seconds": round(seconds, 2),
+        "per_second": round(n / seconds),
+        "transient_mb": round((peak - current) / 2 ** 20, 1)
+    }
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TRANSCRIPTS
+    client = TestClient(app)
+    client.post("/analyze", json={"text": "warm up"})
+
+    def sequential():
+        for text in transcripts(n, "sequential"):
+            client.post("/analyze", json={"text": text}).raise_for_status()
+
+    def array():
+        client.post("/analyze/batch", json=transcripts(n, "array")).raise_for_status()
+
+    def ndjson(size):
+        def body():
+            for text in transcripts(size, f"ndjson {size}"):
+                yield json.dumps({"text": text, "lat": 23.25, "lon": 77.42}).encode() + b"\n"
+
+        def upload():
+            with client.stream("POST", "/analyze/batch", content=body(), headers={"content-type": "application/x-ndjson"}) as response:
+                for _ in response.iter_lines():
+                    pass
+        return upload
+
+    rows = {
+        "POST /analyze x n": measure(sequential, n),
+        "batch, JSON array": measure(array, n),
+        "batch, NDJSON": measure(ndjson(n), n),
+        "batch, NDJSON 4n": measure(ndjson(n * 4), n * 4)
+    }
+    print_report(f"{n} transcripts", rows)
+
+
+if __name__ == "__main__":
+    main()
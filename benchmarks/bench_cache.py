@@ -0,0 +1,66 @@
+"""
+Symptom cache: a call surge of repeated transcripts with and without the
+cache, and memory under a flood of unique transcripts (the cache should
+stay at max_entries, evicting, however many arrive).
+
+    python -m benchmarks.bench_cache
+"""
+import random
+import tracemalloc
+
+from app.core.cache import LRUCache
+from app.core.executor import AnalysisExecutor
+from app.simulation import SIMULATED_CALLS
+from benchmarks.common import print_report, time_calls
+
+SURGE_CALLS = 2000
+# Distinct wordings in the surge; real surges repeat a handful of reports
+SURGE_VARIANTS = 25
+UNIQUE_CALLS = 50_000
+CACHE_SIZE = 1000
+
+
+def main():
+    rng = random.Random(17)
+    variants = [f"{rng.choice(SIMULATED_CALLS)} at gate {i}" for i in range(SURGE_VARIANTS)]
+    # Same reports with ragged spacing, as they come in from SMS
+    surge = [rng.choice(variants).replace(" ", rng.choice([" ", "  "]), 1) for _ in range(SURGE_CALLS)]
+
+    rows = {}
+    for name, cache in (("uncached", None), ("cached", LRUCache(CACHE_SIZE, ttl_seconds=600))):
+        executor = AnalysisExecutor("thread", 1, cache=cache)
+        rows[f"surge {name}"] = time_calls(executor.analyze, surge)
+        if cache:
+            stats = cache.stats()
+            rows["surge cache"] = {k: stats[k] for k in ("entries", "hits", "misses", "hit_rate")}
+        executor.stop()
+
+    cache = LRUCache(CACHE_SIZE)
+    version = ("models", "rules")
+    tracemalloc.start()
+    for i in range(UNIQUE_CALLS):
+        text = f"caller {i} reports {rng.choice(SIMULATED_CALLS)}"
+        key = cache.key(text)
+        if cache.get(key, version) is None:
+            cache.put(key, version, ("chest pain", "diaphoresis"))
+        if i == CACHE_SIZE - 1:
+            full = tracemalloc.get_traced_memory()[0]
+    end = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    stats = cache.stats()
+    rows[f"{UNIQUE_CALLS} unique"] = {
+        "entries": stats["entries"],
+        "evictions": stats["evictions"],
+        "kb_when_full": full // 1024,
+        "kb_at_end": end // 1024
+    }
+
+    cache.get(cache.key("chest pain"), ("models", "rules v2"))
+    rows["after rule change"] = {k: cache.stats()[k] for k in ("entries", "invalidations")}
+
+    print_report("symptom cache", rows)
+
+
+if __name__ == "__main__":
+    main()
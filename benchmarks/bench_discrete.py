@@ -0,0 +1,38 @@
+"""
+Discrete-event simulation speed: simulated hours per wall-clock second and
+events per second on one core, across fleet sizes and queue policies.
+
+    python -m benchmarks.bench_discrete [days]
+"""
+import sys
+
+from app.simulation.discrete import DiscreteEventSimulation
+from benchmarks.common import print_report
+
+DEFAULT_DAYS = 30
+CONFIGS = [
+    ("10 units, urgency", {"units": 10, "queue_policy": "urgency"}),
+    ("10 units, fifo", {"units": 10, "queue_policy": "fifo"}),
+    ("50 units, urgency", {"units": 50, "queue_policy": "urgency"}),
+    ("200 units, urgency", {"units": 200, "queue_policy": "urgency"})
+]
+
+
+def main():
+    days = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DAYS
+    rows = {}
+    for label, config in CONFIGS:
+        *_, summary = DiscreteEventSimulation(seed=42, hours=days * 24, rate_per_hour=30, **config).run()
+        high = summary["response_minutes"].get("HIGH", {})
+        rows[label] = {
+            "wall_s": summary["wall_seconds"],
+            "sim_hours_per_s": round(summary["simulated_hours"] / summary["wall_seconds"]),
+            "events_per_s": summary["events_per_second"],
+            "high_p95_min": high.get("p95"),
+            "utilization": summary["unit_utilization"]
+        }
+    print_report(f"discrete-event simulation, {days:g} days at 30 calls/h", rows)
+
+
+if __name__ == "__main__":
+    main()
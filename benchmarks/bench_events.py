@@ -0,0 +1,64 @@
+"""
+Incident push vs polling: server-side cost per 5-second window with N
+consoles open, for the old full-list poll (3 pages per console) and for
+pushing each change once through the EventBus.
+
+    python -m benchmarks.bench_events
+"""
+import asyncio
+import json
+import random
+import time
+
+from app.incident.models import INCIDENT_FIELDS
+from app.core.events import EventBus
+from benchmarks.bench_repository import make_incidents
+from benchmarks.common import print_report
+
+INCIDENTS = 2000
+CHANGES_PER_WINDOW = 50
+CONSOLES = [10, 100]
+PAGES_PER_CONSOLE = 3
+
+
+def as_payload(incident):
+    return incident.to_dict(INCIDENT_FIELDS)
+
+
+async def push_window(consoles: int, changed) -> float:
+    bus = EventBus(max_pending=1000)
+    subscriptions = [bus.subscribe() for _ in range(consoles * PAGES_PER_CONSOLE)]
+
+    start = time.perf_counter()
+    for incident in changed:
+        bus.publish("incident.updated", incident.id, as_payload(incident))
+    delivered = 0
+    for subscription in subscriptions:
+        delivered += len(await subscription.get(timeout=1))
+    seconds = time.perf_counter() - start
+
+    assert delivered == len(changed) * len(subscriptions)
+    return seconds
+
+
+def poll_window(consoles: int, incidents) -> float:
+    start = time.perf_counter()
+    for _ in range(consoles * PAGES_PER_CONSOLE):
+        json.dumps([as_payload(i) for i in incidents], default=str)
+    return time.perf_counter() - start
+
+
+def main():
+    incidents = make_incidents(INCIDENTS, random.Random(13))
+    changed = incidents[-CHANGES_PER_WINDOW:]
+    rows = {}
+
+    for consoles in CONSOLES:
+        rows[f"{consoles} consoles: poll"] = {"ms_per_window": round(poll_window(consoles, incidents) * 1000, 1)}
+        rows[f"{consoles} consoles: push"] = {"ms_per_window": round(asyncio.run(push_window(consoles, changed)) * 1000, 1)}
+
+    print_report(f"incident updates ({INCIDENTS} incidents, {CHANGES_PER_WINDOW} changes per 5s)", rows)
+
+
+if __name__ == "__main__":
+    main()
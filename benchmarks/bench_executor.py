@@ -0,0 +1,89 @@
+"""
+Analysis throughput, thread pool vs process pool, across worker counts.
+
+Each configuration gets 2 client threads per worker calling analyze() on
+simulated transcripts. Thread mode should flatten out at ~1 worker's
+throughput (the GIL); process mode should scale with cores. Private MB is
+each worker's unshared memory (Linux only): with fork the models stay
+shared copy-on-write, so it should be far below the models' size.
+
+    python -m benchmarks.bench_executor [max_workers] [calls]
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+from app.core.executor import AnalysisExecutor
+from app.simulation import SIMULATED_CALLS
+from benchmarks.common import print_report, summarize
+
+
+def private_mb(pid: int):
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            kb = sum(int(line.split()[1]) for line in f if line.startswith("Private_"))
+        return round(kb / 1024, 1)
+    except OSError:
+        return None
+
+
+def run(mode: str, workers: int, texts):
+    executor = AnalysisExecutor(mode, workers, max_in_flight=workers * 4, wait_seconds=600)
+    executor.start()
+    for text in texts[:workers * 2]:
+        executor.analyze(text)
+
+    samples = []
+    lock = threading.Lock()
+    clients = workers * 2
+
+    def client(part):
+        local = []
+        for text in part:
+            start = time.perf_counter()
+            executor.analyze(text)
+            local.append(time.perf_counter() - start)
+        with lock:
+            samples.extend(local)
+
+    threads = [threading.Thread(target=client, args=(texts[i::clients],)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    row = {"per_s": round(len(texts) / seconds, 1), **summarize(samples)}
+    if mode == "process":
+        sizes = [private_mb(pid) for pid in executor._pool._processes]
+        if None not in sizes:
+            row["private_mb"] = max(sizes)
+
+    executor.stop()
+    return row
+
+
+def main():
+    cores = os.cpu_count() or 1
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else cores
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+
+    rng = random.Random(16)
+    # Vary the wording so nothing downstream can lean on exact repeats
+    texts = [f"{rng.choice(SIMULATED_CALLS)} since {rng.randint(1, 59)} minutes" for _ in range(calls)]
+
+    counts = sorted({n for n in (1, 2, 4, 8, 16, max_workers) if n <= max_workers})
+    rows = {}
+    # Process mode first: forking is only safe before the thread pools exist
+    for mode in ("process", "thread"):
+        for workers in counts:
+            rows[f"{mode} x{workers}"] = run(mode, workers, texts)
+
+    print_report(f"analysis throughput ({calls} calls, {cores} cores)", rows)
+
+
+if __name__ == "__main__":
+    main()
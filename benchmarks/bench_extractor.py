@@ -0,0 +1,66 @@
+"""
+Per-call latency of entity extraction on the SIMULATED_CALLS corpus.
+
+Compares the previous approach (three full scispaCy pipelines, each
+tokenizing, tagging and parsing the text) with the shared-tokenization
+ExtractionEngine, then compares a per-text loop with the batched
+nlp.pipe path on a larger replay.
+
+    python -m benchmarks.bench_extractor
+"""
+import sys
+import time
+
+import spacy
+
+from app.medical_nlp.extractor import MODEL_NAMES, ExtractionEngine, collect_entities
+from app.simulation import SIMULATED_CALLS
+from benchmarks.common import print_report, time_calls
+
+REPEAT = 20
+REPLAY_SIZE = 2000
+
+
+def bench_single(engine: ExtractionEngine):
+    legacy_models = [spacy.load(name) for name in MODEL_NAMES]
+
+    def legacy_extract(text):
+        return collect_entities(nlp(text) for nlp in legacy_models)
+
+    for text in SIMULATED_CALLS:
+        assert legacy_extract(text) == engine.extract(text)["entities"], text
+
+    print_report("extract_medical_entities", {
+        "three full pipelines": time_calls(legacy_extract, SIMULATED_CALLS, REPEAT),
+        "ExtractionEngine": time_calls(engine.extract, SIMULATED_CALLS, REPEAT),
+    })
+
+
+def bench_batch(engine: ExtractionEngine, n_process: int = 1, batch_size: int = 64):
+    texts = [SIMULATED_CALLS[i % len(SIMULATED_CALLS)] for i in range(REPLAY_SIZE)]
+
+    start = time.perf_counter()
+    looped = [engine.extract(text) for text in texts]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = engine.extract_batch(texts, batch_size=batch_size, n_process=n_process)
+    batch_seconds = time.perf_counter() - start
+
+    assert looped == batched
+
+    print_report(f"{REPLAY_SIZE} transcripts", {
+        "per-text loop": {"texts_per_s": round(REPLAY_SIZE / loop_seconds, 1)},
+        f"extract_batch (n_process={n_process})": {"texts_per_s": round(REPLAY_SIZE / batch_seconds, 1)},
+    })
+
+
+def main():
+    n_process = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    engine = ExtractionEngine()
+    bench_single(engine)
+    bench_batch(engine, n_process=n_process)
+
+
+if __name__ == "__main__":
+    main()
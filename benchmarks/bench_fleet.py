@@ -0,0 +1,92 @@
+"""
+Nearest-available-unit assignment at city and state fleet sizes: the
+fleet's spatial index vs a linear haversine scan over free units.
+
+Each round assigns a unit to a random incident and releases a random busy
+one at its destination, so the free set keeps churning (about half the
+fleet stays busy), as it would under sustained load.
+
+    python -m benchmarks.bench_fleet
+"""
+import random
+import time
+
+from app.dispatch.fleet import Fleet, SUITABLE_UNITS, UnitStatus
+from app.utils.geo import haversine
+from benchmarks.bench_spatial import LAT_RANGE, LON_RANGE
+from benchmarks.common import print_report, summarize, time_calls
+
+SIZES = [1_000, 10_000]
+ROUNDS = 2_000
+URGENCIES = list(SUITABLE_UNITS)
+
+
+def build(n: int, rng: random.Random) -> Fleet:
+    fleet = Fleet()
+    fleet.load_records(
+        {"id": f"U{i}", "type": rng.choice(("ALS", "BLS")), "lat": rng.uniform(*LAT_RANGE), "lon": rng.uniform(*LON_RANGE)}
+        for i in range(n)
+    )
+    return fleet
+
+
+def linear_nearest(fleet: Fleet, lat: float, lon: float, urgency: str):
+    suitable = SUITABLE_UNITS[urgency]
+    return min(
+        (
+            (haversine(lat, lon, unit.lat, unit.lon), unit.id)
+            for unit in fleet._units.values()
+            if unit.status == UnitStatus.AVAILABLE and unit.type in suitable
+        ),
+        default=None
+    )
+
+
+def point(rng: random.Random):
+    return rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE)
+
+
+def main():
+    rows = {}
+    for n in SIZES:
+        rng = random.Random(25)
+        fleet = build(n, rng)
+        busy = []
+
+        # Half the fleet out on calls before measuring
+        for i in range(n // 2):
+            fleet.assign(f"warm{i}", *point(rng), rng.choice(URGENCIES), destination=point(rng))
+            busy.append(f"warm{i}")
+
+        assign_s, release_s = [], []
+        for i in range(ROUNDS):
+            lat, lon = point(rng)
+            urgency, destination = rng.choice(URGENCIES), point(rng)
+
+            start = time.perf_counter()
+            assigned = fleet.assign(f"I{i}", lat, lon, urgency, destination)
+            assign_s.append(time.perf_counter() - start)
+            if assigned:
+                busy.append(f"I{i}")
+
+            incident_id = busy.pop(rng.randrange(len(busy)))
+            start = time.perf_counter()
+            fleet.release(incident_id, completed=True)
+            release_s.append(time.perf_counter() - start)
+
+        queries = [(*point(rng), rng.choice(URGENCIES)) for _ in range(200)]
+        rows[f"{n} units: assign"] = summarize(assign_s)
+        rows[f"{n} units: release"] = summarize(release_s)
+        rows[f"{n} units: linear scan"] = time_calls(lambda q: linear_nearest(fleet, *q), queries)
+
+        # Both agree on the nearest unit
+        lat, lon = point(rng)
+        expected = linear_nearest(fleet, lat, lon, "CRITICAL")
+        unit, _ = fleet.assign("check", lat, lon, "CRITICAL")
+        assert unit.id == expected[1], (unit.id, expected)
+
+    print_report("nearest available unit", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Memory per in-memory incident: the previous __dict__ Incident with a list
+of audit-log dicts (ISO timestamps built eagerly) vs the slotted Incident
+with enum urgency/status and a columnar AuditLog.
+
+Every incident gets the INCIDENT_CREATED and DISPATCH_RECOMMENDED events
+a typical /analyze call produces. Needs a few GB of RAM at the default
+size.
+
+    python -m benchmarks.bench_incident_memory [incidents]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from uuid import uuid4
+
+from app.incident.models import Incident
+from benchmarks.common import print_report
+
+DEFAULT_INCIDENTS = 1_000_000
+SYMPTOMS = ["chest pain", "diaphoresis"]
+TRIAGE = {"urgency": "HIGH", "dispatch_required": True, "reasoning": ["Chest pain requires urgent evaluation"], "rule_version": "1.0.0"}
+
+
+class DictIncident:
+    # The representation incidents used before: plain attributes and a
+    # list of audit dicts with eagerly formatted timestamps
+    def __init__(self, input_text, symptoms, triage_result, lat=None, lon=None):
+        self.id = str(uuid4())
+        self.lat = lat
+        self.lon = lon
+        self.created_at = datetime.utcnow()
+        self.updated_at = self.created_at
+        self.input_text = input_text
+        self.symptoms = symptoms
+        self.urgency = triage_result["urgency"]
+        self.dispatch_required = triage_result["dispatch_required"]
+        self.reasoning = triage_result["reasoning"]
+        self.rule_version = triage_result.get("rule_version")
+        self.status = "TRIAGED"
+        self.dispatch_decision = None
+        self.dispatch_confirmed = False
+        self.override_reason = None
+        self.bed_reservation_id = None
+        self.audit_log = [{
+            "timestamp": self.created_at.isoformat(),
+            "event": "INCIDENT_CREATED",
+            "details": {"urgency": self.urgency, "dispatch_required": self.dispatch_required, "rule_version": self.rule_version}
+        }]
+
+    def log_event(self, event, details):
+        self.audit_log.append({"timestamp": datetime.utcnow().isoformat(), "event": event, "details": details})
+        self.updated_at = datetime.utcnow()
+
+
+def build(cls, n: int):
+    incidents = []
+    for i in range(n):
+        incident = cls(f"Caller {i} reports chest pain and sweating", list(SYMPTOMS), TRIAGE, 23.25, 77.42)
+        incident.log_event("DISPATCH_RECOMMENDED", {"hospital_id": "H1", "eta_minutes": 12})
+        incidents.append(incident)
+    return incidents
+
+
+def measure(cls, n: int):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    incidents = build(cls, n)
+    seconds = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # The list holding them is the same for both; leave it out
+    size -= sys.getsizeof(incidents)
+    del incidents
+    gc.collect()
+    return {
+        "total_mb": round(size / 2 ** 20, 1),
+        "bytes_per_incident": size // n,
+        "build_s": round(seconds, 2)
+    }
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_INCIDENTS
+    rows = {
+        "dict + audit dicts": measure(DictIncident, n),
+        "slotted + AuditLog": measure(Incident, n)
+    }
+    print_report(f"memory for {n} incidents", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+GET /incidents response time at 10k and 100k incidents: the previous path
+(dicts through FastAPI's jsonable_encoder + json.dumps) vs pre-encoded
+fragments, cold (nothing cached yet) and warm, plus the full HTTP request.
+Uses the in-memory store; the SQLite store builds new incidents on every
+read, so there every request takes the cold path.
+
+    python -m benchmarks.bench_incidents_response
+"""
+import random
+import time
+from unittest import mock
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.api import routes
+from app.incident.models import INCIDENT_FIELDS
+from app.incident.repository import IncidentRepository
+from app.main import app
+from benchmarks.bench_repository import make_incidents
+from benchmarks.common import print_report
+
+SIZES = [10_000, 100_000]
+REPEAT = 5
+
+
+def timed(fn, repeat: int = REPEAT) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = len(fn())
+        samples.append(time.perf_counter() - start)
+    return {"best_ms": round(min(samples) * 1000, 1), "mean_ms": round(sum(samples) / len(samples) * 1000, 1), "kb": size // 1024}
+
+
+def main():
+    rng = random.Random(21)
+    rows = {}
+
+    for n in SIZES:
+        repository = IncidentRepository()
+        for incident in make_incidents(n, rng):
+            repository.save(incident)
+
+        def previous():
+            incidents = repository.query()
+            return JSONResponse(jsonable_encoder([i.to_dict(INCIDENT_FIELDS) for i in incidents])).body
+
+        def fragments():
+            return routes.get_incidents(
+                urgency=None, status=None, created_after=None, created_before=None,
+                since=None, cursor=None, limit=None, fields=None
+            ).body
+
+        def cold():
+            for incident in repository.all():
+                incident._json = None
+            return fragments()
+
+        with mock.patch.object(routes, "incident_repository", repository):
+            rows[f"{n}: previous"] = timed(previous)
+            rows[f"{n}: fragments cold"] = timed(cold)
+            rows[f"{n}: fragments warm"] = timed(fragments)
+
+            client = TestClient(app)
+            rows[f"{n}: HTTP warm"] = timed(lambda: client.get("/incidents").content)
+
+    print_report("GET /incidents", rows)
+
+
+if __name__ == "__main__":
+    main()
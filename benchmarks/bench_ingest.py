@@ -0,0 +1,52 @@
+"""
+Webhook surge: acknowledgement latency of /webhooks/sms while the ingest
+workers drain the backlog, then the queue's own wait/stage statistics.
+
+    python -m benchmarks.bench_ingest [messages]
+"""
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+from app.ingest.ingest_queue import ingest_queue
+from app.main import app
+from app.simulation import SIMULATED_CALLS
+from benchmarks.common import print_report, summarize
+
+CLIENT_THREADS = 16
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = random.Random(14)
+    bodies = [rng.choice(SIMULATED_CALLS) for _ in range(messages)]
+
+    with TestClient(app) as client:
+        def post(body):
+            start = time.perf_counter()
+            response = client.post("/webhooks/sms", data={"Body": body, "From": "+10000000000"})
+            return response.status_code, time.perf_counter() - start
+
+        with ThreadPoolExecutor(CLIENT_THREADS) as pool:
+            results = list(pool.map(post, bodies))
+
+        while ingest_queue.depth():
+            time.sleep(0.1)
+        time.sleep(0.5)
+        stats = ingest_queue.stats()
+
+    acks = [seconds for status, seconds in results if status == 200]
+    rows = {"webhook ack": {**summarize(acks), "rejected": len(results) - len(acks)}}
+    rows["queue wait"] = stats["wait"]
+    for stage, summary in stats["stages"].items():
+        rows[f"stage: {stage}"] = summary
+    rows["enqueue -> incident"] = stats["enqueue_to_incident"]
+
+    print_report(f"SMS surge ({messages} messages, {stats['workers']} workers)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Cost of the stage timing hooks: a bare loop vs time_stage() with metrics
+off (shared no-op) and on (perf_counter + histogram observe).
+
+    python -m benchmarks.bench_metrics
+"""
+import time
+
+from app.core import metrics as metrics_module
+from app.core.metrics import time_stage
+from benchmarks.common import print_report
+
+CALLS = 200_000
+
+
+def ns_per_call(body) -> float:
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        body()
+    return round((time.perf_counter() - start) / CALLS * 1e9, 1)
+
+
+def bare():
+    pass
+
+
+def timed():
+    with time_stage("bench"):
+        pass
+
+
+def main():
+    registry = metrics_module.metrics
+    enabled = registry.enabled
+    rows = {"bare loop": {"ns_per_call": ns_per_call(bare)}}
+    try:
+        for state in (False, True):
+            registry.enabled = state
+            rows[f"time_stage ({'on' if state else 'off'})"] = {"ns_per_call": ns_per_call(timed)}
+    finally:
+        registry.enabled = enabled
+    print_report("stage timing overhead", rows)
+
+
+if __name__ == "__main__":
+    main()
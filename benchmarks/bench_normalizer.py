@@ -0,0 +1,71 @@
+"""
+normalize_entities with a growing symptom vocabulary.
+
+Compares the previous entity x canonical x variant substring loop with
+the compiled SymptomMatcher, scaling the dictionary up to 10k phrases.
+
+    python -m benchmarks.bench_normalizer
+"""
+import random
+
+from app.core.ruleset import rule_store
+from app.medical_nlp.patterns import SymptomMatcher
+from benchmarks.common import print_report, time_calls
+
+CANONICAL_SYMPTOMS = rule_store.current().canonical_symptoms
+VOCAB_SIZES = [len(sum(CANONICAL_SYMPTOMS.values(), [])), 100, 1000, 10000]
+VARIANTS_PER_SYMPTOM = 5
+ENTITIES = 200
+
+
+def synthetic_vocabulary(size: int, rng: random.Random) -> dict:
+    vocabulary = {k: list(v) for k, v in CANONICAL_SYMPTOMS.items()}
+    words = ["acute", "pain", "left", "right", "upper", "lower", "severe",
+             "swelling", "numbness", "rash", "bleeding", "fever", "cough"]
+
+    phrases = sum(len(v) for v in vocabulary.values())
+    n = 0
+    while phrases < size:
+        variants = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(1, 3))) + f" {n}-{i}"
+            for i in range(min(VARIANTS_PER_SYMPTOM, size - phrases))
+        ]
+        vocabulary[f"synthetic symptom {n}"] = variants
+        phrases += len(variants)
+        n += 1
+    return vocabulary
+
+
+def legacy_match(vocabulary: dict, text: str) -> list:
+    return [
+        canonical
+        for canonical, variants in vocabulary.items()
+        for phrase in variants
+        if phrase in text
+    ]
+
+
+def main():
+    rng = random.Random(7)
+    rows = {}
+
+    for size in VOCAB_SIZES:
+        vocabulary = synthetic_vocabulary(size, rng)
+        all_phrases = sum(vocabulary.values(), [])
+        texts = [
+            f"patient reports {rng.choice(all_phrases)} and {rng.choice(all_phrases)}"
+            for _ in range(ENTITIES)
+        ]
+
+        matcher = SymptomMatcher(vocabulary)
+        for text in texts:
+            assert matcher.match(text) == legacy_match(vocabulary, text), text
+
+        rows[f"loop      {size:>6} phrases"] = time_calls(lambda t: legacy_match(vocabulary, t), texts)
+        rows[f"automaton {size:>6} phrases"] = time_calls(matcher.match, texts)
+
+    print_report("symptom matching per entity", rows)
+
+
+if __name__ == "__main__":
+    main()
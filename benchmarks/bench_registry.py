@@ -0,0 +1,130 @@
+"""
+Hospital registry: bulk CSV/JSON load, id lookup (linear scan vs the id
+index) and memory per facility (objects vs columnar rows, each with its
+bed tracking and spatial index).
+
+    python -m benchmarks.bench_registry
+"""
+import csv
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from app.routing.capabilities import capability_mask
+from app.routing.capacity import CapacityManager
+from app.routing.hospitals import HospitalRegistry
+from app.routing.spatial_index import SpatialIndex
+from benchmarks.bench_spatial import CAPABILITIES, LAT_RANGE, LON_RANGE
+from benchmarks.common import print_report, time_calls
+
+SIZES = [10_000, 100_000]
+QUERIES = 2000
+
+
+class ObjectHospital:
+    # The per-object representation dispatch used to keep
+    def __init__(self, id, name, lat, lon, beds, capabilities):
+        self.id = id
+        self.name = name
+        self.lat = lat
+        self.lon = lon
+        self.beds = beds
+        self.capabilities = capabilities
+
+
+def random_records(n: int, rng: random.Random):
+    return [
+        {
+            "id": f"F{i}",
+            "name": f"Facility {i}",
+            "lat": rng.uniform(*LAT_RANGE),
+            "lon": rng.uniform(*LON_RANGE),
+            "beds": rng.randint(0, 50),
+            "capabilities": rng.sample(CAPABILITIES, rng.randint(1, 3))
+        }
+        for i in range(n)
+    ]
+
+
+def allocated_bytes(build) -> int:
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def build_objects(records):
+    # Objects plus the bed tracking and spatial index the old dispatch
+    # module kept alongside them
+    objects = [ObjectHospital(**record) for record in records]
+    capacity = CapacityManager()
+    for h in objects:
+        capacity.register(h.id, h.beds)
+    index = SpatialIndex((p, h.lat, h.lon, capability_mask(h.capabilities)) for p, h in enumerate(objects))
+    return objects, capacity, index
+
+
+def build_registry(records) -> HospitalRegistry:
+    registry = HospitalRegistry(CapacityManager())
+    registry.load_records(records)
+    return registry
+
+
+def timed_load(load, path) -> float:
+    registry = HospitalRegistry(CapacityManager())
+    start = time.perf_counter()
+    load(registry, path)
+    seconds = time.perf_counter() - start
+    assert len(registry) > 0
+    return seconds
+
+
+def main():
+    rng = random.Random(10)
+    rows = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in SIZES:
+            records = random_records(n, rng)
+
+            json_path = os.path.join(tmp, f"{n}.json")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(records, f)
+
+            csv_path = os.path.join(tmp, f"{n}.csv")
+            with open(csv_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=list(records[0]))
+                writer.writeheader()
+                for record in records:
+                    writer.writerow({**record, "capabilities": ";".join(record["capabilities"])})
+
+            rows[f"{n}: load"] = {
+                "json_s": round(timed_load(HospitalRegistry.load_json, json_path), 3),
+                "csv_s": round(timed_load(HospitalRegistry.load_csv, csv_path), 3)
+            }
+
+            objects = [ObjectHospital(**record) for record in records]
+            registry = build_registry(records)
+
+            ids = [f"F{rng.randrange(n)}" for _ in range(QUERIES)]
+            for hospital_id in ids[:50]:
+                assert registry.get(hospital_id).id == next(h.id for h in objects if h.id == hospital_id)
+
+            rows[f"{n}: linear get"] = time_calls(lambda i: next(h for h in objects if h.id == i), ids[:50])
+            rows[f"{n}: indexed get"] = time_calls(registry.get, ids)
+
+            rows[f"{n}: bytes/facility"] = {
+                "objects": allocated_bytes(lambda: build_objects(records)) // n,
+                "registry": allocated_bytes(lambda: build_registry(records)) // n
+            }
+
+    print_report("hospital registry", rows)
+
+
+if __name__ == "__main__":
+    main()
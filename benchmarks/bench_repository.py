@@ -0,0 +1,87 @@
+"""
+Incident repository: save throughput, lookup latency and /incidents-style
+queries (full listing vs one filtered page vs an incremental "since"
+fetch) for the in-memory store and SQLite.
+
+    python -m benchmarks.bench_repository
+"""
+import os
+import random
+import tempfile
+import time
+
+from app.incident.models import Incident
+from app.incident.repository import IncidentRepository
+from app.incident.sqlite_repository import SQLiteIncidentRepository
+from benchmarks.common import print_report, time_calls
+
+INCIDENTS = 5000
+LOOKUPS = 2000
+URGENCIES = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+
+
+def make_incidents(n: int, rng: random.Random):
+    incidents = []
+    for i in range(n):
+        urgency = rng.choice(URGENCIES)
+        incident = Incident(
+            input_text=f"Caller {i} reports chest pain and sweating",
+            symptoms=["chest pain", "diaphoresis"],
+            triage_result={"urgency": urgency, "dispatch_required": urgency != "LOW", "reasoning": ["benchmark"]},
+            lat=23.25 + rng.uniform(-0.1, 0.1),
+            lon=77.42 + rng.uniform(-0.1, 0.1)
+        )
+        incident.log_event("DISPATCH_RECOMMENDED", {"hospital": "City Trauma Center", "eta_minutes": 12})
+        incidents.append(incident)
+    return incidents
+
+
+def bench(repository, incidents, ids):
+    start = time.perf_counter()
+    for incident in incidents:
+        repository.save(incident)
+    repository.flush()
+    seconds = time.perf_counter() - start
+
+    row = {"saves_per_s": round(len(incidents) / seconds)}
+    row.update(time_calls(repository.get, ids))
+    return row
+
+
+def bench_queries(repository, incidents, rows, name):
+    since = sorted(i.updated_at for i in incidents)[-20]
+    rows[f"{name}: all()"] = time_calls(lambda _: repository.all(), range(5))
+    rows[f"{name}: page of 50"] = time_calls(
+        lambda u: repository.query(urgency=u, limit=50, audit_log=False), URGENCIES * 25
+    )
+    rows[f"{name}: since (20 new)"] = time_calls(lambda _: repository.query(since=since), range(100))
+
+
+def main():
+    rng = random.Random(11)
+    incidents = make_incidents(INCIDENTS, rng)
+    ids = [rng.choice(incidents).id for _ in range(LOOKUPS)]
+
+    memory = IncidentRepository()
+    rows = {"memory": bench(memory, incidents, ids)}
+    bench_queries(memory, incidents, rows, "memory")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, kwargs in [
+            ("sqlite: commit per save", {"commit_interval_ms": 0}),
+            ("sqlite: grouped commits", {"commit_batch": 64, "commit_interval_ms": 50}),
+        ]:
+            repository = SQLiteIncidentRepository(os.path.join(tmp, f"{len(rows)}.db"), **kwargs)
+            rows[name] = bench(repository, incidents, ids)
+            if "grouped" in name:
+                bench_queries(repository, incidents, rows, "sqlite")
+
+            assert len(repository.all()) == INCIDENTS
+            assert repository.get(ids[0]).audit_log.to_list() == next(i for i in incidents if i.id == ids[0]).audit_log.to_list()
+            repository.close()
+
+    print_report("incident repository", rows)
+
+
+if __name__ == "__main__":
+    main()
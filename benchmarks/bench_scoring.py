@@ -0,0 +1,77 @@
+"""
+Surge routing: scalar per-hospital haversine scoring vs the vectorized
+HospitalScorer (M incidents x N hospitals, top-k via argpartition).
+
+    python -m benchmarks.bench_scoring
+"""
+import random
+import time
+
+import numpy as np
+
+from app.routing.capabilities import capability_mask
+from app.routing.scoring import HospitalScorer
+from app.routing.severity_rules import SEVERITY_CAPABILITY_MAP
+from app.utils.geo import haversine
+from benchmarks.bench_spatial import CAPABILITIES, LAT_RANGE, LON_RANGE
+from benchmarks.common import print_report
+
+INCIDENTS = 2000
+HOSPITAL_COUNTS = [1000, 10_000]
+TOP_K = 5
+
+
+def scalar_scores(hospitals, lat, lon, required):
+    scores = []
+    for h in hospitals:
+        if h["beds"] <= 0 or not any(cap in h["capabilities"] for cap in required):
+            scores.append(-np.inf)
+            continue
+        distance = haversine(lat, lon, h["lat"], h["lon"])
+        scores.append((1 / (distance + 1)) * 0.6 + (h["beds"] / 10) * 0.4)
+    return scores
+
+
+def main():
+    rng = random.Random(8)
+    rows = {}
+
+    for n in HOSPITAL_COUNTS:
+        hospitals = [
+            {
+                "lat": rng.uniform(*LAT_RANGE),
+                "lon": rng.uniform(*LON_RANGE),
+                "beds": rng.randint(0, 20),
+                "capabilities": rng.sample(CAPABILITIES, rng.randint(1, 3))
+            }
+            for _ in range(n)
+        ]
+        lats = [rng.uniform(*LAT_RANGE) for _ in range(INCIDENTS)]
+        lons = [rng.uniform(*LON_RANGE) for _ in range(INCIDENTS)]
+        severities = [rng.choice(list(SEVERITY_CAPABILITY_MAP)) for _ in range(INCIDENTS)]
+        required = [SEVERITY_CAPABILITY_MAP[s] for s in severities]
+
+        scalar_m = INCIDENTS // 10  # the scalar path is too slow for the full surge
+        start = time.perf_counter()
+        expected = [scalar_scores(hospitals, lats[i], lons[i], required[i]) for i in range(scalar_m)]
+        scalar_seconds = (time.perf_counter() - start) * INCIDENTS / scalar_m
+
+        start = time.perf_counter()
+        scorer = HospitalScorer.from_hospitals(hospitals)
+        positions, scores = scorer.top_k(lats, lons, [capability_mask(r) for r in required], TOP_K)
+        vector_seconds = time.perf_counter() - start
+
+        full = scorer.scores(lats[:scalar_m], lons[:scalar_m], [capability_mask(r) for r in required[:scalar_m]])
+        assert np.allclose(full, np.array(expected), rtol=1e-9, atol=1e-12)
+        for i in range(scalar_m):
+            best = sorted(expected[i], reverse=True)[:TOP_K]
+            assert np.allclose(scores[i], best, rtol=1e-9, atol=1e-12)
+
+        rows[f"{INCIDENTS} x {n} scalar (est.)"] = {"seconds": round(scalar_seconds, 3)}
+        rows[f"{INCIDENTS} x {n} vectorized top-{TOP_K}"] = {"seconds": round(vector_seconds, 3)}
+
+    print_report("batch hospital scoring", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Simulation engine throughput at 100k synthetic calls across concurrency
+levels, and a check that the outcome only depends on the seed.
+
+    python -m benchmarks.bench_simulation [cases]
+"""
+import sys
+
+from app.simulation.engine import SimulationEngine
+from benchmarks.common import print_report
+
+DEFAULT_CASES = 100_000
+CONCURRENCY = [1, 2, 4]
+
+# Summary fields that must not depend on concurrency or timing
+OUTCOME = ("urgency", "assigned", "unassigned", "beds_exhausted_at_hours", "hospitals", "simulated_hours")
+
+
+def main():
+    cases = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CASES
+    rows = {}
+    outcomes = []
+    for concurrency in CONCURRENCY:
+        *_, summary = SimulationEngine(seed=42, cases=cases, profile="surge", concurrency=concurrency).run()
+        outcomes.append({k: summary[k] for k in OUTCOME})
+        rows[f"concurrency {concurrency}"] = {
+            "wall_s": summary["wall_seconds"],
+            "cases_per_second": summary["cases_per_second"],
+            "analysis_p95_ms": summary["stage_latency"]["analysis"]["p95_ms"],
+            "routing_p95_ms": summary["stage_latency"]["routing"]["p95_ms"]
+        }
+
+    print_report(f"simulation, {cases} cases", rows)
+    print(f"  same outcome for every concurrency: {all(o == outcomes[0] for o in outcomes)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Nearest-hospital lookups: linear haversine scan vs SpatialIndex, at
+state-wide facility counts.
+
+    python -m benchmarks.bench_spatial
+"""
+import random
+import time
+
+from app.routing.capabilities import capability_mask
+from app.routing.spatial_index import SpatialIndex
+from app.utils.geo import haversine
+from benchmarks.common import print_report, time_calls
+
+SIZES = [10_000, 100_000]
+QUERIES = 200
+RADIUS_KM = 10
+CAPABILITIES = ["general", "trauma", "cardiac", "icu", "burns", "pediatric"]
+
+# Roughly the extent of a large Indian state
+LAT_RANGE = (21.0, 26.5)
+LON_RANGE = (74.0, 82.5)
+
+
+def random_facilities(n: int, rng: random.Random):
+    return [
+        (
+            i,
+            rng.uniform(*LAT_RANGE),
+            rng.uniform(*LON_RANGE),
+            capability_mask(rng.sample(CAPABILITIES, rng.randint(1, 3)))
+        )
+        for i in range(n)
+    ]
+
+
+def linear_knn(facilities, lat, lon, k, caps):
+    hits = sorted(
+        (haversine(lat, lon, f_lat, f_lon), key)
+        for key, f_lat, f_lon, f_caps in facilities
+        if not caps or f_caps & caps
+    )
+    return hits[:k]
+
+
+def linear_radius(facilities, lat, lon, radius_km, caps):
+    return sorted(
+        (d, key)
+        for key, f_lat, f_lon, f_caps in facilities
+        if (not caps or f_caps & caps) and (d := haversine(lat, lon, f_lat, f_lon)) <= radius_km
+    )
+
+
+def same_keys(a, b):
+    return [key for _, key in a] == [key for _, key in b]
+
+
+def main():
+    rng = random.Random(3)
+    trauma = capability_mask(["trauma"])
+    rows = {}
+
+    for n in SIZES:
+        facilities = random_facilities(n, rng)
+        queries = [(rng.uniform(*LAT_RANGE), rng.uniform(*LON_RANGE)) for _ in range(QUERIES)]
+
+        start = time.perf_counter()
+        index = SpatialIndex(facilities)
+        build_seconds = time.perf_counter() - start
+
+        for lat, lon in queries[:20]:
+            assert same_keys(index.nearest(lat, lon, 5, trauma), linear_knn(facilities, lat, lon, 5, trauma))
+            assert same_keys(index.within(lat, lon, RADIUS_KM, trauma), linear_radius(facilities, lat, lon, RADIUS_KM, trauma))
+
+        extra = random_facilities(1000, rng)
+        start = time.perf_counter()
+        for key, lat, lon, caps in extra:
+            index.add(n + key, lat, lon, caps)
+        add_us = (time.perf_counter() - start) / len(extra) * 1e6
+
+        rows[f"{n}: build"] = {"seconds": round(build_seconds, 3), "add_us": round(add_us, 2)}
+        rows[f"{n}: linear 1-NN"] = time_calls(lambda q: linear_knn(facilities, q[0], q[1], 1, 0), queries[:20])
+        rows[f"{n}: index 1-NN"] = time_calls(lambda q: index.nearest(q[0], q[1], 1), queries)
+        rows[f"{n}: index 5-NN trauma"] = time_calls(lambda q: index.nearest(q[0], q[1], 5, trauma), queries)
+        rows[f"{n}: index {RADIUS_KM}km trauma"] = time_calls(lambda q: index.within(q[0], q[1], RADIUS_KM, trauma), queries)
+
+    print_report("nearest-facility queries", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Triage rule matching: the previous set/issubset loop against the compiled
+bitmask rules, for the shipped rule tables and for a synthetic table with
+hundreds of rules, plus triage_batch over a re-triaged backlog.
+
+    python -m benchmarks.bench_triage
+"""
+import random
+import time
+
+from app.core.ruleset import rule_store
+from app.triage.compiled_rules import CompiledRules
+from benchmarks.common import print_report, time_calls
+
+SYNTHETIC_RULES = 300
+SYNTHETIC_SYMPTOMS = 150
+BACKLOG = 100_000
+
+
+def legacy_triage(tiers, fallback, symptoms):
+    symptom_set = set(symptoms)
+    for urgency, dispatch_required, rules in tiers:
+        reasons = [r["reason"] for r in rules if r["pattern"].issubset(symptom_set)]
+        if reasons:
+            return {"urgency": urgency, "dispatch_required": dispatch_required, "reasoning": reasons}
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in fallback.items()}
+
+
+def synthetic_tiers(rng: random.Random):
+    symptoms = [f"symptom {i}" for i in range(SYNTHETIC_SYMPTOMS)]
+    tiers = []
+    for urgency, dispatch_required in (("CRITICAL", True), ("HIGH", True), ("MEDIUM", False)):
+        rules = [
+            {"pattern": set(rng.sample(symptoms, rng.randint(1, 3))), "reason": f"{urgency} rule {i}"}
+            for i in range(SYNTHETIC_RULES // 3)
+        ]
+        tiers.append((urgency, dispatch_required, rules))
+    return tiers, symptoms
+
+
+def main():
+    rng = random.Random(11)
+    ruleset = rule_store.current()
+    shipped = ruleset.triage_tables
+    fallback = ruleset.triage.fallback
+
+    tiers, vocabulary = synthetic_tiers(rng)
+    synthetic = CompiledRules(tiers, fallback)
+
+    shipped_inputs = [rng.sample(list(ruleset.triage.symptom_index), rng.randint(0, 3)) for _ in range(1000)]
+    synthetic_inputs = [rng.sample(vocabulary, rng.randint(0, 8)) for _ in range(1000)]
+
+    for symptoms in shipped_inputs:
+        assert ruleset.triage.triage(symptoms) == legacy_triage(shipped, fallback, symptoms)
+    for symptoms in synthetic_inputs:
+        assert synthetic.triage(symptoms) == legacy_triage(tiers, fallback, symptoms)
+
+    # Fresh instances so the first pass is not served from the outcome memo
+    cold_shipped = CompiledRules(shipped, fallback)
+    cold_synthetic = CompiledRules(tiers, fallback)
+
+    print_report("triage() per call", {
+        "legacy, shipped rules": time_calls(lambda s: legacy_triage(shipped, fallback, s), shipped_inputs, warmup=0),
+        "bitmask, shipped rules": time_calls(cold_shipped.triage, shipped_inputs, warmup=0),
+        f"legacy, {SYNTHETIC_RULES} rules": time_calls(lambda s: legacy_triage(tiers, fallback, s), synthetic_inputs, warmup=0),
+        f"bitmask, {SYNTHETIC_RULES} rules": time_calls(cold_synthetic.triage, synthetic_inputs, warmup=0),
+        f"bitmask, {SYNTHETIC_RULES} rules, memoized": time_calls(cold_synthetic.triage, synthetic_inputs, warmup=0),
+    })
+
+    backlog = [rng.sample(vocabulary, rng.randint(0, 8)) for _ in range(BACKLOG)]
+    masks = synthetic.encode(backlog)
+
+    start = time.perf_counter()
+    looped = [legacy_triage(tiers, fallback, symptoms) for symptoms in backlog]
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = synthetic.triage_batch(masks)
+    batch_seconds = time.perf_counter() - start
+
+    assert looped == batched
+
+    print_report(f"re-triage {BACKLOG} incidents, {SYNTHETIC_RULES} rules", {
+        "legacy loop": {"seconds": round(loop_seconds, 3)},
+        "triage_batch": {"seconds": round(batch_seconds, 3)},
+    })
+
+
+if __name__ == "__main__":
+    main()
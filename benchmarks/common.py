@@ -0,0 +1,45 @@
+import statistics
+import time
+from typing import Callable, Dict, Iterable, List
+
+from app.core.stats import percentile
+
+
+def summarize(samples: List[float]) -> Dict:
+    """
+    Latency summary in milliseconds for a list of durations in seconds.
+    """
+    ms = sorted(s * 1000 for s in samples)
+    return {
+        "calls": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 4) if ms else 0.0,
+        "p50_ms": round(percentile(ms, 50), 4),
+        "p95_ms": round(percentile(ms, 95), 4),
+        "p99_ms": round(percentile(ms, 99), 4),
+    }
+
+
+def time_calls(fn: Callable, inputs: Iterable, repeat: int = 1, warmup: int = 1) -> Dict:
+    """
+    Calls fn once per input (repeat times over the inputs) and summarizes
+    the per-call latency.
+    """
+    inputs = list(inputs)
+    for item in inputs[:warmup]:
+        fn(item)
+
+    samples = []
+    for _ in range(repeat):
+        for item in inputs:
+            start = time.perf_counter()
+            fn(item)
+            samples.append(time.perf_counter() - start)
+
+    return summarize(samples)
+
+
+def print_report(title: str, rows: Dict[str, Dict]):
+    print(f"\n{title}")
+    for name, stats in rows.items():
+        fields = "  ".join(f"{k}={v}" for k, v in stats.items())
+        print(f"  {name:<28} {fields}")
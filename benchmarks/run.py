@@ -0,0 +1,216 @@
+"""
+End-to-end benchmark suite: per-stage microbenchmarks of the analyze ->
+triage -> dispatch pipeline, plus an HTTP load test of /analyze and
+/webhooks/sms through an in-process ASGI client.
+
+Inputs are seeded, so runs on the same machine are comparable. Results
+are written as JSON; pass a previous results file as --baseline to
+flag anything that got slower (or lower throughput) by more than
+--threshold. Exits 1 when something regressed.
+
+    python -m benchmarks.run [--quick] [--output FILE] [--baseline FILE] [--threshold 0.2]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict
+
+import httpx
+
+from app.core.cache import symptom_cache
+from app.dispatch.hospitals import find_nearest_hospital
+from app.incident.repository import IncidentRepository
+from app.ingest.ingest_queue import ingest_queue
+from app.main import app
+from app.medical_nlp.extractor import extract_medical_entities
+from app.medical_nlp.normalizer import normalize_entities
+from app.routing.capacity import bed_capacity
+from app.routing.router import recommend_hospitals
+from app.simulation import SIMULATED_CALLS, MockLocation
+from app.triage.triage_engine import triage
+from benchmarks.bench_repository import make_incidents
+from benchmarks.common import print_report, summarize, time_calls
+
+SEED = 18
+CENTER = (23.2599, 77.4126)
+
+# Lower is better for these; higher is better for per_s
+LATENCY_KEYS = ("mean_ms", "p50_ms", "p95_ms", "p99_ms")
+
+
+def transcripts(n: int, rng: random.Random):
+    # Distinct texts, so the symptom cache doesn't turn the run into lookups
+    return [f"{rng.choice(SIMULATED_CALLS)} reported at {i}" for i in range(n)]
+
+
+def locations(n: int, rng: random.Random):
+    return [
+        MockLocation(CENTER[0] + rng.uniform(-0.05, 0.05), CENTER[1] + rng.uniform(-0.05, 0.05))
+        for _ in range(n)
+    ]
+
+
+def stage_benchmarks(n: int, rng: random.Random) -> Dict[str, Dict]:
+    texts = transcripts(n, rng)
+    extractions = [extract_medical_entities(text) for text in texts]
+    symptom_lists = [normalize_entities(e["entities"])["symptoms"] for e in extractions]
+    points = locations(n, rng)
+
+    def recommend(location):
+        # Hold and give back, so every call sees the same free beds
+        for hospital in recommend_hospitals(location, "CRITICAL", commit=False):
+            bed_capacity.release(hospital["reservation_id"])
+
+    repository = IncidentRepository()
+    incidents = make_incidents(n, rng)
+    ids = [incident.id for incident in incidents]
+    for incident in incidents:
+        repository.save(incident)
+
+    return {
+        "stage extract": time_calls(extract_medical_entities, texts),
+        "stage normalize": time_calls(lambda e: normalize_entities(e["entities"]), extractions),
+        "stage triage": time_calls(triage, symptom_lists),
+        "stage recommend_hospitals": time_calls(recommend, points),
+        "stage find_nearest_hospital": time_calls(lambda p: find_nearest_hospital(p.lat, p.lon), points),
+        "stage repository save": time_calls(repository.save, incidents),
+        "stage repository get": time_calls(repository.get, ids)
+    }
+
+
+async def load_test(client: httpx.AsyncClient, requests, concurrency: int) -> Dict:
+    """
+    Sends (method, url, kwargs) requests with at most concurrency in flight.
+    """
+    samples = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(method, url, kwargs):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            samples.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(*request) for request in requests))
+    seconds = time.perf_counter() - start
+
+    return {"per_s": round(len(requests) / seconds, 1), "errors": errors, **summarize(samples)}
+
+
+async def http_benchmarks(n: int, concurrency: int, rng: random.Random) -> Dict[str, Dict]:
+    texts = transcripts(n, rng)
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+
+    ingest_queue.start()
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # One untimed call per endpoint, so model loading isn't measured
+            await client.post("/analyze", json={"text": SIMULATED_CALLS[0]})
+
+            results["http /analyze"] = await load_test(
+                client, [("POST", "/analyze", {"json": {"text": text}}) for text in texts], concurrency
+            )
+
+            # Acknowledgement latency; the transcripts are processed by
+            # the ingest workers afterwards
+            results["http /webhooks/sms"] = await load_test(
+                client,
+                [("POST", "/webhooks/sms", {"data": {"Body": text, "From": f"+1555{i:07d}"}}) for i, text in enumerate(texts)],
+                concurrency
+            )
+    finally:
+        start = time.perf_counter()
+        ingest_queue.stop(timeout=600)
+        # setdefault: if the load test failed, don't hide its error behind a KeyError
+        results.setdefault("http /webhooks/sms", {})["drain_s"] = round(time.perf_counter() - start, 3)
+
+    return results
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> Dict[str, Dict]:
+    """
+    Relative change per metric against the baseline; a metric regresses
+    when it is worse by more than threshold (e.g. 0.2 = 20%).
+    """
+    regressions = {}
+    for name, row in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        for key, value in row.items():
+            before = old.get(key)
+            if not before or key not in LATENCY_KEYS + ("per_s",):
+                continue
+            change = (value - before) / before
+            worse = change > threshold if key in LATENCY_KEYS else change < -threshold
+            if worse:
+                regressions[f"{name} {key}"] = {"baseline": before, "now": value, "change": f"{change:+.0%}"}
+    return regressions
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for a smoke run")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="results file from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    stage_calls, http_calls = (100, 100) if args.quick else (1000, 500)
+    symptom_cache.clear()
+
+    results = stage_benchmarks(stage_calls, random.Random(SEED))
+    results.update(asyncio.run(http_benchmarks(http_calls, args.concurrency, random.Random(SEED))))
+    print_report("end-to-end benchmarks", results)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "quick": args.quick,
+            "concurrency": args.concurrency
+        },
+        "results": results
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print_report(f"regressions vs {args.baseline} (threshold {args.threshold:.0%})", regressions)
+            sys.exit(1)
+        print(f"No regressions vs {args.baseline} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Concurrent bed allocation stress test.
+
+Many threads route incidents through recommend_hospitals against a
+registry with a small number of beds, randomly committing or releasing
+their reservations. Checks that no hospital is ever oversubscribed and
+that the final accounting balances, then reports throughput.
+
+    python -m benchmarks.stress_capacity
+"""
+import random
+import threading
+import time
+
+from app.routing.hospitals import hospital_registry
+from app.routing.capacity import bed_capacity
+from app.routing.router import recommend_hospitals
+from app.simulation import MockLocation
+
+THREADS = 32
+REQUESTS_PER_THREAD = 500
+EXTRA_HOSPITALS = 200
+SEVERITIES = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+
+
+def main():
+    rng = random.Random(4)
+    hospital_registry.load_records(
+        {
+            "id": f"S{i}",
+            "name": f"Stress Hospital {i}",
+            "lat": 23.25 + rng.uniform(-0.3, 0.3),
+            "lon": 77.42 + rng.uniform(-0.3, 0.3),
+            "beds": rng.randint(0, 3),
+            "capabilities": rng.sample(["general", "trauma", "cardiac", "icu"], rng.randint(1, 2))
+        }
+        for i in range(EXTRA_HOSPITALS)
+    )
+
+    total_beds = sum(h.beds for h in hospital_registry)
+    committed = []
+    counts = {"assigned": 0, "rejected": 0, "released": 0}
+    lock = threading.Lock()
+    violations = []
+
+    def worker(seed):
+        local = random.Random(seed)
+        for _ in range(REQUESTS_PER_THREAD):
+            location = MockLocation(23.25 + local.uniform(-0.3, 0.3), 77.42 + local.uniform(-0.3, 0.3))
+            result = recommend_hospitals(location, local.choice(SEVERITIES), commit=False)
+
+            if not result:
+                with lock:
+                    counts["rejected"] += 1
+                continue
+
+            reservation_id = result[0]["reservation_id"]
+            if local.random() < 0.3:
+                bed_capacity.release(reservation_id)
+                with lock:
+                    counts["released"] += 1
+            else:
+                bed_capacity.commit(reservation_id)
+                with lock:
+                    counts["assigned"] += 1
+                    committed.append(reservation_id)
+
+    done = threading.Event()
+
+    def monitor():
+        # Checks the invariant continuously while the workers run
+        while not done.is_set():
+            for hospital_id, beds in bed_capacity.snapshot().items():
+                if beds["free"] < 0 or beds["held"] + beds["committed"] > beds["capacity"]:
+                    violations.append((hospital_id, beds))
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(THREADS)]
+    checker = threading.Thread(target=monitor)
+    checker.start()
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    done.set()
+    checker.join()
+
+    snapshot = bed_capacity.snapshot()
+    assert not violations, violations[:5]
+    assert counts["assigned"] == len(committed) <= total_beds
+    assert sum(b["committed"] for b in snapshot.values()) == len(committed)
+    assert all(b["free"] + b["committed"] + b["held"] == b["capacity"] for b in snapshot.values())
+
+    requests = THREADS * REQUESTS_PER_THREAD
+    print(f"{requests} routing requests on {THREADS} threads in {seconds:.2f}s "
+          f"({requests / seconds:.0f} req/s)")
+    print(f"beds: {total_beds}, assigned: {counts['assigned']}, released: {counts['released']}, "
+          f"no bed: {counts['rejected']}, oversubscribed hospitals: 0")
+
+
+if __name__ == "__main__":
+    main()
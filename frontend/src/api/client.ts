@@ -26,6 +26,17 @@ export interface AnalyzeResponse {
     reasoning: string[];
 }
 
+export interface IncidentQuery {
+    urgency?: string;
+    status?: string;
+    created_after?: string;
+    created_before?: string;
+    since?: string;         // only incidents updated at or after this time
+    cursor?: string;        // X-Next-Cursor from the previous page
+    limit?: number;
+    fields?: (keyof Incident)[];
+}
+
 export const client = axios.create({
     baseURL: API_URL,
     headers: {
@@ -39,8 +50,11 @@ export const api = {
         return response.data;
     },
 
-    getIncidents: async (): Promise<Incident[]> => {
-        const response = await client.get<Incident[]>('/incidents');
+    getIncidents: async (query: IncidentQuery = {}): Promise<Incident[]> => {
+        const { fields, ...params } = query;
+        const response = await client.get<Incident[]>('/incidents', {
+            params: { ...params, fields: fields?.join(',') },
+        });
         return response.data;
     },
 
@@ -68,3 +82,55 @@ export const api = {
         await client.post(`/simulate?cases=${count}`);
     },
 };
+
+// Keeps a local copy of the incident list current: fetch() gets only the
+// incidents created or updated since the previous fetch, apply() merges one
+// pushed from /incidents/stream. Older copies never replace newer ones.
+export interface IncidentSync {
+    fetch: () => Promise<Incident[]>;
+    apply: (incident: Incident) => Incident[];
+}
+
+export const createIncidentSync = (query: IncidentQuery = {}): IncidentSync => {
+    const byId = new Map<string, Incident>();
+    let since: string | undefined;
+
+    const merge = (incident: Incident) => {
+        const current = byId.get(incident.id);
+        if (current && current.updated_at > incident.updated_at) return;
+        byId.set(incident.id, { ...current, ...incident });
+        if (!since || incident.updated_at > since) since = incident.updated_at;
+    };
+
+    return {
+        fetch: async () => {
+            const updates = await api.getIncidents({ ...query, since });
+            updates.forEach(merge);
+            return Array.from(byId.values());
+        },
+        apply: (incident) => {
+            merge(incident);
+            return Array.from(byId.values());
+        },
+    };
+};
+
+// Subscribes to pushed incident changes instead of polling. onChange gets
+// the merged list after each change; onResync runs when the stream
+// (re)connects or the server says this client fell behind, and should
+// catch up with sync.fetch(). Returns an unsubscribe function.
+export const subscribeIncidents = (
+    sync: IncidentSync,
+    onChange: (incidents: Incident[]) => void,
+    onResync: () => void,
+): (() => void) => {
+    const source = new EventSource(`${API_URL}/incidents/stream`);
+    const onIncident = (event: MessageEvent) => onChange(sync.apply(JSON.parse(event.data)));
+
+    source.onopen = onResync;
+    source.addEventListener('resync', onResync);
+    source.addEventListener('incident.created', onIncident);
+    source.addEventListener('incident.updated', onIncident);
+
+    return () => source.close();
+};
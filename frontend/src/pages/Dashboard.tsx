@@ -1,6 +1,6 @@
-import React, { useEffect, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { api } from '../api/client';
+import { api, createIncidentSync, subscribeIncidents } from '../api/client';
 import type { Incident } from '../api/client';
 import { IncidentCard } from '../components/IncidentCard';
 import { LiveMap } from '../components/LiveMap';
@@ -11,12 +11,15 @@ export const Dashboard: React.FC = () => {
     const navigate = useNavigate();
     const [incidents, setIncidents] = useState<Incident[]>([]);
     const [loading, setLoading] = useState(true);
+    const syncIncidents = useRef(createIncidentSync());
+
+    // Sort by creation time desc
+    const showIncidents = (data: Incident[]) =>
+        setIncidents(data.sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime()));
 
     const fetchIncidents = async () => {
         try {
-            const data = await api.getIncidents();
-            // Sort by creation time desc
-            setIncidents(data.sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime()));
+            showIncidents(await syncIncidents.current.fetch());
         } catch (error) {
             console.error("Failed to fetch incidents", error);
         } finally {
@@ -26,8 +29,8 @@ export const Dashboard: React.FC = () => {
 
     useEffect(() => {
         fetchIncidents();
-        const interval = setInterval(fetchIncidents, 5000); // Poll every 5s
-        return () => clearInterval(interval);
+        // Changes are pushed by the server; no polling
+        return subscribeIncidents(syncIncidents.current, showIncidents, fetchIncidents);
     }, []);
 
     return (
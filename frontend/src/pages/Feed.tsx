@@ -1,5 +1,5 @@
-import React, { useEffect, useState } from 'react';
-import { api } from '../api/client';
+import React, { useEffect, useRef, useState } from 'react';
+import { createIncidentSync, subscribeIncidents } from '../api/client';
 import type { Incident } from '../api/client';
 import { Layout } from '../components/layout/Layout';
 import { useNavigate } from 'react-router-dom';
@@ -10,12 +10,18 @@ export const Feed: React.FC = () => {
     // ... existing hook code ...
     const [incidents, setIncidents] = useState<Incident[]>([]);
     const [loading, setLoading] = useState(true);
+    // The feed never shows the audit log, so don't fetch it
+    const syncIncidents = useRef(createIncidentSync({
+        fields: ['id', 'created_at', 'updated_at', 'input_text', 'symptoms', 'urgency', 'dispatch_required', 'dispatch_confirmed', 'status'],
+    }));
     const navigate = useNavigate();
 
+    const showIncidents = (data: Incident[]) =>
+        setIncidents(data.sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime()));
+
     const fetchIncidents = async () => {
         try {
-            const data = await api.getIncidents();
-            setIncidents(data.sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime()));
+            showIncidents(await syncIncidents.current.fetch());
         } catch (error) {
             console.error("Failed to fetch incidents", error);
         } finally {
@@ -25,8 +31,8 @@ export const Feed: React.FC = () => {
 
     useEffect(() => {
         fetchIncidents();
-        const interval = setInterval(fetchIncidents, 5000);
-        return () => clearInterval(interval);
+        // Changes are pushed by the server; no polling
+        return subscribeIncidents(syncIncidents.current, showIncidents, fetchIncidents);
     }, []);
 
     return (
@@ -1,18 +1,18 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { Layout } from '../components/layout/Layout';
 import { LiveMap } from '../components/LiveMap';
-import { api } from '../api/client';
+import { createIncidentSync, subscribeIncidents } from '../api/client';
 import type { Incident } from '../api/client';
 import { Activity } from 'lucide-react';
 
 export const MapPage: React.FC = () => {
     const [incidents, setIncidents] = useState<Incident[]>([]);
     const [loading, setLoading] = useState(true);
+    const syncIncidents = useRef(createIncidentSync());
 
     const fetchIncidents = async () => {
         try {
-            const data = await api.getIncidents();
-            setIncidents(data);
+            setIncidents(await syncIncidents.current.fetch());
         } catch (error) {
             console.error("Failed to fetch incidents", error);
         } finally {
@@ -22,8 +22,8 @@ export const MapPage: React.FC = () => {
 
     useEffect(() => {
         fetchIncidents();
-        const interval = setInterval(fetchIncidents, 5000);
-        return () => clearInterval(interval);
+        // Changes are pushed by the server; no polling
+        return subscribeIncidents(syncIncidents.current, setIncidents, fetchIncidents);
     }, []);
 
     return (
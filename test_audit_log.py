@@ -0,0 +1,120 @@
+import pytest
+
+from app.incident.models import AuditLog, Incident, IncidentStatus, epoch_us, utc_datetime
+from app.incident.sqlite_repository import SQLiteIncidentRepository
+
+
+def _incident() -> Incident:
+    return Incident(
+        input_text="chest pain and sweating",
+        symptoms=["chest pain", "sweating"],
+        triage_result={
+            "urgency": "CRITICAL",
+            "dispatch_required": True,
+            "reasoning": ["Possible MI"],
+            "rule_version": "v1"
+        },
+        lat=23.25,
+        lon=77.42
+    )
+
+
+def test_entries_read_as_dicts():
+    log = AuditLog([(0, "INCIDENT_CREATED", ("HIGH", True, "v1")), (1, "NOTE", {"text": "hi"})])
+
+    assert len(log) == 2
+    assert log[0] == {
+        "timestamp": "1970-01-01T00:00:00",
+        "event": "INCIDENT_CREATED",
+        "details": {"urgency": "HIGH", "dispatch_required": True, "rule_version": "v1"}
+    }
+    assert log[-1]["details"] == {"text": "hi"}
+    assert log[1:] == [log[1]]
+    assert log == log.to_list()
+
+
+def test_timestamps_are_exact():
+    timestamp = 1_700_000_000_123_456
+
+    assert epoch_us(utc_datetime(timestamp)) == timestamp
+
+
+def test_round_trip_through_sqlite(tmp_path):
+    path = str(tmp_path / "incidents.db")
+    repository = SQLiteIncidentRepository(path, commit_interval_ms=0)
+
+    incident = _incident()
+    incident.log_event("DISPATCH_RECOMMENDED", {"hospital": "City Trauma Center", "eta_minutes": 4})
+    repository.save(incident)
+
+    # Only the new event is appended on the next save
+    incident.status = IncidentStatus.DISPATCH_CONFIRMED
+    incident.log_event("DISPATCH_CONFIRMED", {"unit": "ALS-1"})
+    repository.save(incident)
+    repository.close()
+
+    reopened = SQLiteIncidentRepository(path, commit_interval_ms=0)
+    stored = reopened.get(incident.id)
+    reopened.close()
+
+    assert isinstance(stored.audit_log, AuditLog)
+    assert stored.audit_log == incident.audit_log
+    assert [entry["event"] for entry in stored.audit_log] == [
+        "INCIDENT_CREATED", "DISPATCH_RECOMMENDED", "DISPATCH_CONFIRMED"
+    ]
+    assert stored.created_at == incident.created_at
+    assert stored.updated_at == incident.updated_at
+    assert stored.status == IncidentStatus.DISPATCH_CONFIRMED
+    assert stored.urgency == incident.urgency
+
+
+def test_stored_incident_keeps_logging(tmp_path):
+    repository = SQLiteIncidentRepository(str(tmp_path / "incidents.db"), commit_interval_ms=0)
+    incident = _incident()
+    repository.save(incident)
+
+    stored = repository.get(incident.id)
+    stored.log_event("DISPATCH_DENIED", {"reason": "test"})
+    repository.save(stored)
+
+    assert [entry["event"] for entry in repository.get(incident.id).audit_log] == [
+        "INCIDENT_CREATED", "DISPATCH_DENIED"
+    ]
+    repository.close()
+
+
+def test_concurrent_copies_keep_both_events(tmp_path):
+    repository = SQLiteIncidentRepository(str(tmp_path / "incidents.db"), commit_interval_ms=0)
+    incident = _incident()
+    repository.save(incident)
+
+    # Two requests load the same incident and each logs an event
+    first = repository.get(incident.id)
+    second = repository.get(incident.id)
+    first.log_event("DISPATCH_DENIED", {"reason": "duplicate call"})
+    repository.save(first)
+    second.log_event("MANUAL_REVIEW_REQUESTED", {"reason": "caller disconnected"})
+    repository.save(second)
+
+    # Saving again adds nothing
+    repository.save(second)
+
+    assert [entry["event"] for entry in repository.get(incident.id).audit_log] == [
+        "INCIDENT_CREATED", "DISPATCH_DENIED", "MANUAL_REVIEW_REQUESTED"
+    ]
+    repository.close()
+
+
+def test_rolled_back_events_are_saved_again(tmp_path):
+    repository = SQLiteIncidentRepository(str(tmp_path / "incidents.db"), commit_interval_ms=0)
+    incident, bad = _incident(), _incident()
+    repository.save(incident)
+    incident.log_event("NOTE", {"text": "kept"})
+    bad.lat = object()
+
+    with pytest.raises(Exception):
+        repository.save_many([incident, bad])
+    repository.save(incident)
+
+    assert [entry["event"] for entry in repository.get(incident.id).audit_log] == ["INCIDENT_CREATED", "NOTE"]
+    repository.close()
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+from app.api.batch import MAX_LINE_BYTES, _item, _ndjson_items, _ndjson_lines
+
+
+class _Upload:
+    # The part of a Request the parser reads: the body, chunk by chunk
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def stream(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def _collect(agen):
+    async def collect():
+        return [item async for item in agen]
+    return asyncio.run(collect())
+
+
+def _lines(chunks):
+    return _collect(_ndjson_lines(_Upload(chunks)))
+
+
+def test_lines_split_across_chunks():
+    assert _lines([b'{"a"', b': 1}\n{"b": 2}\n', b'{"c"', b": 3}"]) == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+def test_trailing_newline_and_blank_lines():
+    assert _lines([b"one\n\ntwo\n"]) == [b"one", b"", b"two"]
+    assert _lines([]) == []
+
+
+def test_overlong_line_in_one_chunk():
+    long_line = b"x" * (MAX_LINE_BYTES + 1)
+
+    assert _lines([b"short\n" + long_line + b"\nafter\n"]) == [b"short", None, b"after"]
+
+
+def test_overlong_line_across_chunks_is_dropped_early():
+    half = b"x" * (MAX_LINE_BYTES // 2 + 1)
+
+    assert _lines([b"first\n" + half, half, half + b"\nafter"]) == [b"first", None, b"after"]
+
+
+def test_overlong_last_line():
+    assert _lines([b"first\n", b"x" * (MAX_LINE_BYTES + 1)]) == [b"first", None]
+
+
+def test_items_report_errors_by_index():
+    body = [
+        json.dumps({"text": "chest pain", "lat": 23.25, "lon": 77.42}).encode() + b"\n",
+        b"\n",
+        b"not json\n",
+        json.dumps("fever").encode() + b"\n",
+        json.dumps({"text": "cough", "lat": 23.25}).encode() + b"\n",
+        json.dumps({"text": "   "}).encode()
+    ]
+
+    items = _collect(_ndjson_items(_Upload(body)))
+
+    assert items == [
+        (0, {"input_text": "chest pain", "lat": 23.25, "lon": 77.42}),
+        (1, "invalid JSON"),
+        (2, {"input_text": "fever", "lat": None, "lon": None}),
+        (3, "lat and lon must be given together"),
+        (4, "text cannot be empty")
+    ]
+
+
+def test_item_validation():
+    assert isinstance(_item(42), str)
+    assert isinstance(_item({"text": "pain", "lat": 91, "lon": 0}), str)
+    assert isinstance(_item({"lat": 1, "lon": 1}), str)
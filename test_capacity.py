@@ -0,0 +1,102 @@
+import random
+import threading
+
+from app.routing.capacity import CapacityManager
+
+HOSPITALS = {"H1": 3, "H2": 5, "H3": 1}
+
+
+def _manager(timeout: float = 600) -> CapacityManager:
+    capacity = CapacityManager(timeout)
+    for hospital_id, beds in HOSPITALS.items():
+        capacity.register(hospital_id, beds)
+    return capacity
+
+
+def test_reserve_commit_release():
+    capacity = _manager()
+
+    held = capacity.reserve("H3")
+    assert capacity.hospital_of(held) == "H3"
+    assert capacity.reserve("H3") is None
+
+    assert capacity.commit(held)
+    assert capacity.available("H3") == 0
+    assert capacity.release(held)
+    assert capacity.available("H3") == 1
+
+    assert not capacity.release(held)
+    assert not capacity.commit(held)
+    assert capacity.hospital_of(held) is None
+
+
+def test_unknown_reservations():
+    capacity = _manager()
+
+    assert not capacity.commit("nope")
+    assert not capacity.release("H1#nope")
+    assert not capacity.release(None)
+    assert capacity.reserve("H9") is None
+
+
+def test_expired_reservation_frees_bed():
+    capacity = _manager(timeout=-1)
+
+    reservation_id = capacity.reserve("H3")
+
+    assert capacity.available("H3") == 1
+    assert not capacity.commit(reservation_id)
+
+
+def test_concurrent_reservations_never_oversell():
+    capacity = _manager()
+    lock = threading.Lock()
+    occupied = {hospital_id: 0 for hospital_id in HOSPITALS}
+    oversold, failed = [], []
+    start = threading.Barrier(8)
+
+    # Asserts in the workers would not fail the test; failures are collected
+    def worker(seed: int):
+        rng = random.Random(seed)
+        mine = []
+        start.wait()
+        for _ in range(3000):
+            if mine and rng.random() < 0.5:
+                hospital_id, reservation_id = mine.pop(rng.randrange(len(mine)))
+                # Count the bed as free before it is given back
+                with lock:
+                    occupied[hospital_id] -= 1
+                if not capacity.release(reservation_id):
+                    failed.append(reservation_id)
+                continue
+
+            hospital_id = rng.choice(list(HOSPITALS))
+            reservation_id = capacity.reserve(hospital_id)
+            if reservation_id is None:
+                continue
+            with lock:
+                occupied[hospital_id] += 1
+                if occupied[hospital_id] > HOSPITALS[hospital_id]:
+                    oversold.append(hospital_id)
+            if rng.random() < 0.5 and not capacity.commit(reservation_id):
+                failed.append(reservation_id)
+            mine.append((hospital_id, reservation_id))
+
+        for hospital_id, reservation_id in mine:
+            with lock:
+                occupied[hospital_id] -= 1
+            if not capacity.release(reservation_id):
+                failed.append(reservation_id)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert oversold == []
+    assert failed == []
+    snapshot = capacity.snapshot()
+    for hospital_id, beds in HOSPITALS.items():
+        # Everything released: all beds free and nothing left tracked
+        assert snapshot[hospital_id] == {"capacity": beds, "free": beds, "held": 0, "committed": 0}
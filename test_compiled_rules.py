@@ -0,0 +1,69 @@
+import random
+
+from app.core.ruleset import rule_store
+from app.triage.compiled_rules import CompiledRules
+
+FALLBACK = {"urgency": "LOW", "dispatch_required": False, "reasoning": ["No rule matched"]}
+
+
+def _random_rules(rng, symptoms):
+    # (urgency, dispatch_required, rules) in priority order
+    return [
+        (
+            urgency,
+            urgency != "LOW",
+            [
+                {"pattern": set(rng.sample(symptoms, rng.randint(1, 3))), "reason": f"{urgency} rule {n}"}
+                for n in range(rng.randint(20, 30))
+            ]
+        )
+        for urgency in ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+    ]
+
+
+def test_triage_batch_matches_triage():
+    rng = random.Random(5)
+    # More symptoms than fit in one 64-bit word
+    symptoms = [f"symptom {n}" for n in range(150)]
+    rules = CompiledRules(_random_rules(rng, symptoms), FALLBACK)
+    assert rules.words > 1
+
+    # Includes repeated and unknown symptom lists
+    symptom_lists = [rng.sample(symptoms + ["unknown"], rng.randint(0, 12)) for _ in range(300)]
+    symptom_lists += symptom_lists[:20] + [[]]
+
+    batch = rules.triage_batch(rules.encode(symptom_lists))
+
+    assert batch == [rules.triage(s) for s in symptom_lists]
+    assert {result["urgency"] for result in batch} > {"LOW"}
+
+
+def test_triage_batch_matches_subset_rule():
+    rules = CompiledRules(
+        [
+            ("CRITICAL", True, [{"pattern": {"chest pain", "sweating"}, "reason": "Possible MI"}]),
+            ("HIGH", True, [{"pattern": {"chest pain"}, "reason": "Chest pain"}])
+        ],
+        FALLBACK
+    )
+
+    results = rules.triage_batch(rules.encode([["sweating", "chest pain"], ["chest pain"], ["sweating"]]))
+
+    assert [r["urgency"] for r in results] == ["CRITICAL", "HIGH", "LOW"]
+    assert results[0]["reasoning"] == ["Possible MI"]
+    assert results[2]["reasoning"] == FALLBACK["reasoning"]
+
+
+def test_triage_batch_empty():
+    rules = CompiledRules([], FALLBACK)
+
+    assert rules.triage_batch(rules.encode([])) == []
+
+
+def test_current_ruleset_batch_matches_triage():
+    rules = rule_store.current().triage
+    rng = random.Random(6)
+    symptoms = sorted(rules.symptom_index)
+    symptom_lists = [rng.sample(symptoms, rng.randint(0, min(5, len(symptoms)))) for _ in range(200)]
+
+    assert rules.triage_batch(rules.encode(symptom_lists)) == [rules.triage(s) for s in symptom_lists]
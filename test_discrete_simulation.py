@@ -0,0 +1,33 @@
+import pytest
+
+from app.core.config import settings
+from app.simulation.discrete import DiscreteEventSimulation, expected_calls
+
+
+def test_expected_calls_follow_profile():
+    assert expected_calls(24, 10, "constant") == pytest.approx(240)
+    # Surge runs 4x for two hours in every six
+    assert expected_calls(24, 10, "surge") == pytest.approx(480)
+    assert expected_calls(24, 10, "diurnal") == pytest.approx(240)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"units": 0},
+    {"units": settings.SIMULATION_MAX_UNITS + 1},
+    {"hours": settings.SIMULATION_MAX_HOURS, "rate_per_hour": settings.SIMULATION_MAX_CALLS},
+    {"report_hours": settings.SIMULATION_MIN_REPORT_HOURS / 2},
+    {"hours": settings.SIMULATION_MAX_HOURS + 1},
+    {"speed_kmh": 0}
+])
+def test_limits(kwargs):
+    with pytest.raises(ValueError):
+        DiscreteEventSimulation(**kwargs)
+
+
+def test_largest_accepted_run():
+    DiscreteEventSimulation(
+        units=settings.SIMULATION_MAX_UNITS,
+        hours=24,
+        rate_per_hour=settings.SIMULATION_MAX_CALLS / 24,
+        report_hours=settings.SIMULATION_MIN_REPORT_HOURS
+    )
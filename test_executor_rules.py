@@ -0,0 +1,44 @@
+import json
+import os
+from unittest import mock
+
+from app.core import executor
+from app.core.config import settings
+from app.core.ruleset import RuleSetStore
+
+
+def _write(path, version: str, mtime_ns: int):
+    with open(settings.RULES_PATH) as f:
+        data = json.load(f)
+    data["version"] = version
+    with open(path, "w") as f:
+        json.dump(data, f)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_worker_follows_forced_reload_with_same_mtime(tmp_path):
+    path = str(tmp_path / "rules.json")
+    _write(path, "1", 10**18)
+    caller, worker = RuleSetStore(path), RuleSetStore(path)
+
+    # Replaced in place with the mtime kept, then force-reloaded by the caller
+    _write(path, "2", 10**18)
+    assert caller.reload(force=True)
+
+    with mock.patch.object(executor, "rule_store", worker), mock.patch.object(executor, "_reloaded_for", None):
+        assert executor._ruleset(caller.current().version).version == "2"
+
+
+def test_worker_rereads_once_per_caller_version(tmp_path):
+    path = str(tmp_path / "rules.json")
+    _write(path, "1", 10**18)
+    worker = RuleSetStore(path)
+    # The file is already ahead of the caller's version
+    _write(path, "3", 10**18 + 1)
+
+    with mock.patch.object(executor, "rule_store", worker), mock.patch.object(executor, "_reloaded_for", None), \
+            mock.patch.object(worker, "reload", wraps=worker.reload) as reload:
+        for _ in range(3):
+            assert executor._ruleset("2").version == "3"
+
+    assert reload.call_count == 1
@@ -0,0 +1,98 @@
+import pytest
+
+from app.dispatch.fleet import Fleet, UnitStatus
+
+
+@pytest.fixture
+def fleet():
+    fleet = Fleet()
+    fleet.add("ALS-1", "ALS", 23.20, 77.40)
+    fleet.add("BLS-1", "BLS", 23.25, 77.42)
+    fleet.add("BLS-2", "BLS", 23.30, 77.45)
+    return fleet
+
+
+def test_assign_nearest_suitable_unit(fleet):
+    unit, distance_km = fleet.assign("i1", 23.25, 77.42, "HIGH")
+
+    assert unit.id == "BLS-1"
+    assert distance_km == pytest.approx(0, abs=1e-6)
+    assert unit.status == UnitStatus.EN_ROUTE
+    assert unit.incident_id == "i1"
+    assert fleet.unit_for("i1") is unit
+
+
+def test_critical_incidents_only_get_als(fleet):
+    unit, _ = fleet.assign("i1", 23.25, 77.42, "CRITICAL")
+    assert unit.id == "ALS-1"
+
+    # The only ALS unit is busy
+    assert fleet.assign("i2", 23.25, 77.42, "CRITICAL") is None
+
+
+def test_assigned_unit_is_not_assigned_again(fleet):
+    first, _ = fleet.assign("i1", 23.25, 77.42, "LOW")
+    second, _ = fleet.assign("i2", 23.25, 77.42, "LOW")
+    again, _ = fleet.assign("i1", 23.25, 77.42, "LOW")
+
+    assert first.id != second.id
+    assert again is first
+    assert len(fleet.available) == 1
+
+
+def test_release_makes_unit_available_where_it_was(fleet):
+    fleet.assign("i1", 23.25, 77.42, "HIGH", destination=(23.0, 77.0))
+
+    unit = fleet.release("i1")
+
+    assert unit.id == "BLS-1"
+    assert unit.status == UnitStatus.AVAILABLE
+    assert unit.incident_id is None
+    assert (unit.lat, unit.lon) == (23.25, 77.42)
+    assert fleet.unit_for("i1") is None
+    assert fleet.assign("i2", 23.25, 77.42, "HIGH")[0] is unit
+
+
+def test_completed_release_moves_unit_to_destination(fleet):
+    fleet.assign("i1", 23.25, 77.42, "HIGH", destination=(23.0, 77.0))
+
+    unit = fleet.release("i1", completed=True)
+
+    assert (unit.lat, unit.lon) == (23.0, 77.0)
+    assert fleet.available.nearest(23.0, 77.0)[0][1] == unit.id
+
+
+def test_release_without_unit(fleet):
+    assert fleet.release("unknown") is None
+
+
+def test_update_status_moves_forward_only(fleet):
+    unit, _ = fleet.assign("i1", 23.25, 77.42, "HIGH")
+
+    fleet.update_status(unit.id, UnitStatus.ON_SCENE)
+    fleet.update_status(unit.id, UnitStatus.TRANSPORTING)
+    assert unit.status == UnitStatus.TRANSPORTING
+
+    with pytest.raises(ValueError):
+        fleet.update_status(unit.id, UnitStatus.EN_ROUTE)
+    with pytest.raises(ValueError):
+        fleet.update_status("BLS-2", UnitStatus.ON_SCENE)
+    with pytest.raises(KeyError):
+        fleet.update_status("missing", UnitStatus.ON_SCENE)
+
+
+def test_add_rejects_bad_units(fleet):
+    with pytest.raises(ValueError):
+        fleet.add("X-1", "HELICOPTER", 23.0, 77.0)
+    with pytest.raises(ValueError):
+        fleet.add("ALS-1", "ALS", 23.0, 77.0)
+
+
+def test_stats(fleet):
+    fleet.assign("i1", 23.25, 77.42, "CRITICAL")
+
+    stats = fleet.stats()
+
+    assert stats["units"] == 3
+    assert stats["by_type"]["ALS"][UnitStatus.EN_ROUTE.value] == 1
+    assert stats["by_type"]["BLS"][UnitStatus.AVAILABLE.value] == 2
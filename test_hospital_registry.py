@@ -0,0 +1,72 @@
+import pytest
+
+from app.routing.capacity import CapacityManager
+from app.routing.hospitals import DEFAULT_HOSPITALS, HospitalRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = HospitalRegistry(CapacityManager())
+    registry.load_records(DEFAULT_HOSPITALS)
+    return registry
+
+
+def _columns(registry):
+    return [len(c) for c in (
+        registry._ids, registry._names, registry._lats, registry._lons, registry._beds, registry._caps
+    )]
+
+
+def _record(hospital_id, **fields):
+    record = {"id": hospital_id, "name": hospital_id, "lat": 23.3, "lon": 77.5, "beds": 3, "capabilities": "general"}
+    record.update(fields)
+    return record
+
+
+@pytest.mark.parametrize("record", [
+    _record("H9", lat=""),
+    _record("H9", lon="east"),
+    _record("H9", beds=None),
+    _record("H9", lat=123),
+    _record("H9", beds=-1),
+    _record("H9", capabilities=[1, 2]),
+    {"id": "H9", "name": "No location", "beds": 1, "capabilities": []},
+    _record("H1")
+])
+def test_bad_record_leaves_registry_unchanged(registry, record):
+    with pytest.raises(ValueError):
+        registry.add(record)
+
+    assert _columns(registry) == [3] * 6
+    assert [h.id for h in registry] == ["H1", "H2", "H3"]
+    assert len(registry.spatial) == 3
+    assert registry.get("H9") is None
+
+
+def test_load_is_all_or_nothing(registry):
+    records = [_record("H4"), _record("H5"), _record("H6", lat="")]
+
+    with pytest.raises(ValueError):
+        registry.load_records(records)
+
+    assert _columns(registry) == [3] * 6
+    assert registry.get("H4") is None
+    assert len(registry.spatial) == 3
+    assert registry.capacity.available("H4") == 0
+
+
+def test_duplicate_within_one_load(registry):
+    with pytest.raises(ValueError):
+        registry.load_records([_record("H4"), _record("H4")])
+
+    assert len(registry) == 3
+
+
+def test_load_csv_fields(registry):
+    added = registry.load_records([_record("H4", lat="23.31", lon="77.51", beds="5", capabilities="trauma; icu")])
+
+    hospital = registry.get("H4")
+    assert added == 1
+    assert (hospital.lat, hospital.lon, hospital.beds) == (23.31, 77.51, 5)
+    assert hospital.capabilities == ["trauma", "icu"]
+    assert registry.spatial.nearest(23.31, 77.51)[0][1] == hospital.position
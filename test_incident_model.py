@@ -0,0 +1,61 @@
+import json
+
+from app.incident.models import INCIDENT_FIELDS, Incident, IncidentStatus
+
+
+def _incident() -> Incident:
+    return Incident(
+        input_text="chest pain",
+        symptoms=["chest pain"],
+        triage_result={"urgency": "HIGH", "dispatch_required": True, "reasoning": ["Chest pain"]}
+    )
+
+
+def _cached(incident: Incident) -> dict:
+    return json.loads(incident.to_json(INCIDENT_FIELDS, cache=True))
+
+
+def test_cached_json_is_reused():
+    incident = _incident()
+
+    first = incident.to_json(INCIDENT_FIELDS, cache=True)
+
+    assert incident.to_json(INCIDENT_FIELDS, cache=True) is first
+
+
+def test_status_change_refreshes_cached_json():
+    incident = _incident()
+    _cached(incident)
+
+    incident.status = IncidentStatus.COMPLETED
+
+    assert _cached(incident)["status"] == "COMPLETED"
+
+
+def test_service_style_change_refreshes_cached_json():
+    incident = _incident()
+    _cached(incident)
+
+    # Other fields change together with a logged event, as in confirm_dispatch
+    incident.dispatch_decision = {"unit": "ALS-1"}
+    incident.dispatch_confirmed = True
+    incident.log_event("DISPATCH_CONFIRMED", {"unit": "ALS-1"})
+
+    data = _cached(incident)
+    assert (data["dispatch_decision"], data["dispatch_confirmed"]) == ({"unit": "ALS-1"}, True)
+
+
+def test_logged_event_refreshes_cached_json():
+    incident = _incident()
+    _cached(incident)
+
+    incident.log_event("NOTE", {"text": "called back"})
+
+    assert [entry["event"] for entry in _cached(incident)["audit_log"]] == ["INCIDENT_CREATED", "NOTE"]
+
+
+def test_cache_is_per_field_list():
+    incident = _incident()
+    _cached(incident)
+
+    assert json.loads(incident.to_json(["id", "status"], cache=True)) == {"id": incident.id, "status": "TRIAGED"}
@@ -0,0 +1,63 @@
+from unittest import mock
+
+import pytest
+
+from app.dispatch.fleet import fleet
+from app.incident import service
+from app.incident.repository import IncidentRepository
+from app.routing.hospitals import hospital_registry
+
+
+def _records(n: int):
+    return [
+        {
+            "input_text": f"call {i}",
+            "symptoms": ["chest pain"],
+            "triage_result": {"urgency": "HIGH", "dispatch_required": True, "reasoning": ["Chest pain"]},
+            "lat": 23.25,
+            "lon": 77.42
+        }
+        for i in range(n)
+    ]
+
+
+def _free():
+    return sum(h.available_beds for h in hospital_registry), len(fleet.available)
+
+
+class _FailingRepository(IncidentRepository):
+    def save_many(self, incidents):
+        raise RuntimeError("disk full")
+
+
+def test_backfill_holds_nothing():
+    before = _free()
+
+    with mock.patch.object(service, "incident_repository", IncidentRepository()):
+        incidents = service.create_incidents(_records(2))
+
+    assert _free() == before
+    assert all(incident.bed_reservation_id is None for incident in incidents)
+
+
+def test_failed_save_releases_holds():
+    before = _free()
+
+    with mock.patch.object(service, "incident_repository", _FailingRepository()):
+        with pytest.raises(RuntimeError):
+            service.create_incidents(_records(2), hold_resources=True)
+
+    assert _free() == before
+
+
+def test_held_resources_stay_with_saved_incidents():
+    before = _free()
+    repository = IncidentRepository()
+
+    with mock.patch.object(service, "incident_repository", repository):
+        incidents = service.create_incidents(_records(1), hold_resources=True)
+        assert _free() == (before[0] - 1, before[1] - 1)
+
+        service.deny_dispatch(incidents[0].id)
+
+    assert _free() == before
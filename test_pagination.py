@@ -0,0 +1,79 @@
+import pytest
+
+from app.incident.models import Incident
+from app.incident.repository import IncidentRepository, decode_cursor, encode_cursor
+from app.incident.sqlite_repository import SQLiteIncidentRepository
+
+URGENCIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+
+
+def _incident(n: int) -> Incident:
+    return Incident(
+        input_text=f"call {n}",
+        symptoms=[],
+        triage_result={"urgency": URGENCIES[n % len(URGENCIES)], "dispatch_required": False, "reasoning": []}
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path):
+    if request.param == "memory":
+        yield IncidentRepository()
+        return
+
+    repository = SQLiteIncidentRepository(str(tmp_path / "incidents.db"), commit_interval_ms=0)
+    yield repository
+    repository.close()
+
+
+def _pages(repository, limit: int, **filters):
+    # Pages as /incidents serves them: one extra row tells whether there is a next page
+    pages, after = [], None
+    while True:
+        incidents = repository.query(after=after, limit=limit + 1, **filters)
+        pages.append([incident.id for incident in incidents[:limit]])
+        if len(incidents) <= limit:
+            return pages
+        after = decode_cursor(encode_cursor(incidents[limit - 1]))
+
+
+def test_cursor_round_trip():
+    incident = _incident(0)
+
+    assert decode_cursor(encode_cursor(incident)) == (incident.created_at, incident.id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "bm8gc2VwYXJhdG9y"])
+def test_invalid_cursor(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_pages_cover_every_incident_once(repository):
+    incidents = [_incident(n) for n in range(25)]
+    repository.save_many(incidents)
+
+    pages = _pages(repository, limit=7)
+
+    assert [len(page) for page in pages] == [7, 7, 7, 4]
+    assert [i for page in pages for i in page] == [incident.id for incident in repository.query()]
+    assert sorted(i for page in pages for i in page) == sorted(incident.id for incident in incidents)
+
+
+def test_pages_with_filter(repository):
+    repository.save_many([_incident(n) for n in range(25)])
+
+    pages = _pages(repository, limit=3, urgency="HIGH")
+
+    assert [i for page in pages for i in page] == [incident.id for incident in repository.query(urgency="HIGH")]
+    assert sum(len(page) for page in pages) == 6
+
+
+def test_new_incidents_land_on_later_pages(repository):
+    repository.save_many([_incident(n) for n in range(5)])
+    first = repository.query(limit=5)
+    after = decode_cursor(encode_cursor(first[-1]))
+
+    repository.save(_incident(5))
+
+    assert [incident.input_text for incident in repository.query(after=after)] == ["call 5"]
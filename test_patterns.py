@@ -0,0 +1,57 @@
+import random
+
+from app.medical_nlp.patterns import PhraseAutomaton, SeverityScreen, SymptomMatcher
+
+
+def _naive(phrases, text):
+    return {i for i, phrase in enumerate(phrases) if phrase in text}
+
+
+def test_overlapping_phrases():
+    phrases = ["he", "she", "his", "hers", "chest pain", "pain"]
+    automaton = PhraseAutomaton(phrases)
+
+    assert automaton.find_all("ushers") == {0, 1, 3}
+    assert automaton.find_all("sharp chest pain") == {0, 4, 5}
+    assert automaton.find_all("no match") == set()
+
+
+def test_empty_phrase_always_matches():
+    automaton = PhraseAutomaton(["", "cough"])
+
+    assert automaton.find_all("") == {0}
+    assert automaton.find_all("dry cough") == {0, 1}
+
+
+def test_matches_substring_search():
+    rng = random.Random(4)
+    alphabet = "abc "
+    phrases = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(40)]
+    automaton = PhraseAutomaton(phrases)
+
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert automaton.find_all(text) == _naive(phrases, text)
+
+
+def test_symptom_matcher_in_dictionary_order():
+    matcher = SymptomMatcher({
+        "chest pain": ["chest pain", "chest tightness"],
+        "dyspnea": ["shortness of breath", "breathless"]
+    })
+
+    assert matcher.match("breathless with chest tightness and chest pain") == [
+        "chest pain", "chest pain", "dyspnea"
+    ]
+    assert matcher.match("headache") == []
+
+
+def test_severity_screen_most_severe_level():
+    screen = SeverityScreen({
+        "critical": ["Not Breathing", "unconscious"],
+        "moderate": ["fever"]
+    })
+
+    assert screen.levels[screen.level("fever, patient not breathing")] == "critical"
+    assert screen.levels[screen.level("high fever")] == "moderate"
+    assert screen.level("sprained ankle") is None
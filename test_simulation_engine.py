@@ -0,0 +1,68 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from app.core.config import settings
+from app.core.executor import AnalysisBusy, analysis_executor
+from app.simulation import engine
+from app.simulation.engine import SimulationEngine
+
+
+def _fake_symptoms(texts, ruleset=None):
+    return [["chest pain"] for _ in texts]
+
+
+def test_concurrency_is_capped():
+    with pytest.raises(ValueError):
+        SimulationEngine(concurrency=settings.SIMULATION_MAX_CONCURRENCY + 1)
+    with pytest.raises(ValueError):
+        SimulationEngine(concurrency=0)
+
+
+def test_simulations_leave_analysis_slots_for_live_calls():
+    assert engine.SIMULATION_SLOTS < settings.ANALYSIS_MAX_IN_FLIGHT
+
+    running = peak = 0
+    lock = threading.Lock()
+
+    def symptoms(texts, ruleset=None):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return _fake_symptoms(texts)
+
+    def simulate():
+        list(SimulationEngine(cases=500, concurrency=settings.SIMULATION_MAX_CONCURRENCY).run())
+
+    with mock.patch.object(analysis_executor, "symptoms_batch", symptoms):
+        threads = [threading.Thread(target=simulate) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert 1 <= peak <= engine.SIMULATION_SLOTS
+
+
+def test_busy_analysis_ends_with_error_and_summary():
+    calls = 0
+
+    def symptoms(texts, ruleset=None):
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise AnalysisBusy()
+        return _fake_symptoms(texts)
+
+    with mock.patch.object(engine, "BUSY_BACKOFF_SECONDS", 0), \
+            mock.patch.object(analysis_executor, "symptoms_batch", symptoms):
+        lines = list(SimulationEngine(cases=200, concurrency=1).run())
+
+    assert [line["type"] for line in lines] == ["error", "summary"]
+    assert lines[0]["cases"] == lines[1]["cases"] == settings.NLP_BATCH_SIZE
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from app.routing.spatial_index import SpatialIndex
+from app.utils.geo import haversine
+
+
+def _random_point(rng):
+    return 23 + rng.random(), 77 + rng.random(), 1 << rng.randrange(2)
+
+
+def _expected_nearest(points, lat, lon, k, capabilities):
+    return sorted(
+        (haversine(lat, lon, p_lat, p_lon), key)
+        for key, (p_lat, p_lon, caps) in points.items()
+        if caps & capabilities
+    )[:k]
+
+
+def _expected_within(points, lat, lon, radius_km, capabilities):
+    return sorted(
+        key
+        for key, (p_lat, p_lon, caps) in points.items()
+        if caps & capabilities and haversine(lat, lon, p_lat, p_lon) <= radius_km
+    )
+
+
+def test_remove_matches_brute_force():
+    rng = random.Random(1)
+    points = {key: _random_point(rng) for key in range(200)}
+    index = SpatialIndex((key, *point) for key, point in points.items())
+    next_key = len(points)
+
+    for step in range(5000):
+        if rng.random() < 0.5 and points:
+            key = rng.choice(list(points))
+            assert index.remove(key)
+            del points[key]
+        else:
+            points[next_key] = _random_point(rng)
+            index.add(next_key, *points[next_key])
+            next_key += 1
+
+        if step % 50 == 0:
+            lat, lon, capabilities = _random_point(rng)
+            assert len(index) == len(points)
+
+            got = index.nearest(lat, lon, k=5, capabilities=capabilities)
+            expected = _expected_nearest(points, lat, lon, 5, capabilities)
+            assert [d for d, _ in got] == pytest.approx([d for d, _ in expected])
+
+            got = index.within(lat, lon, 20, capabilities=capabilities)
+            assert sorted(key for _, key in got) == _expected_within(points, lat, lon, 20, capabilities)
+
+
+def test_remove_unknown_key():
+    index = SpatialIndex([("a", 23.0, 77.0, 1)])
+
+    assert not index.remove("b")
+    assert index.remove("a")
+    assert not index.remove("a")
+    assert index.nearest(23.0, 77.0) == []
+    assert index.within(23.0, 77.0, 100) == []
+
+
+def test_removed_capability_no_longer_matches():
+    index = SpatialIndex([("als", 23.0, 77.0, 1), ("bls", 23.1, 77.1, 2)])
+
+    index.remove("als")
+
+    assert index.nearest(23.0, 77.0, capabilities=1) == []
+    assert [key for _, key in index.nearest(23.0, 77.0, capabilities=2)] == ["bls"]
+
+
+def test_duplicate_points_removed_one_at_a_time():
+    # Equal coordinates land on split values, on either side of them
+    index = SpatialIndex((key, 23.0, 77.0, 1) for key in range(50))
+
+    for key in range(0, 50, 2):
+        assert index.remove(key)
+
+    assert sorted(key for _, key in index.within(23.0, 77.0, 1)) == list(range(1, 50, 2))